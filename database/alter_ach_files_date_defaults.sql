@@ -0,0 +1,39 @@
+-- ============================================================================
+-- ALTER TABLE: Server-side CREATED_DATE / UPDATED_DATE for ACH_FILES
+-- ============================================================================
+-- The application no longer sends CREATED_DATE on insert or UPDATED_DATE on
+-- update unless the caller supplies an explicit value:
+--   - CREATED_DATE defaults to SYSTIMESTAMP
+--   - TRG_ACH_FILES_UPDATED_DATE stamps UPDATED_DATE on every update that
+--     does not set it explicitly
+--
+-- Must be applied before deploying the matching oracle_service.py change.
+-- TRG_ACH_FILES_AUDIT (AFTER INSERT OR UPDATE) sees the populated values.
+-- ============================================================================
+
+-- Step 1: Default CREATED_DATE on insert
+ALTER TABLE ACH_FILES
+MODIFY CREATED_DATE DEFAULT SYSTIMESTAMP;
+
+-- Step 2: Stamp UPDATED_DATE on update
+CREATE OR REPLACE TRIGGER TRG_ACH_FILES_UPDATED_DATE
+BEFORE UPDATE ON ACH_FILES
+FOR EACH ROW
+BEGIN
+    IF NOT UPDATING('UPDATED_DATE') THEN
+        :NEW.UPDATED_DATE := SYSTIMESTAMP;
+    END IF;
+END;
+/
+
+-- ============================================================================
+-- Verification
+-- ============================================================================
+SELECT column_name, data_default
+FROM user_tab_columns
+WHERE table_name = 'ACH_FILES'
+AND column_name = 'CREATED_DATE';
+
+SELECT trigger_name, trigger_type, triggering_event, status
+FROM user_triggers
+WHERE trigger_name = 'TRG_ACH_FILES_UPDATED_DATE';
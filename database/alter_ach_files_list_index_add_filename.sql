@@ -0,0 +1,23 @@
+-- Extend the ACH_FILES list pagination index with ORIGINAL_FILENAME
+-- The list and count queries exclude files matching 'FEDACHOUT%' or '%.pdf'.
+-- With ORIGINAL_FILENAME as a trailing column of IDX_ACH_FILES_CREATED_DATE_ID
+-- (create_ach_files_created_date_index.sql) that filter is evaluated on the
+-- index entries, so:
+--   - list pages only visit the table for rows that are returned
+--   - COUNT(*) is answered by a fast full scan of the index alone
+-- The leading-wildcard '%.pdf' pattern can never drive an index range scan;
+-- the (CREATED_DATE, FILE_ID) ordering keeps doing that.
+
+DROP INDEX IDX_ACH_FILES_CREATED_DATE_ID;
+
+CREATE INDEX IDX_ACH_FILES_CREATED_DATE_ID ON ACH_FILES(CREATED_DATE DESC, FILE_ID DESC, ORIGINAL_FILENAME);
+
+-- Verify the index columns
+SELECT
+    INDEX_NAME,
+    COLUMN_NAME,
+    COLUMN_POSITION,
+    DESCEND
+FROM USER_IND_COLUMNS
+WHERE INDEX_NAME = 'IDX_ACH_FILES_CREATED_DATE_ID'
+ORDER BY COLUMN_POSITION;
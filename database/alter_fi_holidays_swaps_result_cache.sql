@@ -0,0 +1,21 @@
+-- Enable the server result cache for FI_HOLIDAYS and ACH_ACCOUNT_NUMBER_SWAPS
+-- Both tables are small, read on most requests and rarely written. With
+-- RESULT_CACHE (MODE FORCE) every query that reads only these tables is
+-- eligible for the server result cache without a hint, and Oracle invalidates
+-- the cached results on any DML to the table.
+-- MODE DEFAULT would leave caching to per-query hints, so FORCE is used here.
+-- Requires RESULT_CACHE_MAX_SIZE > 0 (the default on most editions).
+
+ALTER TABLE FI_HOLIDAYS RESULT_CACHE (MODE FORCE);
+
+ALTER TABLE ACH_ACCOUNT_NUMBER_SWAPS RESULT_CACHE (MODE FORCE);
+
+-- Verify the table annotations
+SELECT
+    TABLE_NAME,
+    RESULT_CACHE
+FROM USER_TABLES
+WHERE TABLE_NAME IN ('FI_HOLIDAYS', 'ACH_ACCOUNT_NUMBER_SWAPS');
+
+-- Check the server result cache is enabled
+SELECT DBMS_RESULT_CACHE.STATUS FROM DUAL;
@@ -0,0 +1,27 @@
+-- Add index for SWAP_MEMO searches on ACH_ACCOUNT_NUMBER_SWAPS
+-- The by-memo endpoint filters with UPPER(SWAP_MEMO) LIKE UPPER('%' || memo || '%')
+-- and orders by CREATED_DATE DESC. A leading-wildcard LIKE can never drive a
+-- range scan, so instead this index carries everything the search touches:
+--   - list pages walk the index in CREATED_DATE DESC order, test the memo on
+--     the index entries and stop after the page, visiting the table only for
+--     rows that are returned
+--   - the count query is answered by a fast full scan of the index alone
+-- Substring search semantics are unchanged (an Oracle Text CONTAINS index
+-- would match words, not arbitrary substrings).
+
+CREATE INDEX IDX_ACH_SWAPS_CREATED_MEMO ON ACH_ACCOUNT_NUMBER_SWAPS(CREATED_DATE DESC, UPPER(SWAP_MEMO));
+
+-- Gather statistics so the optimizer picks up the new index
+BEGIN
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'ACH_ACCOUNT_NUMBER_SWAPS', cascade => TRUE);
+END;
+/
+
+-- Verify the index columns
+SELECT
+    INDEX_NAME,
+    COLUMN_POSITION,
+    COLUMN_EXPRESSION
+FROM USER_IND_EXPRESSIONS
+WHERE INDEX_NAME = 'IDX_ACH_SWAPS_CREATED_MEMO'
+ORDER BY COLUMN_POSITION;
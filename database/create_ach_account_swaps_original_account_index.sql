@@ -0,0 +1,37 @@
+-- Add composite index for swap lookups by original account
+-- get_swap_by_original_account filters on ORIGINAL_DFI_ACCOUNT_NUMBER and keeps
+-- only the newest row (ORDER BY CREATED_DATE DESC FETCH FIRST 1 ROWS ONLY).
+-- Without an index every matching row is read and sorted; with it the lookup
+-- is an index range scan in CREATED_DATE DESC order that stops after the first
+-- entry (COUNT STOPKEY / WINDOW NOSORT STOPKEY in the plan). The batched lookup
+-- (ORDER BY ORIGINAL_DFI_ACCOUNT_NUMBER, CREATED_DATE DESC) reads the same
+-- index in order without a sort.
+
+CREATE INDEX IDX_ACH_SWAPS_ORIG_CREATED ON ACH_ACCOUNT_NUMBER_SWAPS(ORIGINAL_DFI_ACCOUNT_NUMBER, CREATED_DATE DESC);
+
+-- Gather statistics so the optimizer picks up the new index
+BEGIN
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'ACH_ACCOUNT_NUMBER_SWAPS', cascade => TRUE);
+END;
+/
+
+-- Verify the index columns
+SELECT
+    INDEX_NAME,
+    COLUMN_NAME,
+    COLUMN_POSITION,
+    DESCEND
+FROM USER_IND_COLUMNS
+WHERE INDEX_NAME = 'IDX_ACH_SWAPS_ORIG_CREATED'
+ORDER BY COLUMN_POSITION;
+
+-- Verify the lookup plan: expect INDEX RANGE SCAN on IDX_ACH_SWAPS_ORIG_CREATED
+-- under a STOPKEY operation, and no SORT ORDER BY
+EXPLAIN PLAN FOR
+SELECT SWAP_ID, ORIGINAL_DFI_ACCOUNT_NUMBER, SWAP_ACCOUNT_NUMBER, SWAP_MEMO
+FROM ACH_ACCOUNT_NUMBER_SWAPS
+WHERE ORIGINAL_DFI_ACCOUNT_NUMBER = :original_dfi_account_number
+ORDER BY CREATED_DATE DESC
+FETCH FIRST 1 ROWS ONLY;
+
+SELECT * FROM TABLE(DBMS_XPLAN.DISPLAY);
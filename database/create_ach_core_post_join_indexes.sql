@@ -0,0 +1,52 @@
+-- Add composite indexes for the Core Post query
+-- get_ach_data_for_core_post_sp_approved joins ACH_ENTRY_DETAIL to ACH_FILES
+-- (FILE_ID), ACH_BATCH_HEADER (FILE_ID, BATCH_NUMBER) and ACH_FILE_HEADER
+-- (FILE_ID), filters on ACH_FILES.PROCESSING_STATUS / CLIENT_ID and an optional
+-- FILE_ID, and orders by ed.FILE_ID, ed.BATCH_NUMBER, ed.ENTRY_DETAIL_ID.
+--   - IDX_ACH_ENTRY_DETAIL_FILE_BATCH matches the ORDER BY, so a single-file run
+--     is an index range scan that returns rows already sorted
+--   - the batch and file header indexes lead with the join keys and carry the
+--     columns the query selects, so those joins never visit the header tables
+--   - IDX_ACH_FILES_STATUS_CLIENT finds the approved files (optionally for one
+--     client) without scanning ACH_FILES
+-- Oracle has no INCLUDE clause; the selected columns are trailing key columns.
+-- Skip any statement whose leading columns are already indexed.
+
+CREATE INDEX IDX_ACH_ENTRY_DETAIL_FILE_BATCH ON ACH_ENTRY_DETAIL(FILE_ID, BATCH_NUMBER, ENTRY_DETAIL_ID);
+
+CREATE INDEX IDX_ACH_BATCH_HEADER_FILE_BATCH ON ACH_BATCH_HEADER(
+    FILE_ID,
+    BATCH_NUMBER,
+    STANDARD_ENTRY_CLASS_CODE,
+    COMPANY_IDENTIFICATION,
+    COMPANY_ENTRY_DESCRIPTION,
+    COMPANY_NAME,
+    ORIGINATING_DFI_ID
+);
+
+CREATE INDEX IDX_ACH_FILE_HEADER_FILE ON ACH_FILE_HEADER(FILE_ID, REFERENCE_CODE);
+
+CREATE INDEX IDX_ACH_FILES_STATUS_CLIENT ON ACH_FILES(PROCESSING_STATUS, CLIENT_ID, FILE_ID);
+
+-- Gather statistics so the optimizer picks up the new indexes
+BEGIN
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'ACH_ENTRY_DETAIL', cascade => TRUE);
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'ACH_BATCH_HEADER', cascade => TRUE);
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'ACH_FILE_HEADER', cascade => TRUE);
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'ACH_FILES', cascade => TRUE);
+END;
+/
+
+-- Verify the index columns
+SELECT
+    INDEX_NAME,
+    COLUMN_NAME,
+    COLUMN_POSITION
+FROM USER_IND_COLUMNS
+WHERE INDEX_NAME IN (
+    'IDX_ACH_ENTRY_DETAIL_FILE_BATCH',
+    'IDX_ACH_BATCH_HEADER_FILE_BATCH',
+    'IDX_ACH_FILE_HEADER_FILE',
+    'IDX_ACH_FILES_STATUS_CLIENT'
+)
+ORDER BY INDEX_NAME, COLUMN_POSITION;
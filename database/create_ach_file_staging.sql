@@ -0,0 +1,26 @@
+-- ============================================================================
+-- CREATE TABLE: ACH_FILE_STAGING (global temporary)
+-- ============================================================================
+-- Staging area for large ACH_FILES.FILE_CONTENTS writes. The application
+-- sends the contents as VARCHAR2 fragments with one array insert, then a
+-- single PL/SQL block appends them to the target CLOB in SEQ order. This
+-- replaces one LOB round-trip per chunk with a handful of array round-trips.
+--
+-- Rows are private to the session and removed on commit.
+-- FRAG stays at 4000 bytes so MAX_STRING_SIZE=EXTENDED is not required.
+-- ============================================================================
+
+CREATE GLOBAL TEMPORARY TABLE ACH_FILE_STAGING (
+    FILE_ID NUMBER NOT NULL,
+    SEQ NUMBER NOT NULL,
+    FRAG VARCHAR2(4000 BYTE)
+) ON COMMIT DELETE ROWS;
+
+CREATE INDEX IDX_ACH_FILE_STAGING_FILE_SEQ ON ACH_FILE_STAGING(FILE_ID, SEQ);
+
+-- ============================================================================
+-- Verification
+-- ============================================================================
+SELECT table_name, temporary, duration
+FROM user_tables
+WHERE table_name = 'ACH_FILE_STAGING';
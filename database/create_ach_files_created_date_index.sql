@@ -0,0 +1,17 @@
+-- Add composite index for ACH_FILES list pagination
+-- The ACH_FILES list query orders by CREATED_DATE DESC, FILE_ID DESC and, for
+-- keyset pagination, seeks past the last (CREATED_DATE, FILE_ID) of the
+-- previous page. This index lets Oracle read each page directly instead of
+-- sorting the table and discarding OFFSET rows.
+
+CREATE INDEX IDX_ACH_FILES_CREATED_DATE_ID ON ACH_FILES(CREATED_DATE DESC, FILE_ID DESC);
+
+-- Verify the index exists
+SELECT
+    INDEX_NAME,
+    COLUMN_NAME,
+    COLUMN_POSITION,
+    DESCEND
+FROM USER_IND_COLUMNS
+WHERE INDEX_NAME = 'IDX_ACH_FILES_CREATED_DATE_ID'
+ORDER BY COLUMN_POSITION;
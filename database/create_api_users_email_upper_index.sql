@@ -0,0 +1,24 @@
+-- Add function-based index on UPPER(EMAIL) to API_USERS
+-- authenticate_user looks users up with WHERE UPPER(EMAIL) = :email_upper.
+-- The plain IDX_API_USERS_EMAIL index on EMAIL cannot serve that predicate,
+-- so every login was a full scan of API_USERS without this index.
+
+CREATE INDEX IDX_API_USERS_EMAIL_UPPER ON API_USERS(UPPER(EMAIL));
+
+-- Gather statistics so the optimizer picks up the new index
+BEGIN
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'API_USERS', cascade => TRUE);
+END;
+/
+
+-- Verify the index exists
+SELECT
+    INDEX_NAME,
+    COLUMN_EXPRESSION
+FROM USER_IND_EXPRESSIONS
+WHERE TABLE_NAME = 'API_USERS';
+
+-- Expected output after running:
+-- INDEX_NAME                 | COLUMN_EXPRESSION
+-- ---------------------------|------------------
+-- IDX_API_USERS_EMAIL_UPPER  | UPPER("EMAIL")
@@ -18,6 +18,7 @@ CREATE TABLE API_USERS (
 -- Create indexes for fast lookups
 CREATE INDEX IDX_API_USERS_USERNAME ON API_USERS(USERNAME);
 CREATE INDEX IDX_API_USERS_EMAIL ON API_USERS(EMAIL);
+CREATE INDEX IDX_API_USERS_EMAIL_UPPER ON API_USERS(UPPER(EMAIL));
 
 -- Add comments for documentation
 COMMENT ON TABLE API_USERS IS 'Stores API user accounts for JWT authentication';
@@ -0,0 +1,25 @@
+-- Add index for FI_HOLIDAYS date lookups
+-- The FI_HOLIDAYS list and count queries filter a year as the half-open range
+-- HOLIDAY_DATE >= :year_start AND HOLIDAY_DATE < :year_end and order by
+-- HOLIDAY_DATE. This index turns the year filter into an index range scan and
+-- returns list pages in HOLIDAY_DATE order without a sort.
+-- Skip this script if HOLIDAY_DATE already leads an index (for example a
+-- unique constraint); the existing index serves the same purpose.
+
+CREATE INDEX IDX_FI_HOLIDAYS_DATE ON FI_HOLIDAYS(HOLIDAY_DATE);
+
+-- Gather statistics so the optimizer picks up the new index
+BEGIN
+    DBMS_STATS.GATHER_TABLE_STATS(ownname => USER, tabname => 'FI_HOLIDAYS', cascade => TRUE);
+END;
+/
+
+-- Verify the index columns
+SELECT
+    INDEX_NAME,
+    COLUMN_NAME,
+    COLUMN_POSITION,
+    DESCEND
+FROM USER_IND_COLUMNS
+WHERE INDEX_NAME = 'IDX_FI_HOLIDAYS_DATE'
+ORDER BY COLUMN_POSITION;
@@ -1,47 +1,39 @@
 """Oracle database service for ACH_FILES_BLOBS table operations."""
 
+import os
+import threading
 import oracledb
 from typing import Optional
 from datetime import datetime
 from loguru import logger
 from .oracle_config import OracleConfig
+from .oracle_common import session_callback
+from .oracle_service import init_thick_mode
 from .ach_file_blobs_models import AchFileBlobCreate, AchFileBlobUpdate, AchFileBlobResponse
 
 
 class AchFileBlobsService:
     """Service for ACH_FILES_BLOBS database operations."""
     
-    def __init__(self, config: OracleConfig):
-        """Initialize ACH_FILES_BLOBS service with configuration."""
+    def __init__(self, config: OracleConfig, shared: bool = False):
+        """Initialize ACH_FILES_BLOBS service with configuration.
+        
+        A shared service (see get_blobs_service) keeps its pool open across ``with``
+        blocks; the pool is only closed by an explicit disconnect().
+        """
         self.config = config
+        self.shared = shared
         self.pool: Optional[oracledb.ConnectionPool] = None
+        self._pool_lock = threading.Lock()
     
     def connect(self) -> None:
         """Establish Oracle connection pool.
         
         Uses the same connection logic as OracleService.
         """
-        import os
         try:
-            # Check if Oracle Instant Client is available (thick mode)
-            oracle_home = os.environ.get('ORACLE_HOME')
-            use_thick_mode = False
-            
-            if oracle_home:
-                try:
-                    oracledb.init_oracle_client(lib_dir=oracle_home)
-                    logger.info(f"Using Oracle thick mode (ORACLE_HOME={oracle_home})")
-                    use_thick_mode = True
-                except Exception as e:
-                    logger.warning(f"Thick mode initialization failed: {e}")
-                    logger.info("Falling back to thin mode")
-                    try:
-                        oracledb.init_oracle_client()
-                        logger.info("Oracle thick mode initialized without lib_dir")
-                        use_thick_mode = True
-                    except Exception as e2:
-                        logger.warning(f"Thick mode fallback failed: {e2}")
-                        logger.info("Using thin mode (no encryption support)")
+            if self.config.use_thick_mode:
+                init_thick_mode(os.environ.get('ORACLE_HOME'))
             else:
                 logger.info("Using Oracle thin mode (no Instant Client required)")
             
@@ -50,9 +42,15 @@ class AchFileBlobsService:
                 'user': self.config.username,
                 'password': self.config.password,
                 'dsn': self.config.dsn,
-                'min': self.config.min_pool_size,
-                'max': self.config.max_pool_size,
-                'increment': self.config.pool_increment
+                'min': self.config.lines_blobs_max_pool_size if self.config.pool_static else min(self.config.min_pool_size, self.config.lines_blobs_max_pool_size),
+                'max': self.config.lines_blobs_max_pool_size,
+                'increment': min(self.config.pool_increment, self.config.lines_blobs_max_pool_size),
+                'getmode': oracledb.POOL_GETMODE_TIMEDWAIT if self.config.pool_wait_timeout > 0 else oracledb.POOL_GETMODE_WAIT,
+                'wait_timeout': self.config.pool_wait_timeout,
+                'max_lifetime_session': self.config.max_lifetime_session,
+                'ping_interval': self.config.ping_interval,
+                'stmtcachesize': self.config.stmt_cache_size,
+                'session_callback': session_callback(self.config)
             }
             
             # Add TLS/SSL configuration if provided
@@ -79,13 +77,17 @@ class AchFileBlobsService:
             logger.info("Oracle connection pool closed")
     
     def __enter__(self):
-        """Context manager entry."""
-        self.connect()
+        """Context manager entry. Creates the pool only if it is not open yet."""
+        if self.pool is None:
+            with self._pool_lock:
+                if self.pool is None:
+                    self.connect()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.disconnect()
+        """Context manager exit. Shared services keep their pool open."""
+        if not self.shared:
+            self.disconnect()
     
     def get_connection(self):
         """Get a connection from the pool."""
@@ -96,8 +98,9 @@ class AchFileBlobsService:
     def create_ach_file_blob(self, ach_file_blob: AchFileBlobCreate) -> int:
         """Create a new ACH_FILES_BLOBS record.
         
-        For large CLOB inserts (>1MB), uses DBMS_LOB to reduce PGA memory usage.
-        This prevents ORA-04036 errors when inserting large file contents.
+        For large CLOB inserts (>500KB), the row is inserted with EMPTY_CLOB() and
+        the contents are written through the returned LOB locator. This prevents
+        ORA-04036 errors when inserting large file contents.
         """
         try:
             with self.get_connection() as conn:
@@ -115,48 +118,39 @@ class AchFileBlobsService:
                 use_lob_insert = file_contents_size > 512 * 1024  # 500KB threshold
                 
                 if use_lob_insert:
-                    # For large CLOBs, insert with empty CLOB first, then write using DBMS_LOB
-                    # Use PL/SQL block to get CLOB locator
-                    insert_plsql = """
-                    DECLARE
-                        v_file_blob_id NUMBER;
-                        v_clob CLOB;
-                    BEGIN
-                        INSERT INTO ACH_FILES_BLOBS (
-                            FILE_ID,
-                            ORIGINAL_FILENAME,
-                            PROCESSING_STATUS,
-                            FILE_CONTENTS,
-                            CREATED_BY_USER,
-                            CREATED_DATE,
-                            CLIENT_ID,
-                            CLIENT_NAME,
-                            FILE_UPLOAD_FOLDER,
-                            FILE_UPLOAD_FILENAME,
-                            MEMO
-                        ) VALUES (
-                            :file_id,
-                            :original_filename,
-                            :processing_status,
-                            EMPTY_CLOB(),
-                            :created_by_user,
-                            CURRENT_TIMESTAMP,
-                            :client_id,
-                            :client_name,
-                            :file_upload_folder,
-                            :file_upload_filename,
-                            :memo
-                        ) RETURNING FILE_BLOB_ID, FILE_CONTENTS INTO v_file_blob_id, v_clob;
-                        
-                        :file_blob_id := v_file_blob_id;
-                        :file_contents_clob := v_clob;
-                    END;
+                    # For large CLOBs, insert with empty CLOB first, then write through the returned locator
+                    insert_sql = """
+                    INSERT INTO ACH_FILES_BLOBS (
+                        FILE_ID,
+                        ORIGINAL_FILENAME,
+                        PROCESSING_STATUS,
+                        FILE_CONTENTS,
+                        CREATED_BY_USER,
+                        CREATED_DATE,
+                        CLIENT_ID,
+                        CLIENT_NAME,
+                        FILE_UPLOAD_FOLDER,
+                        FILE_UPLOAD_FILENAME,
+                        MEMO
+                    ) VALUES (
+                        :file_id,
+                        :original_filename,
+                        :processing_status,
+                        EMPTY_CLOB(),
+                        :created_by_user,
+                        CURRENT_TIMESTAMP,
+                        :client_id,
+                        :client_name,
+                        :file_upload_folder,
+                        :file_upload_filename,
+                        :memo
+                    ) RETURNING FILE_BLOB_ID, FILE_CONTENTS INTO :file_blob_id, :file_contents_clob
                     """
                     
                     # Execute insert with empty CLOB
                     file_blob_id = cursor.var(int)
                     file_contents_clob = cursor.var(oracledb.DB_TYPE_CLOB)
-                    cursor.execute(insert_plsql, {
+                    cursor.execute(insert_sql, {
                         'file_id': ach_file_blob.file_id,
                         'original_filename': ach_file_blob.original_filename,
                         'processing_status': ach_file_blob.processing_status,
@@ -174,23 +168,12 @@ class AchFileBlobsService:
                     clob = file_contents_clob.getvalue()[0]
                     generated_id = file_blob_id.getvalue()[0]
                     
-                    # Write content in 32KB chunks to avoid PGA memory issues
-                    chunk_size = 32767  # Oracle VARCHAR2 max size
-                    file_contents = ach_file_blob.file_contents
-                    offset = 0
-                    total_length = len(file_contents)
-                    
-                    while offset < total_length:
-                        chunk = file_contents[offset:offset + chunk_size]
-                        chunk_length = len(chunk)
-                        cursor.execute(
-                            "BEGIN DBMS_LOB.WRITEAPPEND(:clob, :amount, :buffer); END;",
-                            {'clob': clob, 'amount': chunk_length, 'buffer': chunk}
-                        )
-                        offset += chunk_length
+                    # One LOB write straight into the stored CLOB: the driver streams the
+                    # data, and no temporary LOB or per-chunk PL/SQL call is needed
+                    clob.write(ach_file_blob.file_contents, 1)
                     
                     conn.commit()
-                    logger.info(f"Created ACH_FILES_BLOBS record {generated_id} with large CLOB ({file_contents_size} bytes) using DBMS_LOB")
+                    logger.info(f"Created ACH_FILES_BLOBS record {generated_id} with large CLOB ({len(ach_file_blob.file_contents)} characters) via LOB locator")
                     return generated_id
                 
                 # For small CLOBs, use standard INSERT
@@ -386,3 +369,21 @@ class AchFileBlobsService:
             logger.error(f"Failed to get ACH_FILES_BLOBS record by FILE_ID: {e}")
             raise
 
+
+_shared_service: Optional[AchFileBlobsService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_blobs_service(config: OracleConfig) -> AchFileBlobsService:
+    """Get the process-wide AchFileBlobsService.
+    
+    The service is created on first use and its connection pool is opened
+    once, on the first ``with`` block, and reused until disconnect() is called
+    (normally at application shutdown).
+    """
+    global _shared_service
+    if _shared_service is None:
+        with _shared_service_lock:
+            if _shared_service is None:
+                _shared_service = AchFileBlobsService(config, shared=True)
+    return _shared_service
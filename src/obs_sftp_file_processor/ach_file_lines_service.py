@@ -1,50 +1,41 @@
 """Oracle database service for ACH_FILE_LINES table operations."""
 
 import os
+import threading
 import oracledb
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from loguru import logger
 from .oracle_config import OracleConfig
+from .oracle_common import session_callback, size_fetch_for_page
+from .oracle_service import init_thick_mode
 from .ach_file_lines_models import AchFileLineCreate, AchFileLineUpdate, AchFileLineResponse
 
 
 class AchFileLinesService:
     """Service for ACH_FILE_LINES database operations."""
     
-    def __init__(self, config: OracleConfig):
-        """Initialize ACH_FILE_LINES service with configuration."""
+    def __init__(self, config: OracleConfig, shared: bool = False):
+        """Initialize ACH_FILE_LINES service with configuration.
+        
+        A shared service (see get_lines_service) keeps its pool open across ``with``
+        blocks; the pool is only closed by an explicit disconnect().
+        """
         self.config = config
+        self.shared = shared
         self.pool: Optional[oracledb.ConnectionPool] = None
+        self._pool_lock = threading.Lock()
     
     def connect(self) -> None:
         """Establish Oracle connection pool.
         
         Uses thin mode by default (no Oracle Instant Client required).
-        If ORACLE_HOME is set, will attempt to use thick mode for encryption support.
+        Thick mode (needed for some network encryption setups) is only loaded
+        when config.use_thick_mode is set, from ORACLE_HOME if it is defined.
         """
         try:
-            # Check if Oracle Instant Client is available (thick mode)
-            oracle_home = os.environ.get('ORACLE_HOME')
-            use_thick_mode = False
-            
-            if oracle_home:
-                try:
-                    oracledb.init_oracle_client(lib_dir=oracle_home)
-                    logger.info(f"Using Oracle thick mode (ORACLE_HOME={oracle_home})")
-                    use_thick_mode = True
-                except Exception as e:
-                    logger.warning(f"Thick mode initialization failed: {e}")
-                    logger.info("Falling back to thin mode")
-                    # Try without lib_dir
-                    try:
-                        oracledb.init_oracle_client()
-                        logger.info("Oracle thick mode initialized without lib_dir")
-                        use_thick_mode = True
-                    except Exception as e2:
-                        logger.warning(f"Thick mode fallback failed: {e2}")
-                        logger.info("Using thin mode (no encryption support)")
-                        # Don't raise - continue with thin mode
+            if self.config.use_thick_mode:
+                init_thick_mode(os.environ.get('ORACLE_HOME'))
             else:
                 logger.info("Using Oracle thin mode (no Instant Client required)")
             
@@ -53,9 +44,15 @@ class AchFileLinesService:
                 'user': self.config.username,
                 'password': self.config.password,
                 'dsn': self.config.dsn,
-                'min': self.config.min_pool_size,
-                'max': self.config.max_pool_size,
-                'increment': self.config.pool_increment
+                'min': self.config.lines_blobs_max_pool_size if self.config.pool_static else min(self.config.min_pool_size, self.config.lines_blobs_max_pool_size),
+                'max': self.config.lines_blobs_max_pool_size,
+                'increment': min(self.config.pool_increment, self.config.lines_blobs_max_pool_size),
+                'getmode': oracledb.POOL_GETMODE_TIMEDWAIT if self.config.pool_wait_timeout > 0 else oracledb.POOL_GETMODE_WAIT,
+                'wait_timeout': self.config.pool_wait_timeout,
+                'max_lifetime_session': self.config.max_lifetime_session,
+                'ping_interval': self.config.ping_interval,
+                'stmtcachesize': self.config.stmt_cache_size,
+                'session_callback': session_callback(self.config)
             }
             
             # Add TLS/SSL configuration if provided
@@ -82,13 +79,17 @@ class AchFileLinesService:
             logger.info("Oracle connection pool closed")
     
     def __enter__(self):
-        """Context manager entry."""
-        self.connect()
+        """Context manager entry. Creates the pool only if it is not open yet."""
+        if self.pool is None:
+            with self._pool_lock:
+                if self.pool is None:
+                    self.connect()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.disconnect()
+        """Context manager exit. Shared services keep their pool open."""
+        if not self.shared:
+            self.disconnect()
     
     def get_connection(self):
         """Get a connection from the pool."""
@@ -212,6 +213,7 @@ class AchFileLinesService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                size_fetch_for_page(cursor, limit)
                 
                 select_sql = """
                 SELECT 
@@ -269,3 +271,22 @@ class AchFileLinesService:
         except Exception as e:
             logger.error(f"Failed to get ACH_FILE_LINES count for FILE_ID {file_id}: {e}")
             raise
+
+
+_shared_service: Optional[AchFileLinesService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_lines_service(config: OracleConfig) -> AchFileLinesService:
+    """Get the process-wide AchFileLinesService.
+    
+    The service is created on first use and its connection pool is opened
+    once, on the first ``with`` block, and reused until disconnect() is called
+    (normally at application shutdown).
+    """
+    global _shared_service
+    if _shared_service is None:
+        with _shared_service_lock:
+            if _shared_service is None:
+                _shared_service = AchFileLinesService(config, shared=True)
+    return _shared_service
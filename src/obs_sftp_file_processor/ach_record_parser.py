@@ -26,6 +26,9 @@ class ACHRecordParser:
         - 'addendas': List of AchAddendaCreate
         - 'batch_controls': List of AchBatchControlCreate
         - 'file_controls': List of AchFileControlCreate
+        
+        Every field is sliced from the fixed-width record and converted here,
+        so the record models are built with model_construct (no validation).
         """
         lines = file_content.split('\n')
         records = {
@@ -104,7 +107,7 @@ class ACHRecordParser:
             return None
         
         try:
-            return AchFileHeaderCreate(
+            return AchFileHeaderCreate.model_construct(
                 file_id=0,  # Will be set when inserting
                 record_type_code=line[0:1] if len(line) > 0 else "1",
                 priority_code=line[1:3].strip() if len(line) >= 3 else None,
@@ -134,7 +137,7 @@ class ACHRecordParser:
             batch_number_str = line[87:94].strip() if len(line) >= 94 else "0"
             batch_number = int(batch_number_str) if batch_number_str.isdigit() else 0
             
-            return AchBatchHeaderCreate(
+            return AchBatchHeaderCreate.model_construct(
                 file_id=0,  # Will be set when inserting
                 batch_number=batch_number,
                 record_type_code=line[0:1] if len(line) > 0 else "5",
@@ -175,7 +178,7 @@ class ACHRecordParser:
                 except ValueError:
                     pass
             
-            return AchEntryDetailCreate(
+            return AchEntryDetailCreate.model_construct(
                 file_id=0,  # Will be set when inserting
                 batch_number=batch_number or 0,
                 record_type_code=line[0:1] if len(line) > 0 else "6",
@@ -209,7 +212,7 @@ class ACHRecordParser:
             entry_detail_seq_str = line[87:94].strip() if len(line) >= 94 else None
             entry_detail_seq = int(entry_detail_seq_str) if entry_detail_seq_str and entry_detail_seq_str.isdigit() else None
             
-            return AchAddendaCreate(
+            return AchAddendaCreate.model_construct(
                 file_id=0,  # Will be set when inserting
                 entry_detail_id=None,  # Will be linked later if needed
                 batch_number=batch_number or 0,
@@ -244,7 +247,7 @@ class ACHRecordParser:
             credit_amount = int(credit_amount_str) if credit_amount_str.isdigit() else 0
             credit_decimal = credit_amount / 100.0 if credit_amount > 0 else 0.0
             
-            return AchBatchControlCreate(
+            return AchBatchControlCreate.model_construct(
                 file_id=0,  # Will be set when inserting
                 batch_number=batch_num,
                 record_type_code=line[0:1] if len(line) > 0 else "8",
@@ -288,7 +291,7 @@ class ACHRecordParser:
             credit_amount = int(credit_amount_str) if credit_amount_str.isdigit() else 0
             credit_decimal = credit_amount / 100.0 if credit_amount > 0 else 0.0
             
-            return AchFileControlCreate(
+            return AchFileControlCreate.model_construct(
                 file_id=0,  # Will be set when inserting
                 record_type_code=line[0:1] if len(line) > 0 else "9",
                 batch_count=batch_count,
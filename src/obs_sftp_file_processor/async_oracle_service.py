@@ -0,0 +1,179 @@
+"""Asyncio Oracle database service for creating and reading back ACH_FILES records."""
+
+import oracledb
+from typing import Optional
+from loguru import logger
+from .oracle_config import OracleConfig
+from .oracle_models import AchFileCreate, AchFileResponse
+from .oracle_common import (
+    AchFileRow,
+    APPEND_STAGED_FILE_CONTENTS_PLSQL,
+    INSERT_ACH_FILE_EMPTY_CLOB_SQL,
+    INSERT_ACH_FILE_SQL,
+    INSERT_ACH_FILE_STAGING_SQL,
+    MAX_INLINE_FILE_CONTENTS,
+    SELECT_ACH_FILE_METADATA_SQL,
+    SELECT_ACH_FILE_SQL,
+    ach_file_from_row,
+    ach_file_insert_params,
+    async_session_callback,
+    clob_as_string_handler,
+    needs_lob,
+    size_fetch_for_page,
+    staging_batches,
+)
+
+
+async def _stage_file_contents_async(cursor, file_id: int, text: str) -> None:
+    """Async counterpart of oracle_service._stage_file_contents."""
+    for rows in staging_batches(file_id, text):
+        cursor.setinputsizes(frag=4000)
+        await cursor.executemany(INSERT_ACH_FILE_STAGING_SQL, rows)
+    
+    await cursor.execute(APPEND_STAGED_FILE_CONTENTS_PLSQL, {'file_id': file_id})
+
+
+class AsyncOracleService:
+    """Asyncio mirror of OracleService.create_ach_file and get_ach_file.
+    
+    Uses an oracledb AsyncConnectionPool (thin mode only), so a large upload
+    waiting on the database does not tie up a worker thread.
+    """
+    
+    def __init__(self, config: OracleConfig, shared: bool = False):
+        """Initialize async Oracle service with configuration.
+        
+        A shared service (see get_async_service) keeps its pool open across
+        ``async with`` blocks; the pool is only closed by disconnect().
+        """
+        self.config = config
+        self.shared = shared
+        self.pool: Optional[oracledb.AsyncConnectionPool] = None
+    
+    async def connect(self) -> None:
+        """Establish the async Oracle connection pool."""
+        try:
+            pool_params = {
+                'user': self.config.username,
+                'password': self.config.password,
+                'dsn': self.config.dsn,
+                'min': self.config.async_max_pool_size if self.config.pool_static else min(self.config.min_pool_size, self.config.async_max_pool_size),
+                'max': self.config.async_max_pool_size,
+                'increment': min(self.config.pool_increment, self.config.async_max_pool_size),
+                'getmode': oracledb.POOL_GETMODE_TIMEDWAIT if self.config.pool_wait_timeout > 0 else oracledb.POOL_GETMODE_WAIT,
+                'wait_timeout': self.config.pool_wait_timeout,
+                'max_lifetime_session': self.config.max_lifetime_session,
+                'ping_interval': self.config.ping_interval,
+                'stmtcachesize': self.config.stmt_cache_size,
+                'session_callback': async_session_callback(self.config)
+            }
+            
+            if self.config.config_dir:
+                pool_params['config_dir'] = self.config.config_dir
+            
+            if self.config.wallet_location:
+                pool_params['wallet_location'] = self.config.wallet_location
+            
+            self.pool = oracledb.create_pool_async(**pool_params)
+            logger.info("Oracle async connection pool established successfully")
+        
+        except Exception as e:
+            logger.error(f"Failed to create Oracle async connection pool: {e}")
+            raise
+    
+    async def disconnect(self) -> None:
+        """Close the async Oracle connection pool."""
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+            logger.info("Oracle async connection pool closed")
+    
+    async def __aenter__(self):
+        """Async context manager entry. Creates the pool only if it is not open yet."""
+        if self.pool is None:
+            await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit. Shared services keep their pool open."""
+        if not self.shared:
+            await self.disconnect()
+    
+    async def create_ach_file(self, ach_file: AchFileCreate) -> int:
+        """Create a new ACH_FILES record.
+        
+        Same statements as OracleService.create_ach_file, including the staged
+        write for contents over 500KB; the event loop keeps serving other
+        requests while each staging batch is in flight.
+        """
+        try:
+            async with self.pool.acquire() as conn:
+                with conn.cursor() as cursor:
+                    file_id = cursor.var(int)
+                    params = ach_file_insert_params(ach_file)
+                    params['file_id'] = file_id
+                    if needs_lob(ach_file.file_contents):
+                        del params['file_contents']
+                        await cursor.execute(INSERT_ACH_FILE_EMPTY_CLOB_SQL, params)
+                        generated_id = file_id.getvalue()[0]
+                        
+                        await _stage_file_contents_async(cursor, generated_id, ach_file.file_contents)
+                    else:
+                        await cursor.execute(INSERT_ACH_FILE_SQL, params)
+                        generated_id = file_id.getvalue()[0]
+                    
+                    await conn.commit()
+                    logger.info(f"Created ACH_FILES record with ID: {generated_id}")
+                    return generated_id
+        
+        except Exception as e:
+            logger.error(f"Failed to create ACH_FILES record: {e}")
+            raise
+    
+    async def get_ach_file(self, file_id: int, include_contents: bool = True) -> Optional[AchFileResponse]:
+        """Get an ACH_FILES record by ID (without FILE_CONTENTS if include_contents is False)."""
+        try:
+            async with self.pool.acquire() as conn:
+                with conn.cursor() as cursor:
+                    if not include_contents:
+                        size_fetch_for_page(cursor, 1)
+                        await cursor.execute(SELECT_ACH_FILE_METADATA_SQL, {'file_id': file_id})
+                        cursor.rowfactory = AchFileRow._make
+                        row = await cursor.fetchone()
+                        
+                        if row:
+                            return AchFileResponse.model_construct(file_contents=None, **row._asdict())
+                        return None
+                    
+                    # Single-row fetch: one-row buffers for the inlined CLOB
+                    size_fetch_for_page(cursor, 1)
+                    cursor.outputtypehandler = clob_as_string_handler
+                    
+                    await cursor.execute(SELECT_ACH_FILE_SQL, {
+                        'file_id': file_id,
+                        'max_contents_length': MAX_INLINE_FILE_CONTENTS
+                    })
+                    row = await cursor.fetchone()
+                    
+                    if row:
+                        return ach_file_from_row(row)
+                    return None
+        
+        except Exception as e:
+            logger.error(f"Failed to get ACH_FILES record {file_id}: {e}")
+            raise
+
+
+_shared_async_service: Optional[AsyncOracleService] = None
+
+
+def get_async_service(config: OracleConfig) -> AsyncOracleService:
+    """Get the process-wide AsyncOracleService.
+    
+    The pool is opened on the first ``async with`` block and kept until
+    disconnect() is called (normally at application shutdown).
+    """
+    global _shared_async_service
+    if _shared_async_service is None:
+        _shared_async_service = AsyncOracleService(config, shared=True)
+    return _shared_async_service
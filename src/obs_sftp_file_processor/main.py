@@ -2,9 +2,11 @@
 
 import mimetypes
 from datetime import datetime
+from itertools import chain
 from typing import List, Optional
 from fastapi import FastAPI, HTTPException, Depends
-from fastapi.responses import JSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
@@ -18,13 +20,15 @@ from .models import (
     AchCorePostSpData, AchCorePostSpResponse
 )
 from .sftp_service import SFTPService
-from .oracle_service import OracleService
+from .oracle_service import OracleService, get_service
+from .async_oracle_service import AsyncOracleService, get_async_service
+from .oracle_common import is_large_file_placeholder
 from .oracle_models import AchFileCreate, AchFileUpdate, AchFileResponse, AchFileListResponse, AchFileUpdateByFileIdRequest, AchClientResponse, AchClientListResponse
 from .fi_holidays_models import FiHolidayCreate, FiHolidayUpdate, FiHolidayResponse, FiHolidayListResponse
 from .ach_account_swaps_models import AchAccountSwapCreate, AchAccountSwapUpdate, AchAccountSwapResponse, AchAccountSwapListResponse, SwapLookupResponse
 from .api_users_models import ApiUserCreate, ApiUserUpdate, ApiUserResponse, ApiUserListResponse
-from .ach_file_lines_service import AchFileLinesService
-from .ach_file_blobs_service import AchFileBlobsService
+from .ach_file_lines_service import AchFileLinesService, get_lines_service
+from .ach_file_blobs_service import AchFileBlobsService, get_blobs_service
 from .ach_file_blobs_models import AchFileBlobCreate, AchFileBlobResponse
 from .ach_validator import parse_ach_file_content
 from .file_utils import add_client_id_to_filename
@@ -46,6 +50,10 @@ logger.add(
     format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>"
 )
 
+# Pending files whose contents run_sync_process loads per query; each may be
+# up to MAX_INLINE_FILE_CONTENTS characters
+SYNC_CONTENTS_BATCH_SIZE = 20
+
 # Create FastAPI app
 app = FastAPI(
     title=config.title,
@@ -81,7 +89,7 @@ async def startup_event():
     # Test Oracle connection
     try:
         logger.info("Testing Oracle database connection on startup...")
-        oracle_service = OracleService(config.oracle)
+        oracle_service = get_service(config.oracle)
         with oracle_service:
             # Test connection by getting a simple query
             with oracle_service.get_connection() as conn:
@@ -92,30 +100,47 @@ async def startup_event():
                 logger.info(f"✅ Oracle connection test successful (result: {result[0]})")
                 logger.info(f"   Oracle Home: {config.oracle.host}:{config.oracle.port}/{config.oracle.service_name}")
                 logger.info(f"   Schema: {config.oracle.db_schema}")
+            
+            # Warm the ACH_CLIENTS cache so the first upload does not wait on the query
+            oracle_service.get_active_clients()
     except Exception as e:
         logger.error(f"❌ Oracle connection test failed on startup: {e}")
         logger.warning("Application will continue, but Oracle operations may fail")
         # Don't fail startup - allow app to start even if Oracle is temporarily unavailable
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared Oracle connection pools on application shutdown."""
+    get_service(config.oracle).disconnect()
+    get_lines_service(config.oracle).disconnect()
+    get_blobs_service(config.oracle).disconnect()
+    await get_async_service(config.oracle).disconnect()
+
+
 def get_sftp_service() -> SFTPService:
     """Dependency to get SFTP service instance."""
     return SFTPService(config.sftp)
 
 
 def get_oracle_service() -> OracleService:
-    """Dependency to get Oracle service instance."""
-    return OracleService(config.oracle)
+    """Dependency to get the shared Oracle service instance."""
+    return get_service(config.oracle)
+
+
+def get_async_oracle_service() -> AsyncOracleService:
+    """Dependency to get the shared asyncio Oracle service instance."""
+    return get_async_service(config.oracle)
 
 
 def get_ach_file_lines_service() -> AchFileLinesService:
-    """Dependency to get ACH file lines service instance."""
-    return AchFileLinesService(config.oracle)
+    """Dependency to get the shared ACH file lines service instance."""
+    return get_lines_service(config.oracle)
 
 
 def get_ach_file_blobs_service() -> AchFileBlobsService:
-    """Dependency to get ACH file blobs service instance."""
-    return AchFileBlobsService(config.oracle)
+    """Dependency to get the shared ACH file blobs service instance."""
+    return get_blobs_service(config.oracle)
 
 
 def parse_file_header_record(file_content: str) -> Optional[dict]:
@@ -418,32 +443,17 @@ async def process_sftp_file(
         # Validate client_id exists and get client_name (if not provided in request)
         client_name = request.client_name
         with oracle_service:
-            clients_data = oracle_service.get_active_clients()
-            # Handle both list of dicts (from service) and response object (from endpoint)
-            if isinstance(clients_data, list):
-                # Service returns list of dicts
-                client_ids = [client['client_id'] for client in clients_data]
-                # Find client_name for the given client_id if not provided in request
-                if not client_name:
-                    for client in clients_data:
-                        if client['client_id'] == request.client_id:
-                            client_name = client['client_name']
-                            break
-            else:
-                # Response object with .clients attribute
-                client_ids = [c.client_id for c in clients_data.clients]
-                # Find client_name for the given client_id if not provided in request
-                if not client_name:
-                    for client in clients_data.clients:
-                        if client.client_id == request.client_id:
-                            client_name = client.client_name
-                            break
-            
-            if request.client_id not in client_ids:
+            client = oracle_service.find_active_client(request.client_id)
+            
+            if client is None:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Client ID '{request.client_id}' not found in active clients"
                 )
+            
+            # Use the client_name from ACH_CLIENTS if not provided in request
+            if not client_name:
+                client_name = client['client_name']
         
         # Prepare file paths
         upload_folder = request.file_upload_folder or config.sftp.upload_folder
@@ -821,6 +831,9 @@ async def global_exception_handler(request, exc):
 async def get_ach_files(
     limit: int = 100,
     offset: int = 0,
+    after_created_date: Optional[datetime] = None,
+    after_file_id: Optional[int] = None,
+    include_total: bool = True,
     oracle_service: OracleService = Depends(get_oracle_service)
 ):
     """Get list of ACH_FILES records.
@@ -830,15 +843,27 @@ async def get_ach_files(
     Args:
         limit: Maximum number of records to return (default: 100)
         offset: Number of records to skip (default: 0)
+        after_created_date: created_date of the last record of the previous page (keyset pagination)
+        after_file_id: file_id of the last record of the previous page (keyset pagination)
+        include_total: Also count all matching records (default: True); has_more is
+            always returned, so pagers can pass false and skip the COUNT(*)
     """
+    if (after_created_date is None) != (after_file_id is None):
+        raise HTTPException(
+            status_code=400,
+            detail="after_created_date and after_file_id must be provided together"
+        )
+    
     try:
         with oracle_service:
-            files = oracle_service.get_ach_files(limit=limit, offset=offset)
-            total_count = oracle_service.get_ach_files_count()
+            after = (after_created_date, after_file_id) if after_file_id is not None else None
+            files, has_more = oracle_service.list_ach_files_page(limit=limit, offset=offset, after=after)
+            total_count = oracle_service.get_ach_files_count() if include_total else None
             
             return AchFileListResponse(
                 files=files,
-                total_count=total_count
+                total_count=total_count,
+                has_more=has_more
             )
             
     except Exception as e:
@@ -852,12 +877,17 @@ async def get_ach_files(
 @app.get("/oracle/ach-files/{file_id}", response_model=AchFileResponse)
 async def get_ach_file(
     file_id: int,
+    include_contents: bool = True,
     oracle_service: OracleService = Depends(get_oracle_service)
 ):
-    """Get a specific ACH_FILES record by ID."""
+    """Get a specific ACH_FILES record by ID.
+    
+    Pass include_contents=false to skip FILE_CONTENTS; large files can be
+    streamed from /oracle/ach-files/{file_id}/contents instead.
+    """
     try:
         with oracle_service:
-            ach_file = oracle_service.get_ach_file(file_id)
+            ach_file = oracle_service.get_ach_file(file_id, include_contents=include_contents)
             
             if not ach_file:
                 raise HTTPException(
@@ -877,6 +907,42 @@ async def get_ach_file(
         )
 
 
+@app.get("/oracle/ach-files/{file_id}/contents")
+async def stream_ach_file_contents(
+    file_id: int,
+    oracle_service: OracleService = Depends(get_oracle_service)
+):
+    """Stream FILE_CONTENTS of an ACH_FILES record as plain text.
+    
+    The CLOB is read in chunks while the response is sent, so large files are
+    never fully loaded into memory.
+    """
+    try:
+        with oracle_service:
+            chunks = oracle_service.stream_ach_file_contents(file_id)
+            first_chunk = next(chunks, None)
+            
+            if first_chunk is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"File contents not found for FILE_ID: {file_id}"
+                )
+            
+            return StreamingResponse(
+                chain((first_chunk,), chunks),
+                media_type="text/plain"
+            )
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to stream ACH_FILES contents for FILE_ID {file_id}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to stream file contents: {str(e)}"
+        )
+
+
 @app.get("/oracle/ach-files/{file_id}/download")
 async def download_ach_file_blob(
     file_id: int,
@@ -977,10 +1043,22 @@ async def get_ach_file_blob_by_file_id(
 @app.post("/oracle/ach-files", response_model=AchFileResponse)
 async def create_ach_file(
     ach_file: AchFileCreate,
-    oracle_service: OracleService = Depends(get_oracle_service)
+    oracle_service: OracleService = Depends(get_oracle_service),
+    async_oracle_service: AsyncOracleService = Depends(get_async_oracle_service)
 ):
-    """Create a new ACH_FILES record."""
+    """Create a new ACH_FILES record.
+    
+    Uses the asyncio pool so large uploads do not block the event loop; the
+    asyncio driver is thin mode only, so thick mode keeps the sync service.
+    The sync service's list caches are still reset after an asyncio create.
+    """
     try:
+        if not config.oracle.use_thick_mode:
+            async with async_oracle_service:
+                file_id = await async_oracle_service.create_ach_file(ach_file)
+                oracle_service.invalidate_ach_files_list()
+                return await async_oracle_service.get_ach_file(file_id)
+        
         with oracle_service:
             file_id = oracle_service.create_ach_file(ach_file)
             created_file = oracle_service.get_ach_file(file_id)
@@ -1152,32 +1230,8 @@ async def get_ach_data_for_core_post_sp_approved(
                 offset=offset
             )
             
-            # Convert to response models
-            data = []
-            for record in results:
-                data.append(AchCorePostSpData(
-                    trace_sequence_number=record.get('trace_sequence_number'),
-                    client_id=record.get('client_id'),
-                    origin_agency=record.get('origin_agency'),
-                    origin_sub_account=record.get('origin_sub_account', 0),
-                    ach_class=record.get('ach_class'),
-                    origin_account=record.get('origin_account'),
-                    company_id=record.get('company_id'),
-                    company_entry_description=record.get('company_entry_description'),
-                    receiver_routing_aba=record.get('receiver_routing_aba'),
-                    receiver_account=record.get('receiver_account'),
-                    transaction_code=record.get('transaction_code'),
-                    company_name=record.get('company_name'),
-                    receiver_id=record.get('receiver_id'),
-                    receiver_name=record.get('receiver_name'),
-                    reference_code=record.get('reference_code'),
-                    payment_description=record.get('payment_description'),
-                    amount=record.get('amount'),
-                    entry_detail_id=record.get('entry_detail_id'),
-                    file_id=record.get('file_id'),
-                    batch_number=record.get('batch_number'),
-                    original_filename=record.get('original_filename')
-                ))
+            # Convert to response models; row fields are named after AchCorePostSpData's
+            data = [AchCorePostSpData(**record._asdict()) for record in results]
             
             return AchCorePostSpResponse(
                 success=True,
@@ -1242,16 +1296,12 @@ async def get_fi_holidays(
     """
     try:
         with oracle_service:
-            holidays = oracle_service.get_fi_holidays(
+            holidays, total_count = oracle_service.get_fi_holidays_with_total(
                 limit=limit,
                 offset=offset,
                 is_active=is_active,
                 year=year
             )
-            total_count = oracle_service.get_fi_holidays_count(
-                is_active=is_active,
-                year=year
-            )
             
             return FiHolidayListResponse(
                 holidays=holidays,
@@ -1301,7 +1351,7 @@ async def create_fi_holiday(
 ):
     """Create a new FI_HOLIDAYS record."""
     try:
-        with oracle_service:
+        with oracle_service, oracle_service.batch():
             holiday_id = oracle_service.create_fi_holiday(holiday)
             
             # Get the created record
@@ -1329,7 +1379,7 @@ async def update_fi_holiday(
         holiday: The update data (holiday_date, holiday_name, is_active, etc.)
     """
     try:
-        with oracle_service:
+        with oracle_service, oracle_service.batch():
             success = oracle_service.update_fi_holiday(holiday_id, holiday)
             
             if not success:
@@ -1402,18 +1452,13 @@ async def get_ach_account_swaps(
     """
     try:
         with oracle_service:
-            swaps = oracle_service.get_ach_account_swaps(
+            swaps, total_count = oracle_service.get_ach_account_swaps_with_total(
                 limit=limit,
                 offset=offset,
                 original_dfi_account_number=original_dfi_account_number,
                 swap_account_number=swap_account_number,
                 swap_memo=swap_memo
             )
-            total_count = oracle_service.get_ach_account_swaps_count(
-                original_dfi_account_number=original_dfi_account_number,
-                swap_account_number=swap_account_number,
-                swap_memo=swap_memo
-            )
             
             return AchAccountSwapListResponse(
                 swaps=swaps,
@@ -1497,14 +1542,11 @@ async def get_swaps_by_swap_account(
     """Get all swaps by SWAP_ACCOUNT_NUMBER."""
     try:
         with oracle_service:
-            swaps = oracle_service.get_ach_account_swaps(
+            swaps, total_count = oracle_service.get_ach_account_swaps_with_total(
                 limit=limit,
                 offset=offset,
                 swap_account_number=swap_account_number
             )
-            total_count = oracle_service.get_ach_account_swaps_count(
-                swap_account_number=swap_account_number
-            )
             
             return AchAccountSwapListResponse(
                 swaps=swaps,
@@ -1529,14 +1571,11 @@ async def get_swaps_by_memo(
     """Get all swaps by SWAP_MEMO (partial match, case-insensitive)."""
     try:
         with oracle_service:
-            swaps = oracle_service.get_ach_account_swaps(
+            swaps, total_count = oracle_service.get_ach_account_swaps_with_total(
                 limit=limit,
                 offset=offset,
                 swap_memo=swap_memo
             )
-            total_count = oracle_service.get_ach_account_swaps_count(
-                swap_memo=swap_memo
-            )
             
             return AchAccountSwapListResponse(
                 swaps=swaps,
@@ -1561,14 +1600,11 @@ async def get_all_swaps_by_original_account(
     """Get all swaps by ORIGINAL_DFI_ACCOUNT_NUMBER."""
     try:
         with oracle_service:
-            swaps = oracle_service.get_ach_account_swaps(
+            swaps, total_count = oracle_service.get_ach_account_swaps_with_total(
                 limit=limit,
                 offset=offset,
                 original_dfi_account_number=original_dfi_account_number
             )
-            total_count = oracle_service.get_ach_account_swaps_count(
-                original_dfi_account_number=original_dfi_account_number
-            )
             
             return AchAccountSwapListResponse(
                 swaps=swaps,
@@ -1590,7 +1626,7 @@ async def create_ach_account_swap(
 ):
     """Create a new ACH_ACCOUNT_NUMBER_SWAPS record."""
     try:
-        with oracle_service:
+        with oracle_service, oracle_service.batch():
             swap_id = oracle_service.create_ach_account_swap(swap)
             
             # Get the created record
@@ -1618,7 +1654,7 @@ async def update_ach_account_swap(
         swap: The update data
     """
     try:
-        with oracle_service:
+        with oracle_service, oracle_service.batch():
             success = oracle_service.update_ach_account_swap(swap_id, swap)
             
             if not success:
@@ -1851,9 +1887,11 @@ async def oracle_auth(
                 detail=f"Rate limit exceeded. Maximum 15 requests per minute per email. Please try again later."
             )
         
-        # Authenticate user with bcrypt password verification
+        # Authenticate user with bcrypt password verification. The bcrypt check is
+        # hundreds of ms of CPU, so it runs in the threadpool instead of blocking the event loop
         with oracle_service:
-            auth_result = oracle_service.authenticate_user(
+            auth_result = await run_in_threadpool(
+                oracle_service.authenticate_user,
                 email=request.email,
                 password=request.password  # Plain password - bcrypt handles securely
             )
@@ -2218,17 +2256,42 @@ async def run_sync_process(
         # Step 2: Process ACH File Lines
         with oracle_service, ach_file_lines_service:
             # Get all files with status 'Pending'
-            all_files = oracle_service.get_ach_files(limit=1000)
+            # List metadata only; contents are loaded below for the pending ones
+            all_files = oracle_service.list_ach_files(limit=1000)
             pending_files = [f for f in all_files if f.processing_status == 'Pending']
             
             logger.info(f"Found {len(pending_files)} files with status 'Pending'")
             
-            for ach_file in pending_files:
+            full_files = {}
+            for index, ach_file in enumerate(pending_files):
+                if index % SYNC_CONTENTS_BATCH_SIZE == 0:
+                    # Load contents a bounded batch of files per query
+                    batch_ids = [f.file_id for f in pending_files[index:index + SYNC_CONTENTS_BATCH_SIZE]]
+                    try:
+                        full_files = {f.file_id: f for f in oracle_service.get_ach_files_by_ids(batch_ids)}
+                    except Exception as e:
+                        logger.error(f"Failed to load contents of ACH_FILES {batch_ids}: {e}")
+                        full_files = {}
+                
                 try:
                     logger.info(f"Processing file: {ach_file.original_filename} (ID: {ach_file.file_id})")
                     
+                    full_file = full_files.pop(ach_file.file_id, None)
+                    file_contents = full_file.file_contents if full_file else None
+                    if is_large_file_placeholder(file_contents):
+                        # Over the inline limit, so read the CLOB through its locator
+                        file_contents = "".join(oracle_service.stream_ach_file_contents(ach_file.file_id))
+                    
+                    if not file_contents:
+                        # Deleted since it was listed, stored without contents, or its batch failed to load
+                        error_msg = f"Skipped file {ach_file.original_filename} (ID: {ach_file.file_id}): contents could not be loaded"
+                        logger.error(error_msg)
+                        results['line_results']['errors'].append(error_msg)
+                        results['line_results']['files_with_errors'] += 1
+                        continue
+                    
                     # Parse and validate ACH file content
-                    line_validations = parse_ach_file_content(ach_file.file_contents)
+                    line_validations = parse_ach_file_content(file_contents)
                     
                     # Delete existing lines for this file
                     deleted_count = ach_file_lines_service.delete_lines_by_file_id(ach_file.file_id)
@@ -1,10 +1,15 @@
 """Oracle database configuration."""
 
+import re
 from typing import Optional
-from pydantic import Field, ConfigDict
+from pydantic import Field, ConfigDict, field_validator
 from pydantic_settings import BaseSettings
 
 
+# Unquoted Oracle identifier; db_schema is interpolated into SQL text
+_SCHEMA_NAME_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9_$#]{0,127}$")
+
+
 class OracleConfig(BaseSettings):
     """Oracle database connection configuration."""
     
@@ -16,9 +21,28 @@ class OracleConfig(BaseSettings):
     db_schema: str = Field("ACHOWNER", description="Oracle schema name", validation_alias="schema")
     
     # Connection pool settings
-    min_pool_size: int = Field(1, description="Minimum connection pool size")
-    max_pool_size: int = Field(10, description="Maximum connection pool size")
-    pool_increment: int = Field(1, description="Pool increment size")
+    min_pool_size: int = Field(4, description="Minimum connection pool size")
+    max_pool_size: int = Field(20, description="Maximum size of the main OracleService pool; every worker process opens its own pools")
+    pool_increment: int = Field(2, description="Pool increment size")
+    pool_static: bool = Field(False, description="Open max_pool_size sessions up front (min = max) for steady-state workloads")
+    async_max_pool_size: int = Field(4, description="Maximum asyncio pool size; this pool only serves ACH_FILES creates, so it stays small next to the main pool")
+    lines_blobs_max_pool_size: int = Field(4, description="Maximum size of each of the ACH_FILE_LINES and ACH_FILES_BLOBS service pools")
+    ping_interval: int = Field(60, description="Seconds a pooled session may sit idle before it is pinged on acquire (negative disables the ping)")
+    pool_wait_timeout: int = Field(30000, description="Milliseconds to wait for a free pooled session before failing (0 waits indefinitely)")
+    max_lifetime_session: int = Field(3600, description="Seconds a pooled session may live before it is replaced (0 means no limit)")
+    stmt_cache_size: int = Field(100, description="Statement cache size per pooled connection (room for every distinct statement the services send)")
+    fetch_array_size: int = Field(1000, description="Rows fetched per round-trip by queries without a page size (ACH_CLIENTS, Core Post data)")
+    client_identifier: str = Field("obs-sftp-file-processor", description="CLIENT_IDENTIFIER set on every pooled session for DB-side tracing")
+    
+    # Cache settings
+    clients_cache_ttl: int = Field(60, description="Seconds to cache the active ACH_CLIENTS list (0 disables caching)")
+    file_cache_ttl: int = Field(0, description="Seconds to cache get_ach_file results per FILE_ID; records over 256K characters are never cached (0 disables caching)")
+    file_cache_size: int = Field(32, description="Maximum number of ACH_FILES records kept in the get_ach_file cache")
+    count_cache_ttl: int = Field(10, description="Seconds to cache the ACH_FILES list count (0 disables caching)")
+    swap_cache_ttl: int = Field(0, description="Seconds to cache get_swap_by_original_account results per account (0 disables caching)")
+    swap_cache_size: int = Field(10000, description="Maximum number of accounts kept in the get_swap_by_original_account cache")
+    core_post_cache_ttl: int = Field(0, description="Seconds to cache Core Post data per (file_id, client_id, limit, offset) (0 disables caching)")
+    auth_cache_ttl: int = Field(60, description="Seconds a verified login skips bcrypt while the stored hash is unchanged; IS_ACTIVE is still checked (0 disables caching)")
     
     # Connection settings
     connect_timeout: int = Field(30, description="Connection timeout in seconds")
@@ -27,12 +51,21 @@ class OracleConfig(BaseSettings):
     # TLS/SSL Configuration (optional)
     config_dir: Optional[str] = Field(None, description="Directory containing sqlnet.ora and tnsnames.ora (e.g., $ORACLE_HOME/network/admin)")
     wallet_location: Optional[str] = Field(None, description="Path to Oracle wallet for SSL/TLS authentication")
+    use_thick_mode: bool = Field(False, description="Load Oracle Instant Client (from ORACLE_HOME if set) instead of the default thin mode")
     
     model_config = ConfigDict(
         env_prefix = "ORACLE_",
         case_sensitive = False
     )
     
+    @field_validator("db_schema")
+    @classmethod
+    def validate_db_schema(cls, value: str) -> str:
+        """Only allow plain Oracle identifiers since the schema is embedded in SQL."""
+        if not _SCHEMA_NAME_PATTERN.match(value):
+            raise ValueError(f"Invalid Oracle schema name: {value!r}")
+        return value
+    
     @property
     def connection_string(self) -> str:
         """Get Oracle connection string."""
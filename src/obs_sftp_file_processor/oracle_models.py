@@ -70,11 +70,32 @@ class AchFileResponse(BaseModel):
         from_attributes = True
 
 
+class AchFileSummary(BaseModel):
+    """Metadata-only ACH_FILES model for list responses (no FILE_CONTENTS)."""
+    
+    file_id: int
+    original_filename: str
+    processing_status: str
+    created_by_user: str
+    created_date: datetime
+    updated_by_user: Optional[str] = None
+    updated_date: Optional[datetime] = None
+    client_id: Optional[str] = None
+    client_name: Optional[str] = None
+    file_upload_folder: Optional[str] = None
+    file_upload_filename: Optional[str] = None
+    memo: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
+
 class AchFileListResponse(BaseModel):
     """Response model for ACH_FILES list."""
     
-    files: list[AchFileResponse]
-    total_count: int
+    files: list[AchFileSummary]
+    total_count: Optional[int] = None
+    has_more: bool = False
 
 
 class AchFileUpdateByFileIdRequest(BaseModel):
@@ -1,13 +1,55 @@
 """Oracle database service for ACH_FILES table operations."""
 
+import hashlib
+import hmac
 import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager, nullcontext
+from itertools import combinations
 import oracledb
-from typing import List, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from loguru import logger
 import bcrypt
 from .oracle_config import OracleConfig
-from .oracle_models import AchFileCreate, AchFileUpdate, AchFileResponse
+from .oracle_common import (
+    APPEND_STAGED_FILE_CONTENTS_PLSQL,
+    AchFileRow,
+    COUNT_ACH_FILES_SQL,
+    DELETE_ACH_FILE_SQL,
+    EMPTY_ACH_FILE_CONTENTS_NOW_SQL,
+    EMPTY_ACH_FILE_CONTENTS_SQL,
+    INSERT_ACH_FILE_EMPTY_CLOB_LOCATOR_SQL,
+    INSERT_ACH_FILE_EMPTY_CLOB_SQL,
+    INSERT_ACH_FILE_SQL,
+    INSERT_ACH_FILE_STAGING_SQL,
+    MAX_INLINE_FILE_CONTENTS,
+    MAX_VARCHAR_BIND_BYTES,
+    RESET_ACH_FILE_CLOB_NOW_SQL,
+    RESET_ACH_FILE_CLOB_SQL,
+    SELECT_ACH_FILES_AFTER_SQL,
+    SELECT_ACH_FILES_BY_IDS_SQL,
+    SELECT_ACH_FILES_SQL,
+    SELECT_ACH_FILE_CLOB_SQL,
+    SELECT_ACH_FILE_METADATA_SQL,
+    SELECT_ACH_FILE_SQL,
+    SELECT_ALL_ACH_FILES_SQL,
+    SELECT_AUDIT_ACH_FILES_SQL,
+    UPDATE_ACH_FILE_CONTENTS_NOW_SQL,
+    UPDATE_ACH_FILE_CONTENTS_SQL,
+    UPDATE_ACH_FILE_RESET_CLOB_SQL,
+    UPDATE_ACH_FILE_SQL,
+    ach_file_from_row,
+    ach_file_insert_params,
+    clob_as_string_handler,
+    needs_lob,
+    session_callback,
+    size_fetch_for_page,
+    staging_batches
+)
+from .oracle_models import AchFileCreate, AchFileUpdate, AchFileResponse, AchFileSummary
 from .fi_holidays_models import FiHolidayCreate, FiHolidayUpdate, FiHolidayResponse
 from .ach_account_swaps_models import AchAccountSwapCreate, AchAccountSwapUpdate, AchAccountSwapResponse, SwapLookupResponse
 from .api_users_models import ApiUserCreate, ApiUserUpdate, ApiUserResponse
@@ -21,42 +63,790 @@ from .ach_record_models import (
 )
 
 
+# ACH record tables filled by parse_and_insert_ach_records; each insert returns
+# the generated key so no SEQ_*.CURRVAL query is needed. Values are bound by
+# position, so placeholder order must match the _ach_*_params tuples.
+_INSERT_ACH_FILE_HEADER_SQL = """
+INSERT INTO ACH_FILE_HEADER (
+    FILE_HEADER_ID, FILE_ID, RECORD_TYPE_CODE, PRIORITY_CODE,
+    IMMEDIATE_DESTINATION, IMMEDIATE_ORIGIN, FILE_CREATION_DATE,
+    FILE_CREATION_TIME, FILE_ID_MODIFIER, RECORD_SIZE,
+    BLOCKING_FACTOR, FORMAT_CODE, IMMEDIATE_DEST_NAME,
+    IMMEDIATE_ORIGIN_NAME, REFERENCE_CODE, RAW_RECORD
+) VALUES (
+    SEQ_FILE_HEADER.NEXTVAL, :file_id, :record_type_code, :priority_code,
+    :immediate_destination, :immediate_origin, :file_creation_date,
+    :file_creation_time, :file_id_modifier, :record_size,
+    :blocking_factor, :format_code, :immediate_dest_name,
+    :immediate_origin_name, :reference_code, :raw_record
+) RETURNING FILE_HEADER_ID INTO :file_header_id
+"""
+
+_INSERT_ACH_BATCH_HEADER_SQL = """
+INSERT INTO ACH_BATCH_HEADER (
+    BATCH_HEADER_ID, FILE_ID, BATCH_NUMBER, RECORD_TYPE_CODE,
+    SERVICE_CLASS_CODE, COMPANY_NAME, COMPANY_DISCRETIONARY_DATA,
+    COMPANY_IDENTIFICATION, STANDARD_ENTRY_CLASS_CODE,
+    COMPANY_ENTRY_DESCRIPTION, COMPANY_DESCRIPTIVE_DATE,
+    EFFECTIVE_ENTRY_DATE, SETTLEMENT_DATE, ORIGINATOR_STATUS_CODE,
+    ORIGINATING_DFI_ID, RAW_RECORD
+) VALUES (
+    SEQ_BATCH_HEADER.NEXTVAL, :file_id, :batch_number, :record_type_code,
+    :service_class_code, :company_name, :company_discretionary_data,
+    :company_identification, :standard_entry_class_code,
+    :company_entry_description, :company_descriptive_date,
+    :effective_entry_date, :settlement_date, :originator_status_code,
+    :originating_dfi_id, :raw_record
+) RETURNING BATCH_HEADER_ID INTO :batch_header_id
+"""
+
+_INSERT_ACH_ENTRY_DETAIL_SQL = """
+INSERT INTO ACH_ENTRY_DETAIL (
+    ENTRY_DETAIL_ID, FILE_ID, BATCH_NUMBER, RECORD_TYPE_CODE,
+    TRANSACTION_CODE, RECEIVING_DFI_ID, CHECK_DIGIT,
+    DFI_ACCOUNT_NUMBER, AMOUNT, AMOUNT_DECIMAL,
+    INDIVIDUAL_ID_NUMBER, INDIVIDUAL_NAME, DISCRETIONARY_DATA,
+    ADDENDA_RECORD_INDICATOR, TRACE_NUMBER, TRACE_SEQUENCE_NUMBER,
+    RAW_RECORD
+) VALUES (
+    SEQ_ENTRY_DETAIL.NEXTVAL, :file_id, :batch_number, :record_type_code,
+    :transaction_code, :receiving_dfi_id, :check_digit,
+    :dfi_account_number, :amount, :amount_decimal,
+    :individual_id_number, :individual_name, :discretionary_data,
+    :addenda_record_indicator, :trace_number, :trace_sequence_number,
+    :raw_record
+) RETURNING ENTRY_DETAIL_ID INTO :entry_detail_id
+"""
+
+_INSERT_ACH_ADDENDA_SQL = """
+INSERT INTO ACH_ADDENDA (
+    ADDENDA_ID, FILE_ID, ENTRY_DETAIL_ID, BATCH_NUMBER,
+    RECORD_TYPE_CODE, ADDENDA_TYPE_CODE, PAYMENT_RELATED_INFO,
+    ADDENDA_SEQUENCE_NUMBER, ENTRY_DETAIL_SEQUENCE_NUM, RAW_RECORD
+) VALUES (
+    SEQ_ADDENDA.NEXTVAL, :file_id, :entry_detail_id, :batch_number,
+    :record_type_code, :addenda_type_code, :payment_related_info,
+    :addenda_sequence_number, :entry_detail_sequence_num, :raw_record
+) RETURNING ADDENDA_ID INTO :addenda_id
+"""
+
+_INSERT_ACH_BATCH_CONTROL_SQL = """
+INSERT INTO ACH_BATCH_CONTROL (
+    BATCH_CONTROL_ID, FILE_ID, BATCH_NUMBER, RECORD_TYPE_CODE,
+    SERVICE_CLASS_CODE, ENTRY_ADDENDA_COUNT, ENTRY_HASH,
+    TOTAL_DEBIT_AMOUNT, TOTAL_DEBIT_AMOUNT_DECIMAL,
+    TOTAL_CREDIT_AMOUNT, TOTAL_CREDIT_AMOUNT_DECIMAL,
+    COMPANY_IDENTIFICATION, MESSAGE_AUTH_CODE, RESERVED,
+    ORIGINATING_DFI_ID, RAW_RECORD
+) VALUES (
+    SEQ_BATCH_CONTROL.NEXTVAL, :file_id, :batch_number, :record_type_code,
+    :service_class_code, :entry_addenda_count, :entry_hash,
+    :total_debit_amount, :total_debit_amount_decimal,
+    :total_credit_amount, :total_credit_amount_decimal,
+    :company_identification, :message_auth_code, :reserved,
+    :originating_dfi_id, :raw_record
+) RETURNING BATCH_CONTROL_ID INTO :batch_control_id
+"""
+
+_INSERT_ACH_FILE_CONTROL_SQL = """
+INSERT INTO ACH_FILE_CONTROL (
+    FILE_CONTROL_ID, FILE_ID, RECORD_TYPE_CODE, BATCH_COUNT,
+    BLOCK_COUNT, ENTRY_ADDENDA_COUNT, ENTRY_HASH,
+    TOTAL_DEBIT_AMOUNT, TOTAL_DEBIT_AMOUNT_DECIMAL,
+    TOTAL_CREDIT_AMOUNT, TOTAL_CREDIT_AMOUNT_DECIMAL,
+    RESERVED, RAW_RECORD
+) VALUES (
+    SEQ_FILE_CONTROL.NEXTVAL, :file_id, :record_type_code, :batch_count,
+    :block_count, :entry_addenda_count, :entry_hash,
+    :total_debit_amount, :total_debit_amount_decimal,
+    :total_credit_amount, :total_credit_amount_decimal,
+    :reserved, :raw_record
+) RETURNING FILE_CONTROL_ID INTO :file_control_id
+"""
+
+# setinputsizes for the executemany in parse_and_insert_ach_records: string
+# binds get their NACHA field widths (the parser slices every field out of a
+# 94-character record), so the bind buffers are allocated once per statement
+# instead of being inferred and resized row by row. Keys are in placeholder
+# order, which is also the order of the _ach_*_params tuples.
+_ACH_FILE_HEADER_INPUT_SIZES = {
+    'file_id': oracledb.DB_TYPE_NUMBER,
+    'record_type_code': 1,
+    'priority_code': 2,
+    'immediate_destination': 10,
+    'immediate_origin': 10,
+    'file_creation_date': 6,
+    'file_creation_time': 4,
+    'file_id_modifier': 1,
+    'record_size': 3,
+    'blocking_factor': 2,
+    'format_code': 1,
+    'immediate_dest_name': 23,
+    'immediate_origin_name': 23,
+    'reference_code': 8,
+    'raw_record': 94
+}
+
+_ACH_BATCH_HEADER_INPUT_SIZES = {
+    'file_id': oracledb.DB_TYPE_NUMBER,
+    'batch_number': oracledb.DB_TYPE_NUMBER,
+    'record_type_code': 1,
+    'service_class_code': 3,
+    'company_name': 16,
+    'company_discretionary_data': 20,
+    'company_identification': 10,
+    'standard_entry_class_code': 3,
+    'company_entry_description': 10,
+    'company_descriptive_date': 6,
+    'effective_entry_date': 6,
+    'settlement_date': 3,
+    'originator_status_code': 1,
+    'originating_dfi_id': 8,
+    'raw_record': 94
+}
+
+_ACH_ENTRY_DETAIL_INPUT_SIZES = {
+    'file_id': oracledb.DB_TYPE_NUMBER,
+    'batch_number': oracledb.DB_TYPE_NUMBER,
+    'record_type_code': 1,
+    'transaction_code': 2,
+    'receiving_dfi_id': 8,
+    'check_digit': 1,
+    'dfi_account_number': 17,
+    'amount': oracledb.DB_TYPE_NUMBER,
+    'amount_decimal': oracledb.DB_TYPE_NUMBER,
+    'individual_id_number': 15,
+    'individual_name': 22,
+    'discretionary_data': 2,
+    'addenda_record_indicator': 1,
+    'trace_number': 15,
+    'trace_sequence_number': oracledb.DB_TYPE_NUMBER,
+    'raw_record': 94
+}
+
+_ACH_ADDENDA_INPUT_SIZES = {
+    'file_id': oracledb.DB_TYPE_NUMBER,
+    'entry_detail_id': oracledb.DB_TYPE_NUMBER,
+    'batch_number': oracledb.DB_TYPE_NUMBER,
+    'record_type_code': 1,
+    'addenda_type_code': 2,
+    'payment_related_info': 80,
+    'addenda_sequence_number': oracledb.DB_TYPE_NUMBER,
+    'entry_detail_sequence_num': oracledb.DB_TYPE_NUMBER,
+    'raw_record': 94
+}
+
+_ACH_BATCH_CONTROL_INPUT_SIZES = {
+    'file_id': oracledb.DB_TYPE_NUMBER,
+    'batch_number': oracledb.DB_TYPE_NUMBER,
+    'record_type_code': 1,
+    'service_class_code': 3,
+    'entry_addenda_count': oracledb.DB_TYPE_NUMBER,
+    'entry_hash': 10,
+    'total_debit_amount': oracledb.DB_TYPE_NUMBER,
+    'total_debit_amount_decimal': oracledb.DB_TYPE_NUMBER,
+    'total_credit_amount': oracledb.DB_TYPE_NUMBER,
+    'total_credit_amount_decimal': oracledb.DB_TYPE_NUMBER,
+    'company_identification': 10,
+    'message_auth_code': 19,
+    'reserved': 6,
+    'originating_dfi_id': 8,
+    'raw_record': 94
+}
+
+_ACH_FILE_CONTROL_INPUT_SIZES = {
+    'file_id': oracledb.DB_TYPE_NUMBER,
+    'record_type_code': 1,
+    'batch_count': oracledb.DB_TYPE_NUMBER,
+    'block_count': oracledb.DB_TYPE_NUMBER,
+    'entry_addenda_count': oracledb.DB_TYPE_NUMBER,
+    'entry_hash': 10,
+    'total_debit_amount': oracledb.DB_TYPE_NUMBER,
+    'total_debit_amount_decimal': oracledb.DB_TYPE_NUMBER,
+    'total_credit_amount': oracledb.DB_TYPE_NUMBER,
+    'total_credit_amount_decimal': oracledb.DB_TYPE_NUMBER,
+    'reserved': 39,
+    'raw_record': 94
+}
+
+# Served by IDX_API_USERS_EMAIL_UPPER (database/create_api_users_email_upper_index.sql);
+# the bind is upper-cased in Python so the predicate stays sargable.
+_SELECT_API_USER_AUTH_SQL = """
+SELECT PASSWORD_HASH, IS_ADMIN, IS_ACTIVE
+FROM API_USERS
+WHERE UPPER(EMAIL) = :email_upper
+AND ROWNUM = 1
+"""
+
+
+def _execute_ach_files_page(
+    cursor,
+    limit: int,
+    offset: int,
+    after: Optional[Tuple[datetime, int]]
+) -> None:
+    """Run the ACH_FILES list query for one page, by keyset when `after` is given."""
+    size_fetch_for_page(cursor, limit)
+    if after is not None:
+        after_created_date, after_file_id = after
+        cursor.setinputsizes(limit=oracledb.DB_TYPE_NUMBER, after_file_id=oracledb.DB_TYPE_NUMBER)
+        cursor.execute(SELECT_ACH_FILES_AFTER_SQL, {
+            'limit': limit,
+            'after_created_date': after_created_date,
+            'after_file_id': after_file_id
+        })
+    else:
+        cursor.setinputsizes(limit=oracledb.DB_TYPE_NUMBER, offset=oracledb.DB_TYPE_NUMBER)
+        cursor.execute(SELECT_ACH_FILES_SQL, {'limit': limit, 'offset': offset})
+
+
+_thick_mode_lock = threading.Lock()
+_thick_mode: Optional[bool] = None
+
+
+def init_thick_mode(lib_dir: Optional[str] = None) -> bool:
+    """Load the Oracle Client libraries for thick mode once per process.
+    
+    init_oracle_client is process-global, so only the first call does any
+    work; later calls return its result. Returns False if the libraries
+    could not be loaded and the driver stays in thin mode.
+    """
+    global _thick_mode
+    with _thick_mode_lock:
+        if _thick_mode is not None:
+            return _thick_mode
+        
+        _thick_mode = False
+        if lib_dir:
+            try:
+                oracledb.init_oracle_client(lib_dir=lib_dir)
+                logger.info(f"Using Oracle thick mode (ORACLE_HOME={lib_dir})")
+                _thick_mode = True
+                return _thick_mode
+            except Exception as e:
+                logger.warning(f"Thick mode initialization failed: {e}")
+                logger.info("Retrying without lib_dir")
+        try:
+            oracledb.init_oracle_client()
+            logger.info("Oracle thick mode initialized without lib_dir")
+            _thick_mode = True
+        except Exception as e:
+            logger.warning(f"Thick mode initialization failed: {e}")
+            logger.info("Using thin mode (no encryption support)")
+        return _thick_mode
+
+
+def _stage_file_contents(cursor, file_id: int, text: str) -> None:
+    """Replace the EMPTY_CLOB() FILE_CONTENTS of file_id with text via ACH_FILE_STAGING.
+    
+    The row must already hold an EMPTY_CLOB(); the staging rows are removed by
+    the append block (and by the table's ON COMMIT DELETE ROWS).
+    """
+    for rows in staging_batches(file_id, text):
+        cursor.setinputsizes(frag=4000)
+        cursor.executemany(INSERT_ACH_FILE_STAGING_SQL, rows)
+    
+    cursor.execute(APPEND_STAGED_FILE_CONTENTS_PLSQL, {'file_id': file_id})
+
+
+# Streamed contents are written to the CLOB in pieces of at least this many
+# characters, whatever the size of the incoming chunks
+_CLOB_STREAM_WRITE_CHARS = 1024 * 1024
+
+
+def _write_clob_chunks(clob, chunks: Iterable[str]) -> int:
+    """Write chunks to clob from offset 1 and return the number of characters written.
+    
+    Small chunks (e.g. the lines of a file) are joined until
+    _CLOB_STREAM_WRITE_CHARS is reached, so each LOB write round-trip carries
+    about 1M characters and memory stays bounded by that size.
+    """
+    # LOB offsets are 1-based and counted in characters for CLOBs
+    offset = 1
+    pending: List[str] = []
+    pending_chars = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        pending.append(chunk)
+        pending_chars += len(chunk)
+        if pending_chars >= _CLOB_STREAM_WRITE_CHARS:
+            clob.write(''.join(pending), offset)
+            offset += pending_chars
+            pending = []
+            pending_chars = 0
+    if pending:
+        clob.write(''.join(pending), offset)
+        offset += pending_chars
+    return offset - 1
+
+
+def _insert_ach_records(cursor, sql: str, rows: List[Tuple[Any, ...]], input_sizes: Dict[str, Any]) -> List[int]:
+    """executemany one of the _INSERT_ACH_*_SQL statements and return the generated ids in row order.
+    
+    Rows are bound by position; the RETURNING bind is always the last placeholder.
+    """
+    ids = cursor.var(int, arraysize=len(rows))
+    cursor.setinputsizes(*input_sizes.values(), ids)
+    cursor.executemany(sql, rows)
+    return [ids.getvalue(position)[0] for position in range(len(rows))]
+
+
+def _ach_file_header_params(file_id: int, record: AchFileHeaderCreate) -> Tuple[Any, ...]:
+    """Positional bind values for _INSERT_ACH_FILE_HEADER_SQL."""
+    return (
+        file_id,
+        record.record_type_code,
+        record.priority_code,
+        record.immediate_destination,
+        record.immediate_origin,
+        record.file_creation_date,
+        record.file_creation_time,
+        record.file_id_modifier,
+        record.record_size,
+        record.blocking_factor,
+        record.format_code,
+        record.immediate_dest_name,
+        record.immediate_origin_name,
+        record.reference_code,
+        record.raw_record
+    )
+
+
+def _ach_batch_header_params(file_id: int, record: AchBatchHeaderCreate) -> Tuple[Any, ...]:
+    """Positional bind values for _INSERT_ACH_BATCH_HEADER_SQL."""
+    return (
+        file_id,
+        record.batch_number,
+        record.record_type_code,
+        record.service_class_code,
+        record.company_name,
+        record.company_discretionary_data,
+        record.company_identification,
+        record.standard_entry_class_code,
+        record.company_entry_description,
+        record.company_descriptive_date,
+        record.effective_entry_date,
+        record.settlement_date,
+        record.originator_status_code,
+        record.originating_dfi_id,
+        record.raw_record
+    )
+
+
+def _ach_entry_detail_params(file_id: int, record: AchEntryDetailCreate) -> Tuple[Any, ...]:
+    """Positional bind values for _INSERT_ACH_ENTRY_DETAIL_SQL."""
+    return (
+        file_id,
+        record.batch_number,
+        record.record_type_code,
+        record.transaction_code,
+        record.receiving_dfi_id,
+        record.check_digit,
+        record.dfi_account_number,
+        record.amount,
+        record.amount_decimal,
+        record.individual_id_number,
+        record.individual_name,
+        record.discretionary_data,
+        record.addenda_record_indicator,
+        record.trace_number,
+        record.trace_sequence_number,
+        record.raw_record
+    )
+
+
+def _ach_addenda_params(file_id: int, record: AchAddendaCreate, entry_detail_id: Optional[int] = None) -> Tuple[Any, ...]:
+    """Positional bind values for _INSERT_ACH_ADDENDA_SQL."""
+    return (
+        file_id,
+        entry_detail_id,
+        record.batch_number,
+        record.record_type_code,
+        record.addenda_type_code,
+        record.payment_related_info,
+        record.addenda_sequence_number,
+        record.entry_detail_sequence_num,
+        record.raw_record
+    )
+
+
+def _ach_batch_control_params(file_id: int, record: AchBatchControlCreate) -> Tuple[Any, ...]:
+    """Positional bind values for _INSERT_ACH_BATCH_CONTROL_SQL."""
+    return (
+        file_id,
+        record.batch_number,
+        record.record_type_code,
+        record.service_class_code,
+        record.entry_addenda_count,
+        record.entry_hash,
+        record.total_debit_amount,
+        record.total_debit_amount_decimal,
+        record.total_credit_amount,
+        record.total_credit_amount_decimal,
+        record.company_identification,
+        record.message_auth_code,
+        record.reserved,
+        record.originating_dfi_id,
+        record.raw_record
+    )
+
+
+def _ach_file_control_params(file_id: int, record: AchFileControlCreate) -> Tuple[Any, ...]:
+    """Positional bind values for _INSERT_ACH_FILE_CONTROL_SQL."""
+    return (
+        file_id,
+        record.record_type_code,
+        record.batch_count,
+        record.block_count,
+        record.entry_addenda_count,
+        record.entry_hash,
+        record.total_debit_amount,
+        record.total_debit_amount_decimal,
+        record.total_credit_amount,
+        record.total_credit_amount_decimal,
+        record.reserved,
+        record.raw_record
+    )
+
+
+# WHERE clause for each set of FI_HOLIDAYS filters (keys are bind names). The year
+# filter is a half-open HOLIDAY_DATE range so it can use IDX_FI_HOLIDAYS_DATE
+# (database/create_fi_holidays_date_index.sql); EXTRACT(YEAR FROM ...) could not.
+_FI_HOLIDAY_WHERE_CLAUSES = {
+    frozenset(): "1=1",
+    frozenset({'year_start', 'year_end'}): "HOLIDAY_DATE >= :year_start AND HOLIDAY_DATE < :year_end",
+}
+
+# Bind types for the FI_HOLIDAYS list/count statements. The range binds are DATE
+# to match the column; a TIMESTAMP bind would convert HOLIDAY_DATE instead.
+_FI_HOLIDAY_BIND_TYPES = {
+    'year_start': oracledb.DB_TYPE_DATE,
+    'year_end': oracledb.DB_TYPE_DATE,
+    'offset': oracledb.DB_TYPE_NUMBER,
+    'limit': oracledb.DB_TYPE_NUMBER,
+}
+
+
+def _fi_holiday_filter_params(year: Optional[int]) -> Dict[str, Any]:
+    """Bind values for the FI_HOLIDAYS filters that were supplied."""
+    params = {}
+    if year is not None:
+        params['year_start'] = datetime(year, 1, 1)
+        params['year_end'] = datetime(year + 1, 1, 1)
+    return params
+
+
+# {total_column} is empty or ", COUNT(*) OVER () AS TOTAL_COUNT" (filtered total on every row)
+_SELECT_FI_HOLIDAYS_TEMPLATE = """
+                SELECT 
+                    HOLIDAY_ID,
+                    HOLIDAY_DATE,
+                    HOLIDAY_NAME,
+                    CREATED_BY_USER,
+                    CREATED_DATE,
+                    UPDATED_BY_USER,
+                    UPDATED_DATE{total_column}
+                FROM {schema}.FI_HOLIDAYS 
+                WHERE {where_clause}
+                ORDER BY HOLIDAY_DATE
+                OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY
+                """
+
+_TOTAL_COUNT_COLUMN = """,
+                    COUNT(*) OVER () AS TOTAL_COUNT"""
+
+
+def _fi_holiday_from_row(row) -> FiHolidayResponse:
+    """Build a FiHolidayResponse from the first seven FI_HOLIDAYS list columns."""
+    return FiHolidayResponse(
+        holiday_id=row[0],
+        holiday_date=row[1],
+        holiday_name=row[2],
+        is_active=None,  # Column doesn't exist in table
+        created_by_user=row[3],
+        created_date=row[4],
+        updated_by_user=row[5],
+        updated_date=row[6]
+    )
+
+
+# Predicate for each ACH_ACCOUNT_NUMBER_SWAPS list filter, keyed by bind name
+_ACH_ACCOUNT_SWAP_FILTER_CONDITIONS = {
+    'original_dfi_account_number': "ORIGINAL_DFI_ACCOUNT_NUMBER = :original_dfi_account_number",
+    'swap_account_number': "SWAP_ACCOUNT_NUMBER = :swap_account_number",
+    # Case-insensitive substring match; the bind arrives upper-cased. UPPER(SWAP_MEMO)
+    # is evaluated on IDX_ACH_SWAPS_CREATED_MEMO entries
+    # (database/create_ach_account_swaps_memo_index.sql)
+    'swap_memo': "UPPER(SWAP_MEMO) LIKE :swap_memo",
+}
+
+# WHERE clause for every combination of swap list filters (keys are bind names)
+_ACH_ACCOUNT_SWAP_WHERE_CLAUSES = {
+    frozenset(names): " AND ".join(_ACH_ACCOUNT_SWAP_FILTER_CONDITIONS[name] for name in names) or "1=1"
+    for count in range(len(_ACH_ACCOUNT_SWAP_FILTER_CONDITIONS) + 1)
+    for names in combinations(_ACH_ACCOUNT_SWAP_FILTER_CONDITIONS, count)
+}
+
+# {total_column} is empty or _TOTAL_COUNT_COLUMN
+_SELECT_ACH_ACCOUNT_SWAPS_TEMPLATE = """
+                SELECT 
+                    SWAP_ID,
+                    ORIGINAL_DFI_ACCOUNT_NUMBER,
+                    SWAP_ACCOUNT_NUMBER,
+                    SWAP_MEMO,
+                    CREATED_BY_USER,
+                    CREATED_DATE,
+                    UPDATED_BY_USER,
+                    UPDATED_DATE{total_column}
+                FROM {schema}.ACH_ACCOUNT_NUMBER_SWAPS 
+                WHERE {where_clause}
+                ORDER BY CREATED_DATE DESC
+                OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY
+                """
+
+
+def _ach_account_swap_filter_params(
+    original_dfi_account_number: Optional[str],
+    swap_account_number: Optional[str],
+    swap_memo: Optional[str]
+) -> Dict[str, Any]:
+    """Bind values for the ACH_ACCOUNT_NUMBER_SWAPS list filters that were supplied."""
+    params = {}
+    if original_dfi_account_number is not None:
+        params['original_dfi_account_number'] = original_dfi_account_number
+    if swap_account_number is not None:
+        params['swap_account_number'] = swap_account_number
+    if swap_memo is not None:
+        params['swap_memo'] = f'%{swap_memo.upper()}%'
+    return params
+
+
+def _ach_account_swap_from_row(row) -> AchAccountSwapResponse:
+    """Build an AchAccountSwapResponse from the first eight swap list columns."""
+    return AchAccountSwapResponse(
+        swap_id=row[0],
+        original_dfi_account_number=row[1],
+        swap_account_number=row[2],
+        swap_memo=row[3],
+        created_by_user=row[4],
+        created_date=row[5],
+        updated_by_user=row[6],
+        updated_date=row[7]
+    )
+
+
+# Column order of _core_post_sp_approved_query; field names match AchCorePostSpData
+AchCorePostRow = namedtuple(
+    'AchCorePostRow',
+    'trace_sequence_number client_id origin_agency origin_sub_account ach_class '
+    'origin_account company_id company_entry_description receiver_routing_aba '
+    'receiver_account transaction_code company_name receiver_id receiver_name '
+    'reference_code payment_description amount entry_detail_id file_id '
+    'batch_number original_filename'
+)
+
+
+def _core_post_sp_approved_query(file_id: Optional[int], client_id: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+    """Build the unpaged Core Post SP (approved files) query and its binds.
+    
+    Join, filter and ORDER BY columns are indexed by
+    database/create_ach_core_post_join_indexes.sql.
+    """
+    # Build WHERE clause dynamically
+    where_conditions = [
+        "ed.RECORD_TYPE_CODE = '6'",
+        "af.PROCESSING_STATUS = 'APPROVED'"
+    ]
+    params = {}
+    
+    if file_id is not None:
+        where_conditions.append("ed.FILE_ID = :file_id")
+        params['file_id'] = file_id
+    
+    if client_id is not None:
+        where_conditions.append("af.CLIENT_ID = :client_id")
+        params['client_id'] = client_id
+    
+    where_clause = " AND ".join(where_conditions)
+    
+    # Pagination, if any, is appended by the caller. RESULT_CACHE lets the server
+    # answer repeated runs with the same binds from its result cache; Oracle
+    # invalidates the entry on any DML to the joined tables.
+    query = f"""
+        SELECT /*+ RESULT_CACHE */
+            -- Trace Sequence Number (GN_SECUENCIACONVENIO)
+            ed.TRACE_SEQUENCE_NUMBER AS trace_sequence_number,
+            
+            -- Client ID (GN_CODIGOCLIENTE)
+            af.CLIENT_ID AS client_id,
+            
+            -- Origin Agency (GN_AGENCIACTAORIGEN)
+            SUBSTR(bh.ORIGINATING_DFI_ID, 1, 3) AS origin_agency,
+            
+            -- Origin Sub-account (GN_SUBCTAORIGEN)
+            0 AS origin_sub_account,
+            
+            -- ACH Class (GV_APLCTAORIGEN)
+            bh.STANDARD_ENTRY_CLASS_CODE AS ach_class,
+            
+            -- Origin Account (GN_CTAORIGEN)
+            ed.DFI_ACCOUNT_NUMBER AS origin_account,
+            
+            -- Company ID (GN_EMPCTAORIGEN)
+            bh.COMPANY_IDENTIFICATION AS company_id,
+            
+            -- Company Entry Description
+            bh.COMPANY_ENTRY_DESCRIPTION AS company_entry_description,
+            
+            -- Receiver Routing/ABA (GN_ABABCORECIBIDOR)
+            ed.RECEIVING_DFI_ID || ed.CHECK_DIGIT AS receiver_routing_aba,
+            
+            -- Receiver Account (GV_CTABCORECIBIDOR)
+            ed.DFI_ACCOUNT_NUMBER AS receiver_account,
+            
+            -- Transaction Code (GN_PRODBCORECIBIDOR)
+            ed.TRANSACTION_CODE AS transaction_code,
+            
+            -- Company Name (GV_CUENTAINSTITUCION)
+            bh.COMPANY_NAME AS company_name,
+            
+            -- Receiver ID (GV_IDRECIBIDOR)
+            ed.INDIVIDUAL_ID_NUMBER AS receiver_id,
+            
+            -- Receiver Name (GV_NOMBRERECIBIDOR)
+            ed.INDIVIDUAL_NAME AS receiver_name,
+            
+            -- Reference (GV_REFERENCIA)
+            fh.REFERENCE_CODE AS reference_code,
+            
+            -- Payment Description (GV_DESCPAGO)
+            bh.COMPANY_ENTRY_DESCRIPTION AS payment_description,
+            
+            -- Amount (GN_MONTOOPERACION)
+            ed.AMOUNT_DECIMAL AS amount,
+            
+            -- Additional fields for filtering/identification
+            ed.ENTRY_DETAIL_ID,
+            ed.FILE_ID,
+            ed.BATCH_NUMBER,
+            af.ORIGINAL_FILENAME
+        FROM
+            ACH_ENTRY_DETAIL ed
+            INNER JOIN ACH_FILES af ON ed.FILE_ID = af.FILE_ID
+            INNER JOIN ACH_BATCH_HEADER bh 
+                ON ed.FILE_ID = bh.FILE_ID 
+                AND ed.BATCH_NUMBER = bh.BATCH_NUMBER
+            INNER JOIN ACH_FILE_HEADER fh ON ed.FILE_ID = fh.FILE_ID
+        WHERE
+            {where_clause}
+        ORDER BY
+            ed.FILE_ID, ed.BATCH_NUMBER, ed.ENTRY_DETAIL_ID
+    """
+    
+    return query, params
+
+
+# Largest file_contents, in characters, kept in the get_ach_file cache
+_MAX_CACHED_FILE_CONTENTS = 256 * 1024
+
+# Most successful logins kept in the authenticate_user cache
+_AUTH_CACHE_SIZE = 1024
+
+# Oracle allows at most 1000 expressions in an IN list
+_SWAP_LOOKUP_BATCH_SIZE = 1000
+
+# Most (file_id, client_id, limit, offset) results kept in the Core Post data cache
+_CORE_POST_CACHE_SIZE = 16
+
+
 class OracleService:
     """Service for Oracle database operations."""
     
-    def __init__(self, config: OracleConfig):
-        """Initialize Oracle service with configuration."""
+    def __init__(self, config: OracleConfig, shared: bool = False):
+        """Initialize Oracle service with configuration.
+        
+        A shared service (see get_service) keeps its pool open across ``with``
+        blocks; the pool is only closed by an explicit disconnect().
+        """
         self.config = config
+        self.shared = shared
         self.pool: Optional[oracledb.ConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # Connection pinned by batch() for the current thread, if any
+        self._batch_local = threading.local()
+        # (monotonic expiry time, clients, clients by CLIENT_ID) for get_active_clients
+        # and find_active_client
+        self._active_clients_cache: Optional[Tuple[float, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]] = None
+        # file_id -> (monotonic expiry time, record) for get_ach_file, least recently used first
+        self._ach_file_cache: "OrderedDict[int, Tuple[float, AchFileResponse]]" = OrderedDict()
+        self._ach_file_cache_lock = threading.Lock()
+        # (monotonic expiry time, count) for get_ach_files_count
+        self._ach_files_count_cache: Optional[Tuple[float, int]] = None
+        # ORIGINAL_DFI_ACCOUNT_NUMBER -> (monotonic expiry time, swap or None) for
+        # get_swap_by_original_account, least recently used first
+        self._swap_cache: "OrderedDict[str, Tuple[float, Optional[SwapLookupResponse]]]" = OrderedDict()
+        self._swap_cache_lock = threading.Lock()
+        # (file_id, client_id, limit, offset) -> (monotonic expiry time, records) for
+        # get_ach_data_for_core_post_sp_approved, least recently used first
+        self._core_post_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, List[AchCorePostRow]]]" = OrderedDict()
+        self._core_post_cache_lock = threading.Lock()
+        # (email, HMAC of password) -> (monotonic expiry time, HMAC of PASSWORD_HASH) for successful
+        # authenticate_user calls; the per-process key keeps passwords out of memory
+        self._auth_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, bytes]]" = OrderedDict()
+        self._auth_cache_lock = threading.Lock()
+        self._auth_cache_key = os.urandom(32)
+        # FI_HOLIDAYS list/count statements, one per set of supplied filters, built
+        # once so each filter combination always sends the same SQL text
+        schema = self.config.db_schema
+        self._fi_holiday_select_sql = {
+            filters: _SELECT_FI_HOLIDAYS_TEMPLATE.format(schema=schema, where_clause=where_clause, total_column="")
+            for filters, where_clause in _FI_HOLIDAY_WHERE_CLAUSES.items()
+        }
+        self._fi_holiday_select_with_total_sql = {
+            filters: _SELECT_FI_HOLIDAYS_TEMPLATE.format(
+                schema=schema, where_clause=where_clause, total_column=_TOTAL_COUNT_COLUMN
+            )
+            for filters, where_clause in _FI_HOLIDAY_WHERE_CLAUSES.items()
+        }
+        self._fi_holiday_count_sql = {
+            filters: f"""
+                SELECT COUNT(*) 
+                FROM {schema}.FI_HOLIDAYS 
+                WHERE {where_clause}
+                """
+            for filters, where_clause in _FI_HOLIDAY_WHERE_CLAUSES.items()
+        }
+        # Same for the ACH_ACCOUNT_NUMBER_SWAPS list/count statements (2^3 filter sets)
+        self._ach_account_swap_select_sql = {
+            filters: _SELECT_ACH_ACCOUNT_SWAPS_TEMPLATE.format(schema=schema, where_clause=where_clause, total_column="")
+            for filters, where_clause in _ACH_ACCOUNT_SWAP_WHERE_CLAUSES.items()
+        }
+        self._ach_account_swap_select_with_total_sql = {
+            filters: _SELECT_ACH_ACCOUNT_SWAPS_TEMPLATE.format(
+                schema=schema, where_clause=where_clause, total_column=_TOTAL_COUNT_COLUMN
+            )
+            for filters, where_clause in _ACH_ACCOUNT_SWAP_WHERE_CLAUSES.items()
+        }
+        self._ach_account_swap_count_sql = {
+            filters: f"""
+                SELECT COUNT(*) 
+                FROM {schema}.ACH_ACCOUNT_NUMBER_SWAPS 
+                WHERE {where_clause}
+                """
+            for filters, where_clause in _ACH_ACCOUNT_SWAP_WHERE_CLAUSES.items()
+        }
     
     def connect(self) -> None:
         """Establish Oracle connection pool.
         
         Uses thin mode by default (no Oracle Instant Client required).
-        If ORACLE_HOME is set, will attempt to use thick mode for encryption support.
+        Thick mode (needed for some network encryption setups) is only loaded
+        when config.use_thick_mode is set, from ORACLE_HOME if it is defined.
         """
         try:
-            # Check if Oracle Instant Client is available (thick mode)
-            oracle_home = os.environ.get('ORACLE_HOME')
-            use_thick_mode = False
-            
-            if oracle_home:
-                try:
-                    oracledb.init_oracle_client(lib_dir=oracle_home)
-                    logger.info(f"Using Oracle thick mode (ORACLE_HOME={oracle_home})")
-                    use_thick_mode = True
-                except Exception as e:
-                    logger.warning(f"Thick mode initialization failed: {e}")
-                    logger.info("Falling back to thin mode")
-                    # Try without lib_dir
-                    try:
-                        oracledb.init_oracle_client()
-                        logger.info("Oracle thick mode initialized without lib_dir")
-                        use_thick_mode = True
-                    except Exception as e2:
-                        logger.warning(f"Thick mode fallback failed: {e2}")
-                        logger.info("Using thin mode (no encryption support)")
-                        # Don't raise - continue with thin mode
+            if self.config.use_thick_mode:
+                init_thick_mode(os.environ.get('ORACLE_HOME'))
             else:
                 logger.info("Using Oracle thin mode (no Instant Client required)")
             
@@ -65,9 +855,15 @@ class OracleService:
                 'user': self.config.username,
                 'password': self.config.password,
                 'dsn': self.config.dsn,
-                'min': self.config.min_pool_size,
+                'min': self.config.max_pool_size if self.config.pool_static else self.config.min_pool_size,
                 'max': self.config.max_pool_size,
-                'increment': self.config.pool_increment
+                'increment': self.config.pool_increment,
+                'getmode': oracledb.POOL_GETMODE_TIMEDWAIT if self.config.pool_wait_timeout > 0 else oracledb.POOL_GETMODE_WAIT,
+                'wait_timeout': self.config.pool_wait_timeout,
+                'max_lifetime_session': self.config.max_lifetime_session,
+                'ping_interval': self.config.ping_interval,
+                'stmtcachesize': self.config.stmt_cache_size,
+                'session_callback': session_callback(self.config)
             }
             
             # Add TLS/SSL configuration if provided
@@ -94,456 +890,516 @@ class OracleService:
             logger.info("Oracle connection pool closed")
     
     def __enter__(self):
-        """Context manager entry."""
-        self.connect()
+        """Context manager entry. Creates the pool only if it is not open yet."""
+        if self.pool is None:
+            with self._pool_lock:
+                if self.pool is None:
+                    self.connect()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.disconnect()
+        """Context manager exit. Shared services keep their pool open."""
+        if not self.shared:
+            self.disconnect()
     
     def get_connection(self):
-        """Get a connection from the pool."""
+        """Get a connection from the pool.
+        
+        Inside batch() this is the batch's connection, which stays acquired
+        when the caller's ``with`` block ends.
+        """
+        pinned = getattr(self._batch_local, 'conn', None)
+        if pinned is not None:
+            return nullcontext(pinned)
         if not self.pool:
             raise RuntimeError("Oracle connection pool not established")
         return self.pool.acquire()
     
+    @contextmanager
+    def batch(self):
+        """Run the service calls made in this block on one pooled connection.
+        
+        Sequential calls (e.g. create a record, then read it back) reuse one
+        session instead of acquiring and releasing one per call. This only
+        saves round-trips; it is not a transaction. Each service call still
+        commits its own work, so if a later call fails the earlier ones stay
+        committed. Anything a call leaves uncommitted is committed when the
+        block exits, or rolled back if it raises. The connection is pinned to
+        the calling thread, so do not await inside the block. Nested batch()
+        blocks join the outer one.
+        """
+        if getattr(self._batch_local, 'conn', None) is not None:
+            yield self
+            return
+        
+        with self.get_connection() as conn:
+            self._batch_local.conn = conn
+            try:
+                yield self
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._batch_local.conn = None
+    
     def create_ach_file(self, ach_file: AchFileCreate) -> int:
         """Create a new ACH_FILES record.
         
-        For large CLOB inserts (>1MB), uses DBMS_LOB to reduce PGA memory usage.
+        For large CLOB inserts (>500KB), the row is inserted with EMPTY_CLOB() and
+        the contents are staged as VARCHAR2 fragments and appended server-side.
         This prevents ORA-04036 errors when inserting large file contents.
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Check file size to determine if we need DBMS_LOB approach
-                # Use more conservative threshold (500KB) and check both string length and encoded size
-                if ach_file.file_contents:
-                    char_length = len(ach_file.file_contents)
-                    byte_size = len(ach_file.file_contents.encode('utf-8'))
-                    file_contents_size = max(char_length, byte_size)
-                else:
-                    file_contents_size = 0
-                # Lower threshold to 500KB to be more conservative and prevent edge cases
-                use_lob_insert = file_contents_size > 512 * 1024  # 500KB threshold
-                
-                if use_lob_insert and ach_file.file_contents:
-                    # For large CLOBs, insert with empty CLOB first, then write using DBMS_LOB
-                    insert_plsql = """
-                    DECLARE
-                        v_file_id NUMBER;
-                        v_clob CLOB;
-                    BEGIN
-                        INSERT INTO ACH_FILES (
-                            ORIGINAL_FILENAME,
-                            PROCESSING_STATUS,
-                            FILE_CONTENTS,
-                            CREATED_BY_USER,
-                            CREATED_DATE,
-                            CLIENT_ID,
-                            CLIENT_NAME,
-                            FILE_UPLOAD_FOLDER,
-                            FILE_UPLOAD_FILENAME,
-                            MEMO
-                        ) VALUES (
-                            :original_filename,
-                            :processing_status,
-                            EMPTY_CLOB(),
-                            :created_by_user,
-                            CURRENT_TIMESTAMP,
-                            :client_id,
-                            :client_name,
-                            :file_upload_folder,
-                            :file_upload_filename,
-                            :memo
-                        ) RETURNING FILE_ID, FILE_CONTENTS INTO v_file_id, v_clob;
+                with conn.cursor() as cursor:
+                    file_id = cursor.var(int)
+                    params = ach_file_insert_params(ach_file)
+                    params['file_id'] = file_id
+                    
+                    # Contents over 500KB (UTF-8) take the staged LOB write
+                    if needs_lob(ach_file.file_contents):
+                        # For large CLOBs, insert with empty CLOB first, then fill it from staged fragments
+                        del params['file_contents']
+                        cursor.execute(INSERT_ACH_FILE_EMPTY_CLOB_SQL, params)
+                        generated_id = file_id.getvalue()[0]
                         
-                        :file_id := v_file_id;
-                        :file_contents_clob := v_clob;
-                    END;
-                    """
+                        _stage_file_contents(cursor, generated_id, ach_file.file_contents)
+                        
+                        conn.commit()
+                        self._ach_files_count_cache = None
+                        logger.info(f"Created ACH_FILES record {generated_id} with large CLOB ({len(ach_file.file_contents)} characters) from staged fragments")
+                        return generated_id
                     
-                    # Execute insert with empty CLOB
-                    file_id = cursor.var(int)
-                    file_contents_clob = cursor.var(oracledb.DB_TYPE_CLOB)
-                    cursor.execute(insert_plsql, {
-                        'original_filename': ach_file.original_filename,
-                        'processing_status': ach_file.processing_status,
-                        'created_by_user': ach_file.created_by_user,
-                        'client_id': ach_file.client_id,
-                        'client_name': ach_file.client_name,
-                        'file_upload_folder': ach_file.file_upload_folder,
-                        'file_upload_filename': ach_file.file_upload_filename,
-                        'memo': ach_file.memo,
-                        'file_id': file_id,
-                        'file_contents_clob': file_contents_clob
-                    })
+                    # For small CLOBs, use standard INSERT
+                    cursor.execute(INSERT_ACH_FILE_SQL, params)
                     
-                    # Get the CLOB locator
-                    clob = file_contents_clob.getvalue()[0]
+                    conn.commit()
+                    self._ach_files_count_cache = None
                     generated_id = file_id.getvalue()[0]
                     
-                    # Write content in 32KB chunks to avoid PGA memory issues
-                    chunk_size = 32767  # Oracle VARCHAR2 max size
-                    file_contents = ach_file.file_contents
-                    offset = 0
-                    total_length = len(file_contents)
+                    logger.info(f"Created ACH_FILES record with ID: {generated_id}")
+                    return generated_id
+                
+        except Exception as e:
+            logger.error(f"Failed to create ACH_FILES record: {e}")
+            raise
+    
+    def create_ach_file_stream(self, ach_file: AchFileCreate, chunks: Iterable[str]) -> int:
+        """Create a new ACH_FILES record with FILE_CONTENTS read from an iterable of text chunks.
+        
+        ach_file.file_contents is ignored. The row is inserted with EMPTY_CLOB()
+        and the chunks are written through the returned LOB locator as they
+        arrive, about 1M characters per write (see _write_clob_chunks). A file
+        can be streamed with ``iter(lambda: fh.read(1 << 20), '')`` or by
+        passing the file object itself.
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    file_id = cursor.var(int)
+                    file_contents_clob = cursor.var(oracledb.DB_TYPE_CLOB)
+                    params = ach_file_insert_params(ach_file)
+                    del params['file_contents']
+                    params['file_id'] = file_id
+                    params['file_contents_clob'] = file_contents_clob
+                    cursor.execute(INSERT_ACH_FILE_EMPTY_CLOB_LOCATOR_SQL, params)
+                    generated_id = file_id.getvalue()[0]
                     
-                    while offset < total_length:
-                        chunk = file_contents[offset:offset + chunk_size]
-                        chunk_length = len(chunk)
-                        cursor.execute(
-                            "BEGIN DBMS_LOB.WRITEAPPEND(:clob, :amount, :buffer); END;",
-                            {'clob': clob, 'amount': chunk_length, 'buffer': chunk}
-                        )
-                        offset += chunk_length
+                    written = _write_clob_chunks(file_contents_clob.getvalue()[0], chunks)
                     
                     conn.commit()
-                    logger.info(f"Created ACH_FILES record {generated_id} with large CLOB ({file_contents_size} bytes) using DBMS_LOB")
+                    self._ach_files_count_cache = None
+                    logger.info(f"Created ACH_FILES record {generated_id} with streamed CLOB ({written} characters)")
                     return generated_id
                 
-                # For small CLOBs, use standard INSERT
-                insert_sql = """
-                INSERT INTO ACH_FILES (
-                    ORIGINAL_FILENAME,
-                    PROCESSING_STATUS,
-                    FILE_CONTENTS,
-                    CREATED_BY_USER,
-                    CREATED_DATE,
-                    CLIENT_ID,
-                    CLIENT_NAME,
-                    FILE_UPLOAD_FOLDER,
-                    FILE_UPLOAD_FILENAME,
-                    MEMO
-                ) VALUES (
-                    :original_filename,
-                    :processing_status,
-                    :file_contents,
-                    :created_by_user,
-                    CURRENT_TIMESTAMP,
-                    :client_id,
-                    :client_name,
-                    :file_upload_folder,
-                    :file_upload_filename,
-                    :memo
-                ) RETURNING FILE_ID INTO :file_id
-                """
-                
-                # Execute insert
-                file_id = cursor.var(int)
-                cursor.execute(insert_sql, {
-                    'original_filename': ach_file.original_filename,
-                    'processing_status': ach_file.processing_status,
-                    'file_contents': ach_file.file_contents,
-                    'created_by_user': ach_file.created_by_user,
-                    'client_id': ach_file.client_id,
-                    'client_name': ach_file.client_name,
-                    'file_upload_folder': ach_file.file_upload_folder,
-                    'file_upload_filename': ach_file.file_upload_filename,
-                    'memo': ach_file.memo,
-                    'file_id': file_id
-                })
-                
-                conn.commit()
-                generated_id = file_id.getvalue()[0]
-                
-                logger.info(f"Created ACH_FILES record with ID: {generated_id}")
-                return generated_id
-                
         except Exception as e:
-            logger.error(f"Failed to create ACH_FILES record: {e}")
+            logger.error(f"Failed to stream create ACH_FILES record: {e}")
             raise
     
-    def get_ach_file(self, file_id: int) -> Optional[AchFileResponse]:
-        """Get an ACH_FILES record by ID."""
+    def create_ach_files(self, ach_files: List[AchFileCreate], batch_size: int = 1000) -> List[int]:
+        """Create many ACH_FILES records with array DML.
+        
+        Rows are sent batch_size at a time with executemany, so a bulk load costs
+        one round trip per batch instead of one per file. Batches of 500-5000
+        keep client memory bounded. Contents that fit a VARCHAR2 bind
+        (32767 bytes) are batched separately from those that need a CLOB bind,
+        and contents over 500KB take the staged single-row path used by
+        create_ach_file. Everything is committed once at the end and the
+        returned FILE_IDs follow the order of ach_files.
+        """
+        if not ach_files:
+            return []
+        
+        # Group input positions by how FILE_CONTENTS has to be bound
+        short_rows, clob_rows, large_rows = [], [], []
+        for position, ach_file in enumerate(ach_files):
+            if needs_lob(ach_file.file_contents):
+                large_rows.append(position)
+            elif needs_lob(ach_file.file_contents, MAX_VARCHAR_BIND_BYTES):
+                clob_rows.append(position)
+            else:
+                short_rows.append(position)
+        
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                select_sql = """
-                SELECT 
-                    FILE_ID,
-                    ORIGINAL_FILENAME,
-                    PROCESSING_STATUS,
-                    FILE_CONTENTS,
-                    CREATED_BY_USER,
-                    CREATED_DATE,
-                    UPDATED_BY_USER,
-                    UPDATED_DATE,
-                    CLIENT_ID,
-                    CLIENT_NAME,
-                    FILE_UPLOAD_FOLDER,
-                    FILE_UPLOAD_FILENAME,
-                    MEMO
-                FROM ACH_FILES 
-                WHERE FILE_ID = :file_id
-                """
-                
-                cursor.execute(select_sql, {'file_id': file_id})
-                row = cursor.fetchone()
-                
-                if row:
-                    # Handle CLOB data - convert LOB to string
-                    # For large CLOBs, read in chunks to avoid memory issues
-                    file_contents = row[3]
-                    if file_contents:
-                        if hasattr(file_contents, 'read'):
-                            # It's a LOB object, check size first
-                            try:
-                                lob_size = file_contents.size()
-                                # For very large CLOBs (>10MB), truncate or skip content to avoid memory issues
-                                if lob_size > 10 * 1024 * 1024:  # 10MB
-                                    # For very large files, return a placeholder message
-                                    file_contents = f"[File content too large to display ({lob_size} bytes)]"
-                                else:
-                                    # Read the CLOB content
-                                    file_contents = file_contents.read()
-                            except Exception as e:
-                                logger.warning(f"Error reading CLOB for FILE_ID {file_id}: {e}")
-                                file_contents = "[Error reading file content]"
-                        elif isinstance(file_contents, str):
-                            # Already a string, use as-is
-                            pass
-                        else:
-                            # Unknown type, convert to string
-                            file_contents = str(file_contents) if file_contents else None
-                    else:
-                        file_contents = None
+                with conn.cursor() as cursor:
+                    file_ids: List[Optional[int]] = [None] * len(ach_files)
                     
-                    return AchFileResponse(
-                        file_id=row[0],
-                        original_filename=row[1],
-                        processing_status=row[2],
-                        file_contents=file_contents,
-                        created_by_user=row[4],
-                        created_date=row[5],
-                        updated_by_user=row[6],
-                        updated_date=row[7],
-                        client_id=row[8],
-                        client_name=row[9],
-                        file_upload_folder=row[10],
-                        file_upload_filename=row[11],
-                        memo=row[12]
+                    for positions, contents_type in (
+                        (short_rows, oracledb.DB_TYPE_VARCHAR),
+                        (clob_rows, oracledb.DB_TYPE_CLOB)
+                    ):
+                        for start in range(0, len(positions), batch_size):
+                            batch = positions[start:start + batch_size]
+                            rows = [ach_file_insert_params(ach_files[position]) for position in batch]
+                            
+                            # One RETURNING slot per row
+                            file_id_var = cursor.var(int, arraysize=len(rows))
+                            cursor.setinputsizes(file_contents=contents_type, file_id=file_id_var)
+                            cursor.executemany(INSERT_ACH_FILE_SQL, rows)
+                            for i, position in enumerate(batch):
+                                file_ids[position] = file_id_var.getvalue(i)[0]
+                    
+                    for position in large_rows:
+                        ach_file = ach_files[position]
+                        file_id_var = cursor.var(int)
+                        params = ach_file_insert_params(ach_file)
+                        del params['file_contents']
+                        params['file_id'] = file_id_var
+                        cursor.execute(INSERT_ACH_FILE_EMPTY_CLOB_SQL, params)
+                        file_ids[position] = file_id_var.getvalue()[0]
+                        _stage_file_contents(cursor, file_ids[position], ach_file.file_contents)
+                    
+                    conn.commit()
+                    self._ach_files_count_cache = None
+                    
+                    logger.info(
+                        f"Created {len(file_ids)} ACH_FILES records "
+                        f"({len(short_rows)} short, {len(clob_rows)} CLOB, {len(large_rows)} staged)"
                     )
+                    return file_ids
+        
+        except Exception as e:
+            logger.error(f"Failed to create ACH_FILES records: {e}")
+            raise
+    
+    def _get_cached_ach_file(self, file_id: int) -> Optional[AchFileResponse]:
+        """Return a copy of a cached get_ach_file result if it has not expired."""
+        with self._ach_file_cache_lock:
+            cached = self._ach_file_cache.get(file_id)
+            if cached is None:
                 return None
+            if time.monotonic() >= cached[0]:
+                del self._ach_file_cache[file_id]
+                return None
+            self._ach_file_cache.move_to_end(file_id)
+            return cached[1].model_copy()
+    
+    def _cache_ach_file(self, record: AchFileResponse) -> None:
+        """Cache a get_ach_file result, evicting the least recently used entries.
+        
+        Records with contents over _MAX_CACHED_FILE_CONTENTS are not cached.
+        """
+        if self.config.file_cache_ttl <= 0 or self.config.file_cache_size <= 0:
+            return
+        if record.file_contents is not None and len(record.file_contents) > _MAX_CACHED_FILE_CONTENTS:
+            return
+        with self._ach_file_cache_lock:
+            self._ach_file_cache[record.file_id] = (time.monotonic() + self.config.file_cache_ttl, record.model_copy())
+            self._ach_file_cache.move_to_end(record.file_id)
+            while len(self._ach_file_cache) > self.config.file_cache_size:
+                self._ach_file_cache.popitem(last=False)
+    
+    def _invalidate_ach_files(self, file_ids: Iterable[int]) -> None:
+        """Drop cached get_ach_file results after the records change."""
+        with self._ach_file_cache_lock:
+            for file_id in file_ids:
+                self._ach_file_cache.pop(file_id, None)
+        self._clear_core_post_cache()
+    
+    def invalidate_ach_files_list(self) -> None:
+        """Drop the cached ACH_FILES count and Core Post data.
+        
+        Called after ACH_FILES records are created outside this service
+        (the asyncio create path) so the list total and Core Post views
+        pick the new rows up.
+        """
+        self._ach_files_count_cache = None
+        self._clear_core_post_cache()
+    
+    def _clear_core_post_cache(self) -> None:
+        """Drop cached Core Post data after ACH_FILES or ACH record changes."""
+        with self._core_post_cache_lock:
+            self._core_post_cache.clear()
+    
+    def get_ach_file(self, file_id: int, include_contents: bool = True) -> Optional[AchFileResponse]:
+        """Get an ACH_FILES record by ID.
+        
+        With config.file_cache_ttl set, records with contents up to 256K
+        characters are cached in-process for that many seconds (up to
+        config.file_cache_size entries) and invalidated by this service's
+        updates and deletes.
+        
+        With include_contents=False FILE_CONTENTS is not read at all and the
+        record comes back with file_contents=None; use
+        stream_ach_file_contents to read the contents in chunks.
+        """
+        cached = self._get_cached_ach_file(file_id)
+        if cached is not None:
+            if not include_contents:
+                return cached.model_copy(update={'file_contents': None})
+            return cached
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    if not include_contents:
+                        size_fetch_for_page(cursor, 1)
+                        cursor.execute(SELECT_ACH_FILE_METADATA_SQL, {'file_id': file_id})
+                        cursor.rowfactory = AchFileRow._make
+                        row = cursor.fetchone()
+                        
+                        if row:
+                            return AchFileResponse.model_construct(file_contents=None, **row._asdict())
+                        return None
+                    
+                    # Single-row fetch: one-row buffers for the inlined CLOB
+                    size_fetch_for_page(cursor, 1)
+                    cursor.outputtypehandler = clob_as_string_handler
+                    
+                    cursor.execute(SELECT_ACH_FILE_SQL, {
+                        'file_id': file_id,
+                        'max_contents_length': MAX_INLINE_FILE_CONTENTS
+                    })
+                    row = cursor.fetchone()
+                    
+                    if row:
+                        record = ach_file_from_row(row)
+                        self._cache_ach_file(record)
+                        return record
+                    return None
                 
         except Exception as e:
             logger.error(f"Failed to get ACH_FILES record {file_id}: {e}")
             raise
     
-    def get_ach_files(self, limit: int = 100, offset: int = 0) -> List[AchFileResponse]:
-        """Get list of ACH_FILES records, excluding files starting with 'FEDACHOUT' or ending with '.pdf'."""
+    def get_ach_files_by_ids(self, file_ids: List[int]) -> List[AchFileResponse]:
+        """Get several ACH_FILES records, with contents, in one query.
+        
+        The ids are bound as a SYS.ODCINUMBERLIST collection. Results follow
+        the order of file_ids; ids with no record are skipped. Bulk reads
+        neither use nor fill the get_ach_file cache, so they always see the
+        current rows and do not pin large contents in memory.
+        """
+        records: Dict[int, AchFileResponse] = {}
+        unique_ids = list(dict.fromkeys(file_ids))
+        
+        try:
+            if unique_ids:
+                with self.get_connection() as conn:
+                    with conn.cursor() as cursor:
+                        cursor.outputtypehandler = clob_as_string_handler
+                        size_fetch_for_page(cursor, len(unique_ids))
+                        
+                        id_list_type = conn.gettype("SYS.ODCINUMBERLIST")
+                        cursor.execute(SELECT_ACH_FILES_BY_IDS_SQL, {
+                            'file_ids': id_list_type.newobject(unique_ids),
+                            'max_contents_length': MAX_INLINE_FILE_CONTENTS
+                        })
+                        
+                        for row in cursor:
+                            record = ach_file_from_row(row)
+                            records[record.file_id] = record
+            
+            logger.info(f"Retrieved {len(records)} of {len(file_ids)} requested ACH_FILES records")
+            return [records[file_id] for file_id in file_ids if file_id in records]
+            
+        except Exception as e:
+            logger.error(f"Failed to get ACH_FILES records {file_ids}: {e}")
+            raise
+    
+    def stream_ach_file_contents(self, file_id: int, chunk_size: int = 1024 * 1024) -> Iterator[str]:
+        """Yield FILE_CONTENTS of an ACH_FILES record in chunks of chunk_size characters.
+        
+        Reads through the CLOB locator instead of materializing the whole CLOB,
+        so memory stays bounded by chunk_size. The pooled connection is held
+        until the generator is exhausted or closed. Yields nothing if the
+        record does not exist or has no contents.
+        """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                select_sql = """
-                SELECT 
-                    FILE_ID,
-                    ORIGINAL_FILENAME,
-                    PROCESSING_STATUS,
-                    CREATED_BY_USER,
-                    CREATED_DATE,
-                    UPDATED_BY_USER,
-                    UPDATED_DATE,
-                    CLIENT_ID,
-                    CLIENT_NAME,
-                    FILE_UPLOAD_FOLDER,
-                    FILE_UPLOAD_FILENAME,
-                    MEMO
-                FROM ACH_FILES 
-                WHERE NOT (ORIGINAL_FILENAME LIKE 'FEDACHOUT%' OR ORIGINAL_FILENAME LIKE '%.pdf')
-                ORDER BY CREATED_DATE DESC
-                OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY
-                """
-                
-                cursor.execute(select_sql, {'limit': limit, 'offset': offset})
-                rows = cursor.fetchall()
-                
-                files = []
-                for row in rows:
-                    # FILE_CONTENTS is excluded from list query to avoid CLOB reading issues
-                    # Use get_ach_file(file_id) to retrieve individual file contents
-                    files.append(AchFileResponse(
-                        file_id=row[0],
-                        original_filename=row[1],
-                        processing_status=row[2],
-                        file_contents=None,  # Excluded from list query
-                        created_by_user=row[3],
-                        created_date=row[4],
-                        updated_by_user=row[5],
-                        updated_date=row[6],
-                        client_id=row[7],
-                        client_name=row[8],
-                        file_upload_folder=row[9],
-                        file_upload_filename=row[10],
-                        memo=row[11]
-                    ))
+                with conn.cursor() as cursor:
+                    size_fetch_for_page(cursor, 1)
+                    cursor.execute(SELECT_ACH_FILE_CLOB_SQL, {'file_id': file_id})
+                    row = cursor.fetchone()
+                    if not row or row[0] is None:
+                        return
+                    
+                    clob = row[0]
+                    # LOB offsets are 1-based and counted in characters for CLOBs
+                    offset = 1
+                    while True:
+                        chunk = clob.read(offset, chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+                        offset += len(chunk)
                 
-                logger.info(f"Retrieved {len(files)} ACH_FILES records")
-                return files
+        except Exception as e:
+            logger.error(f"Failed to stream ACH_FILES contents for {file_id}: {e}")
+            raise
+    
+    def _get_ach_files_raw(
+        self,
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[datetime, int]]
+    ) -> List[AchFileRow]:
+        """Fetch one page of ACH_FILES metadata as plain rows."""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                _execute_ach_files_page(cursor, limit, offset, after)
+                cursor.rowfactory = AchFileRow._make
+                return cursor.fetchall()
+    
+    def get_ach_files(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[AchFileResponse]:
+        """Get list of ACH_FILES records, excluding files starting with 'FEDACHOUT' or ending with '.pdf'.
+        
+        Rows are ordered by CREATED_DATE DESC, FILE_ID DESC. Pass
+        after=(created_date, file_id) of the last row of the previous page to
+        use keyset pagination instead of offset.
+        """
+        try:
+            rows = self._get_ach_files_raw(limit, offset, after)
+            
+            # FILE_CONTENTS is excluded from list query to avoid CLOB reading issues
+            # Use get_ach_file(file_id) to retrieve individual file contents.
+            # Rows come straight from typed columns, so model validation is skipped.
+            files = [AchFileResponse.model_construct(file_contents=None, **row._asdict()) for row in rows]
+            
+            logger.info(f"Retrieved {len(files)} ACH_FILES records")
+            return files
+            
+        except Exception as e:
+            logger.error(f"Failed to get ACH_FILES records: {e}")
+            raise
+    
+    def list_ach_files(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[AchFileSummary]:
+        """Get metadata-only ACH_FILES records for list views.
+        
+        Same filter, ordering and pagination as get_ach_files. Use
+        get_ach_file(file_id) or stream_ach_file_contents(file_id) for the
+        contents of one file.
+        """
+        try:
+            rows = self._get_ach_files_raw(limit, offset, after)
+            
+            # Rows come straight from typed columns, so model validation is skipped
+            files = [AchFileSummary.model_construct(**row._asdict()) for row in rows]
+            
+            logger.info(f"Retrieved {len(files)} ACH_FILES summaries")
+            return files
+            
+        except Exception as e:
+            logger.error(f"Failed to list ACH_FILES records: {e}")
+            raise
+    
+    def list_ach_files_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> Tuple[List[AchFileSummary], bool]:
+        """Get one page of list_ach_files plus whether another page follows.
+        
+        Fetches limit + 1 rows and reports has_more from the extra row, so a
+        "next page" check needs no COUNT(*) over the table.
+        """
+        files = self.list_ach_files(limit=limit + 1, offset=offset, after=after)
+        return files[:limit], len(files) > limit
+    
+    def iter_ach_files(self, batch_size: int = 500) -> Iterator[AchFileSummary]:
+        """Yield every list_ach_files record, in the same order, for exports.
+        
+        Rows are fetched batch_size at a time from one open cursor, so memory
+        stays bounded by the batch instead of the table. The pooled connection
+        is held until the generator is exhausted or closed.
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.arraysize = batch_size
+                    cursor.prefetchrows = batch_size
+                    cursor.execute(SELECT_ALL_ACH_FILES_SQL)
+                    cursor.rowfactory = AchFileRow._make
+                    
+                    for row in cursor:
+                        yield AchFileSummary.model_construct(**row._asdict())
                 
         except Exception as e:
-            logger.error(f"Failed to get ACH_FILES records: {e}")
+            logger.error(f"Failed to iterate ACH_FILES records: {e}")
             raise
     
     def update_ach_file(self, file_id: int, ach_file: AchFileUpdate) -> bool:
         """Update an ACH_FILES record.
         
-        For large CLOB updates (>1MB), uses DBMS_LOB to reduce PGA memory usage.
-        This prevents ORA-04036 errors when updating large file contents.
+        FILE_CONTENTS is bound as a CLOB. Contents over 500KB are instead reset to
+        EMPTY_CLOB() in the same UPDATE as the other columns and appended from
+        staged VARCHAR2 fragments. This prevents ORA-04036 errors when updating
+        large file contents.
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Check if we need to update FILE_CONTENTS (large CLOB)
-                # Use more conservative threshold (500KB) and check both string length and encoded size
-                if ach_file.file_contents:
-                    # Check both character length and byte size to be safe
-                    char_length = len(ach_file.file_contents)
-                    byte_size = len(ach_file.file_contents.encode('utf-8'))
-                    file_contents_size = max(char_length, byte_size)
-                else:
-                    file_contents_size = 0
-                # Lower threshold to 500KB to be more conservative and prevent edge cases
-                use_lob_update = file_contents_size > 512 * 1024  # 500KB threshold
-                
-                # If updating large CLOB, use DBMS_LOB approach
-                if ach_file.file_contents is not None and use_lob_update:
-                    # First, update non-CLOB fields
-                    update_fields = []
-                    params = {'file_id': file_id}
-                    
-                    if ach_file.processing_status is not None:
-                        update_fields.append("PROCESSING_STATUS = :processing_status")
-                        params['processing_status'] = ach_file.processing_status
-                    
-                    if ach_file.updated_by_user is not None:
-                        update_fields.append("UPDATED_BY_USER = :updated_by_user")
-                        params['updated_by_user'] = ach_file.updated_by_user
-                    
-                    if ach_file.client_id is not None:
-                        update_fields.append("CLIENT_ID = :client_id")
-                        params['client_id'] = ach_file.client_id
-                    
-                    if ach_file.client_name is not None:
-                        update_fields.append("CLIENT_NAME = :client_name")
-                        params['client_name'] = ach_file.client_name
-                    
-                    if ach_file.file_upload_folder is not None:
-                        update_fields.append("FILE_UPLOAD_FOLDER = :file_upload_folder")
-                        params['file_upload_folder'] = ach_file.file_upload_folder
-                    
-                    if ach_file.file_upload_filename is not None:
-                        update_fields.append("FILE_UPLOAD_FILENAME = :file_upload_filename")
-                        params['file_upload_filename'] = ach_file.file_upload_filename
-                    
-                    if ach_file.memo is not None:
-                        update_fields.append("MEMO = :memo")
-                        params['memo'] = ach_file.memo
-                    
-                    if update_fields:
-                        update_fields.append("UPDATED_DATE = CURRENT_TIMESTAMP")
-                        update_sql = f"""
-                        UPDATE ACH_FILES 
-                        SET {', '.join(update_fields)}
-                        WHERE FILE_ID = :file_id
-                        """
-                        cursor.execute(update_sql, params)
-                    
-                    # Now update CLOB using DBMS_LOB (chunked, memory-efficient)
-                    # Get the CLOB locator and write in chunks to avoid PGA memory issues
-                    get_lob_sql = """
-                    SELECT FILE_CONTENTS 
-                    FROM ACH_FILES
-                    WHERE FILE_ID = :file_id
-                    FOR UPDATE
-                    """
-                    cursor.execute(get_lob_sql, {'file_id': file_id})
-                    row = cursor.fetchone()
-                    if not row:
-                        return False
-                    
-                    clob = row[0]
-                    
-                    # Truncate existing content
-                    cursor.execute("BEGIN DBMS_LOB.TRUNCATE(:clob, 0); END;", {'clob': clob})
+                with conn.cursor() as cursor:
+                    # Columns bound as None keep their stored value via COALESCE
+                    params = {
+                        'file_id': file_id,
+                        'processing_status': ach_file.processing_status,
+                        'file_contents': ach_file.file_contents,
+                        'updated_by_user': ach_file.updated_by_user,
+                        'client_id': ach_file.client_id,
+                        'client_name': ach_file.client_name,
+                        'file_upload_folder': ach_file.file_upload_folder,
+                        'file_upload_filename': ach_file.file_upload_filename,
+                        'memo': ach_file.memo
+                    }
                     
-                    # Write in 32KB chunks to avoid PGA memory issues
-                    chunk_size = 32767  # Oracle VARCHAR2 max size
-                    file_contents = ach_file.file_contents
-                    offset = 0
-                    total_length = len(file_contents)
+                    if all(value is None for key, value in params.items() if key != 'file_id'):
+                        return False  # No fields to update
                     
-                    while offset < total_length:
-                        chunk = file_contents[offset:offset + chunk_size]
-                        chunk_length = len(chunk)
-                        cursor.execute(
-                            "BEGIN DBMS_LOB.WRITEAPPEND(:clob, :amount, :buffer); END;",
-                            {'clob': clob, 'amount': chunk_length, 'buffer': chunk}
-                        )
-                        offset += chunk_length
+                    if needs_lob(ach_file.file_contents):
+                        del params['file_contents']
+                        cursor.execute(UPDATE_ACH_FILE_RESET_CLOB_SQL, params)
+                        if cursor.rowcount == 0:
+                            return False
+                        
+                        _stage_file_contents(cursor, file_id, ach_file.file_contents)
+                        conn.commit()
+                        self._invalidate_ach_files([file_id])
+                        
+                        logger.info(f"Updated ACH_FILES record {file_id} with large CLOB from staged fragments")
+                        return True
                     
+                    # Bind FILE_CONTENTS as a CLOB so COALESCE compares like types
+                    cursor.setinputsizes(file_contents=oracledb.DB_TYPE_CLOB)
+                    cursor.execute(UPDATE_ACH_FILE_SQL, params)
                     conn.commit()
-                    logger.info(f"Updated ACH_FILES record {file_id} with large CLOB ({file_contents_size} bytes) using DBMS_LOB")
-                    return True
-                
-                # For small CLOBs or no CLOB update, use standard UPDATE
-                update_fields = []
-                params = {'file_id': file_id}
-                
-                if ach_file.processing_status is not None:
-                    update_fields.append("PROCESSING_STATUS = :processing_status")
-                    params['processing_status'] = ach_file.processing_status
-                
-                if ach_file.file_contents is not None:
-                    update_fields.append("FILE_CONTENTS = :file_contents")
-                    params['file_contents'] = ach_file.file_contents
-                
-                if ach_file.updated_by_user is not None:
-                    update_fields.append("UPDATED_BY_USER = :updated_by_user")
-                    params['updated_by_user'] = ach_file.updated_by_user
-                
-                if ach_file.client_id is not None:
-                    update_fields.append("CLIENT_ID = :client_id")
-                    params['client_id'] = ach_file.client_id
-                
-                if ach_file.client_name is not None:
-                    update_fields.append("CLIENT_NAME = :client_name")
-                    params['client_name'] = ach_file.client_name
-                
-                if ach_file.file_upload_folder is not None:
-                    update_fields.append("FILE_UPLOAD_FOLDER = :file_upload_folder")
-                    params['file_upload_folder'] = ach_file.file_upload_folder
-                
-                if ach_file.file_upload_filename is not None:
-                    update_fields.append("FILE_UPLOAD_FILENAME = :file_upload_filename")
-                    params['file_upload_filename'] = ach_file.file_upload_filename
-                
-                if ach_file.memo is not None:
-                    update_fields.append("MEMO = :memo")
-                    params['memo'] = ach_file.memo
-                
-                if not update_fields:
-                    return False  # No fields to update
-                
-                update_fields.append("UPDATED_DATE = CURRENT_TIMESTAMP")
-                
-                update_sql = f"""
-                UPDATE ACH_FILES 
-                SET {', '.join(update_fields)}
-                WHERE FILE_ID = :file_id
-                """
-                
-                cursor.execute(update_sql, params)
-                conn.commit()
-                
-                rows_affected = cursor.rowcount
-                logger.info(f"Updated ACH_FILES record {file_id}, rows affected: {rows_affected}")
-                return rows_affected > 0
+                    self._invalidate_ach_files([file_id])
+                    
+                    rows_affected = cursor.rowcount
+                    logger.info(f"Updated ACH_FILES record {file_id}, rows affected: {rows_affected}")
+                    return rows_affected > 0
                 
         except Exception as e:
             logger.error(f"Failed to update ACH_FILES record {file_id}: {e}")
@@ -558,179 +1414,134 @@ class OracleService:
     ) -> bool:
         """Update ACH_FILES record by file_id with file_contents, updated_by_user, and updated_date.
         
-        For large CLOB updates (>1MB), uses DBMS_LOB to reduce PGA memory usage.
+        Contents over 500KB reset FILE_CONTENTS to EMPTY_CLOB() and are appended
+        from staged VARCHAR2 fragments; smaller contents are bound as a CLOB.
         This prevents ORA-04036 errors when updating large file contents.
         """
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Check file size to determine update method
-                # Use more conservative threshold (500KB) and check both string length and encoded size
-                char_length = len(file_contents)
-                byte_size = len(file_contents.encode('utf-8'))
-                file_contents_size = max(char_length, byte_size)
-                # Lower threshold to 500KB to be more conservative and prevent edge cases
-                use_lob_update = file_contents_size > 512 * 1024  # 500KB threshold
-                
-                if use_lob_update:
-                    # Update non-CLOB fields first
-                    if updated_date is not None:
-                        update_sql = """
-                        UPDATE ACH_FILES 
-                        SET UPDATED_BY_USER = :updated_by_user,
-                            UPDATED_DATE = :updated_date
-                        WHERE FILE_ID = :file_id
-                        """
-                        cursor.execute(update_sql, {
-                            'file_id': file_id,
-                            'updated_by_user': updated_by_user,
-                            'updated_date': updated_date
-                        })
-                    else:
-                        update_sql = """
-                        UPDATE ACH_FILES 
-                        SET UPDATED_BY_USER = :updated_by_user,
-                            UPDATED_DATE = CURRENT_TIMESTAMP
-                        WHERE FILE_ID = :file_id
-                        """
-                        cursor.execute(update_sql, {
+                with conn.cursor() as cursor:
+                    if needs_lob(file_contents):
+                        params = {
                             'file_id': file_id,
                             'updated_by_user': updated_by_user
-                        })
-                    
-                    # Update CLOB using DBMS_LOB (chunked, memory-efficient)
-                    # Get the CLOB locator and write in chunks to avoid PGA memory issues
-                    get_lob_sql = """
-                    SELECT FILE_CONTENTS 
-                    FROM ACH_FILES
-                    WHERE FILE_ID = :file_id
-                    FOR UPDATE
-                    """
-                    cursor.execute(get_lob_sql, {'file_id': file_id})
-                    row = cursor.fetchone()
-                    if not row:
-                        return False
-                    
-                    clob = row[0]
-                    
-                    # Truncate existing content
-                    cursor.execute("BEGIN DBMS_LOB.TRUNCATE(:clob, 0); END;", {'clob': clob})
-                    
-                    # Write in 32KB chunks to avoid PGA memory issues
-                    chunk_size = 32767  # Oracle VARCHAR2 max size
-                    offset = 0
-                    total_length = len(file_contents)
-                    
-                    while offset < total_length:
-                        chunk = file_contents[offset:offset + chunk_size]
-                        chunk_length = len(chunk)
-                        cursor.execute(
-                            "BEGIN DBMS_LOB.WRITEAPPEND(:clob, :amount, :buffer); END;",
-                            {'clob': clob, 'amount': chunk_length, 'buffer': chunk}
-                        )
-                        offset += chunk_length
+                        }
+                        if updated_date is not None:
+                            params['updated_date'] = updated_date
+                            cursor.execute(EMPTY_ACH_FILE_CONTENTS_SQL, params)
+                        else:
+                            cursor.execute(EMPTY_ACH_FILE_CONTENTS_NOW_SQL, params)
+                        
+                        if cursor.rowcount == 0:
+                            return False
+                        
+                        _stage_file_contents(cursor, file_id, file_contents)
+                        conn.commit()
+                        self._invalidate_ach_files([file_id])
+                        
+                        logger.info(f"Updated ACH_FILES record {file_id} by file_id from staged fragments")
+                        return True
                     
-                    conn.commit()
-                    logger.info(f"Updated ACH_FILES record {file_id} with large CLOB ({file_contents_size} bytes) using DBMS_LOB")
-                    return True
-                
-                # For small CLOBs, use standard UPDATE
-                if updated_date is not None:
-                    update_sql = """
-                    UPDATE ACH_FILES 
-                    SET FILE_CONTENTS = :file_contents,
-                        UPDATED_BY_USER = :updated_by_user,
-                        UPDATED_DATE = :updated_date
-                    WHERE FILE_ID = :file_id
-                    """
                     params = {
                         'file_id': file_id,
                         'file_contents': file_contents,
-                        'updated_by_user': updated_by_user,
-                        'updated_date': updated_date
+                        'updated_by_user': updated_by_user
                     }
-                else:
-                    update_sql = """
-                    UPDATE ACH_FILES 
-                    SET FILE_CONTENTS = :file_contents,
-                        UPDATED_BY_USER = :updated_by_user,
-                        UPDATED_DATE = CURRENT_TIMESTAMP
-                    WHERE FILE_ID = :file_id
-                    """
+                    if updated_date is not None:
+                        update_sql = UPDATE_ACH_FILE_CONTENTS_SQL
+                        params['updated_date'] = updated_date
+                    else:
+                        update_sql = UPDATE_ACH_FILE_CONTENTS_NOW_SQL
+                    
+                    cursor.setinputsizes(file_contents=oracledb.DB_TYPE_CLOB)
+                    cursor.execute(update_sql, params)
+                    conn.commit()
+                    self._invalidate_ach_files([file_id])
+                    
+                    rows_affected = cursor.rowcount
+                    logger.info(f"Updated ACH_FILES record {file_id} by file_id, rows affected: {rows_affected}")
+                    return rows_affected > 0
+                
+        except Exception as e:
+            logger.error(f"Failed to update ACH_FILES record {file_id} by file_id: {e}")
+            raise
+    
+    def update_ach_file_by_file_id_stream(
+        self,
+        file_id: int,
+        chunks: Iterable[str],
+        updated_by_user: str = "system-user",
+        updated_date: Optional[datetime] = None
+    ) -> bool:
+        """Update ACH_FILES.FILE_CONTENTS by file_id from an iterable of text chunks.
+        
+        FILE_CONTENTS is reset to EMPTY_CLOB() in the same UPDATE that sets the
+        audit columns, and the chunks are written through the returned LOB locator
+        as they arrive, about 1M characters per write (see _write_clob_chunks). A
+        file can be streamed with ``iter(lambda: fh.read(1 << 20), '')`` or by
+        passing the file object itself.
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    file_contents_clob = cursor.var(oracledb.DB_TYPE_CLOB)
                     params = {
                         'file_id': file_id,
-                        'file_contents': file_contents,
-                        'updated_by_user': updated_by_user
+                        'updated_by_user': updated_by_user,
+                        'file_contents_clob': file_contents_clob
                     }
-                
-                cursor.execute(update_sql, params)
-                conn.commit()
-                
-                rows_affected = cursor.rowcount
-                logger.info(f"Updated ACH_FILES record {file_id} by file_id, rows affected: {rows_affected}")
-                return rows_affected > 0
+                    if updated_date is not None:
+                        params['updated_date'] = updated_date
+                        cursor.execute(RESET_ACH_FILE_CLOB_SQL, params)
+                    else:
+                        cursor.execute(RESET_ACH_FILE_CLOB_NOW_SQL, params)
+                    
+                    returned_clobs = file_contents_clob.getvalue()
+                    if not returned_clobs:
+                        return False
+                    
+                    written = _write_clob_chunks(returned_clobs[0], chunks)
+                    
+                    conn.commit()
+                    self._invalidate_ach_files([file_id])
+                    logger.info(f"Updated ACH_FILES record {file_id} with streamed CLOB ({written} characters)")
+                    return True
                 
         except Exception as e:
-            logger.error(f"Failed to update ACH_FILES record {file_id} by file_id: {e}")
+            logger.error(f"Failed to stream update ACH_FILES record {file_id}: {e}")
             raise
     
     def get_audit_ach_files_by_file_id(self, file_id: int) -> List[Dict[str, Any]]:
         """Get AUDIT_ACH_FILES records for a specific file_id."""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                select_sql = """
-                SELECT 
-                    AUDIT_ID,
-                    FILE_ID,
-                    ORIGINAL_FILENAME,
-                    PROCESSING_STATUS,
-                    FILE_CONTENTS,
-                    CREATED_BY_USER,
-                    CREATED_DATE,
-                    UPDATED_BY_USER,
-                    UPDATED_DATE,
-                    CLIENT_ID,
-                    CLIENT_NAME,
-                    FILE_UPLOAD_FOLDER,
-                    FILE_UPLOAD_FILENAME,
-                    MEMO
-                FROM AUDIT_ACH_FILES 
-                WHERE FILE_ID = :file_id
-                ORDER BY AUDIT_ID DESC
-                """
-                
-                cursor.execute(select_sql, {'file_id': file_id})
-                rows = cursor.fetchall()
-                
-                audit_records = []
-                for row in rows:
-                    # Handle CLOB data - convert LOB to string
-                    file_contents = row[4]
-                    if hasattr(file_contents, 'read'):
-                        file_contents = file_contents.read()
+                with conn.cursor() as cursor:
+                    cursor.outputtypehandler = clob_as_string_handler
                     
-                    audit_records.append({
-                        'audit_id': row[0],
-                        'file_id': row[1],
-                        'original_filename': row[2],
-                        'processing_status': row[3],
-                        'file_contents': file_contents,
-                        'created_by_user': row[5],
-                        'created_date': row[6],
-                        'updated_by_user': row[7],
-                        'updated_date': row[8],
-                        'client_id': row[9],
-                        'client_name': row[10],
-                        'file_upload_folder': row[11],
-                        'file_upload_filename': row[12],
-                        'memo': row[13]
-                    })
-                
-                logger.info(f"Retrieved {len(audit_records)} AUDIT_ACH_FILES records for FILE_ID: {file_id}")
-                return audit_records
+                    cursor.execute(SELECT_AUDIT_ACH_FILES_SQL, {'file_id': file_id})
+                    
+                    audit_records = [
+                        {
+                            'audit_id': row[0],
+                            'file_id': row[1],
+                            'original_filename': row[2],
+                            'processing_status': row[3],
+                            'file_contents': row[4],
+                            'created_by_user': row[5],
+                            'created_date': row[6],
+                            'updated_by_user': row[7],
+                            'updated_date': row[8],
+                            'client_id': row[9],
+                            'client_name': row[10],
+                            'file_upload_folder': row[11],
+                            'file_upload_filename': row[12],
+                            'memo': row[13]
+                        }
+                        for row in cursor
+                    ]
+                    
+                    logger.info(f"Retrieved {len(audit_records)} AUDIT_ACH_FILES records for FILE_ID: {file_id}")
+                    return audit_records
                 
         except Exception as e:
             logger.error(f"Failed to get AUDIT_ACH_FILES records for FILE_ID {file_id}: {e}")
@@ -738,44 +1549,82 @@ class OracleService:
     
     def delete_ach_file(self, file_id: int) -> bool:
         """Delete an ACH_FILES record."""
+        return self.delete_ach_files([file_id]) > 0
+    
+    def delete_ach_files(self, file_ids: List[int]) -> int:
+        """Delete ACH_FILES records in one batched round-trip and one commit.
+        
+        Returns the total number of rows deleted.
+        """
+        if not file_ids:
+            return 0
+        
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                delete_sql = "DELETE FROM ACH_FILES WHERE FILE_ID = :file_id"
-                cursor.execute(delete_sql, {'file_id': file_id})
-                conn.commit()
-                
-                rows_affected = cursor.rowcount
-                logger.info(f"Deleted ACH_FILES record {file_id}, rows affected: {rows_affected}")
-                return rows_affected > 0
+                with conn.cursor() as cursor:
+                    cursor.executemany(DELETE_ACH_FILE_SQL, [{'file_id': file_id} for file_id in file_ids])
+                    conn.commit()
+                    self._invalidate_ach_files(file_ids)
+                    self._ach_files_count_cache = None
+                    
+                    rows_affected = cursor.rowcount
+                    logger.info(f"Deleted ACH_FILES records {file_ids}, rows affected: {rows_affected}")
+                    return rows_affected
                 
         except Exception as e:
-            logger.error(f"Failed to delete ACH_FILES record {file_id}: {e}")
+            logger.error(f"Failed to delete ACH_FILES records {file_ids}: {e}")
             raise
     
     def get_ach_files_count(self) -> int:
-        """Get total count of ACH_FILES records, excluding files starting with 'FEDACHOUT' or ending with '.pdf'."""
+        """Get total count of ACH_FILES records, excluding files starting with 'FEDACHOUT' or ending with '.pdf'.
+        
+        Polled by the list endpoint, so the count is cached for
+        config.count_cache_ttl seconds and reset by this service's inserts
+        and deletes.
+        """
+        cached = self._ach_files_count_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                count_sql = """
-                SELECT COUNT(*) 
-                FROM ACH_FILES 
-                WHERE NOT (ORIGINAL_FILENAME LIKE 'FEDACHOUT%' OR ORIGINAL_FILENAME LIKE '%.pdf')
-                """
-                cursor.execute(count_sql)
-                count = cursor.fetchone()[0]
-                
-                return count
+                with conn.cursor() as cursor:
+                    cursor.execute(COUNT_ACH_FILES_SQL)
+                    count = cursor.fetchone()[0]
+                    
+                    if self.config.count_cache_ttl > 0:
+                        self._ach_files_count_cache = (time.monotonic() + self.config.count_cache_ttl, count)
+                    
+                    return count
                 
         except Exception as e:
             logger.error(f"Failed to get ACH_FILES count: {e}")
             raise
     
     def get_active_clients(self) -> List[Dict[str, Any]]:
-        """Get active clients from ACH_CLIENTS table where CLIENT_STATUS = 'Active'."""
+        """Get active clients from ACH_CLIENTS table where CLIENT_STATUS = 'Active'.
+        
+        The list changes rarely, so it is cached in-process for
+        config.clients_cache_ttl seconds.
+        """
+        clients, _ = self._load_active_clients()
+        return list(clients)
+    
+    def find_active_client(self, client_id: str) -> Optional[Dict[str, Any]]:
+        """Get an active ACH_CLIENTS record by CLIENT_ID, or None if the client is not active.
+        
+        Served from the get_active_clients cache, so repeated lookups are a
+        dict access instead of a scan of the client list.
+        """
+        client = self._load_active_clients()[1].get(client_id)
+        return dict(client) if client is not None else None
+    
+    def _load_active_clients(self) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Return the active clients, and the same records keyed by CLIENT_ID, from the cache or ACH_CLIENTS."""
+        cached = self._active_clients_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1], cached[2]
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -789,23 +1638,27 @@ class OracleService:
                 ORDER BY CLIENT_NAME
                 """
                 
+                size_fetch_for_page(cursor, self.config.fetch_array_size)
                 cursor.execute(select_sql)
-                rows = cursor.fetchall()
                 
-                clients = []
-                for row in rows:
-                    clients.append({
-                        'client_id': str(row[0]),
-                        'client_name': row[1]
-                    })
+                clients = [{'client_id': str(row[0]), 'client_name': row[1]} for row in cursor]
+                clients_by_id = {client['client_id']: client for client in clients}
+                
+                if self.config.clients_cache_ttl > 0:
+                    self._active_clients_cache = (time.monotonic() + self.config.clients_cache_ttl, clients, clients_by_id)
                 
                 logger.info(f"Retrieved {len(clients)} active clients from ACH_CLIENTS")
-                return clients
+                return clients, clients_by_id
                 
         except Exception as e:
             logger.error(f"Failed to get active clients: {e}")
             raise
     
+    def _clear_auth_cache(self) -> None:
+        """Drop cached authenticate_user results after API_USERS changes."""
+        with self._auth_cache_lock:
+            self._auth_cache.clear()
+    
     def authenticate_user(self, email: str, password: str) -> Dict[str, Any]:
         """
         Authenticate user with email and plain password using bcrypt verification.
@@ -825,19 +1678,35 @@ class OracleService:
             Dictionary with:
             - authenticated: bool - True if password matches stored hash
             - is_admin: bool - True if user is admin (only when authenticated=True)
+        
+        Successful logins are remembered for config.auth_cache_ttl seconds, so
+        clients that log in on every request skip the bcrypt check while the
+        stored hash is unchanged. The user record is still read on every call,
+        so IS_ACTIVE and IS_ADMIN changes apply at once. update_api_user and
+        delete_api_user clear the cache.
         """
+        # Encoded once for both the cache key and the bcrypt check
+        password_bytes = password.encode('utf-8')
+        cache_key = (
+            email.upper(),
+            hmac.new(self._auth_cache_key, password_bytes, hashlib.sha256).digest()
+        )
+        cached_hash_digest = None
+        with self._auth_cache_lock:
+            cached = self._auth_cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic() < cached[0]:
+                    self._auth_cache.move_to_end(cache_key)
+                    cached_hash_digest = cached[1]
+                else:
+                    del self._auth_cache[cache_key]
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Get user record with stored password hash
-                select_sql = """
-                SELECT PASSWORD_HASH, IS_ADMIN, IS_ACTIVE
-                FROM API_USERS
-                WHERE UPPER(EMAIL) = UPPER(:email)
-                """
-                
-                cursor.execute(select_sql, {'email': email})
+                cursor.execute(_SELECT_API_USER_AUTH_SQL, {'email_upper': email.upper()})
                 result = cursor.fetchone()
                 
                 # Check if user exists
@@ -858,23 +1727,36 @@ class OracleService:
                         'is_admin': False
                     }
                 
-                # Use bcrypt to verify password against stored hash
-                # This is the standard, secure way to validate passwords
-                # Use bcrypt directly to avoid passlib compatibility issues
-                try:
-                    # Encode password to bytes for bcrypt
-                    password_bytes = password.encode('utf-8')
-                    hash_bytes = stored_hash.encode('utf-8')
-                    password_matches = bcrypt.checkpw(password_bytes, hash_bytes)
-                except Exception as verify_error:
-                    logger.error(f"Bcrypt verification error: {verify_error}")
-                    password_matches = False
+                # Only an HMAC of the stored hash is cached, compared in constant time
+                hash_digest = hmac.new(self._auth_cache_key, stored_hash.encode('utf-8'), hashlib.sha256).digest()
+                cache_hit = cached_hash_digest is not None and hmac.compare_digest(cached_hash_digest, hash_digest)
+                if cache_hit:
+                    # This password was verified against the same stored hash recently
+                    password_matches = True
+                else:
+                    # Use bcrypt to verify password against stored hash
+                    # This is the standard, secure way to validate passwords
+                    # Use bcrypt directly to avoid passlib compatibility issues
+                    try:
+                        # bcrypt hashes are ASCII
+                        hash_bytes = stored_hash.encode('ascii')
+                        password_matches = bcrypt.checkpw(password_bytes, hash_bytes)
+                    except Exception as verify_error:
+                        logger.error(f"Bcrypt verification error: {verify_error}")
+                        password_matches = False
                 
                 if password_matches:
                     logger.info(f"Authentication successful for: {email} (IS_ADMIN: {is_admin})")
+                    is_admin = bool(is_admin) if is_admin is not None else False
+                    if self.config.auth_cache_ttl > 0 and not cache_hit:
+                        with self._auth_cache_lock:
+                            self._auth_cache[cache_key] = (time.monotonic() + self.config.auth_cache_ttl, hash_digest)
+                            self._auth_cache.move_to_end(cache_key)
+                            while len(self._auth_cache) > _AUTH_CACHE_SIZE:
+                                self._auth_cache.popitem(last=False)
                     return {
                         'authenticated': True,
-                        'is_admin': bool(is_admin) if is_admin is not None else False
+                        'is_admin': is_admin
                     }
                 else:
                     logger.warning(f"Authentication failed: Invalid password for email: {email}")
@@ -895,40 +1777,10 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO ACH_FILE_HEADER (
-                        FILE_HEADER_ID, FILE_ID, RECORD_TYPE_CODE, PRIORITY_CODE,
-                        IMMEDIATE_DESTINATION, IMMEDIATE_ORIGIN, FILE_CREATION_DATE,
-                        FILE_CREATION_TIME, FILE_ID_MODIFIER, RECORD_SIZE,
-                        BLOCKING_FACTOR, FORMAT_CODE, IMMEDIATE_DEST_NAME,
-                        IMMEDIATE_ORIGIN_NAME, REFERENCE_CODE, RAW_RECORD
-                    ) VALUES (
-                        SEQ_FILE_HEADER.NEXTVAL, :file_id, :record_type_code, :priority_code,
-                        :immediate_destination, :immediate_origin, :file_creation_date,
-                        :file_creation_time, :file_id_modifier, :record_size,
-                        :blocking_factor, :format_code, :immediate_dest_name,
-                        :immediate_origin_name, :reference_code, :raw_record
-                    )
-                """, {
-                    'file_id': file_id,
-                    'record_type_code': record.record_type_code,
-                    'priority_code': record.priority_code,
-                    'immediate_destination': record.immediate_destination,
-                    'immediate_origin': record.immediate_origin,
-                    'file_creation_date': record.file_creation_date,
-                    'file_creation_time': record.file_creation_time,
-                    'file_id_modifier': record.file_id_modifier,
-                    'record_size': record.record_size,
-                    'blocking_factor': record.blocking_factor,
-                    'format_code': record.format_code,
-                    'immediate_dest_name': record.immediate_dest_name,
-                    'immediate_origin_name': record.immediate_origin_name,
-                    'reference_code': record.reference_code,
-                    'raw_record': record.raw_record
-                })
+                header_id_var = cursor.var(int)
+                cursor.execute(_INSERT_ACH_FILE_HEADER_SQL, _ach_file_header_params(file_id, record) + (header_id_var,))
                 conn.commit()
-                cursor.execute("SELECT SEQ_FILE_HEADER.CURRVAL FROM DUAL")
-                header_id = cursor.fetchone()[0]
+                header_id = header_id_var.getvalue()[0]
                 logger.info(f"Inserted ACH_FILE_HEADER record {header_id} for file_id {file_id}")
                 return header_id
         except Exception as e:
@@ -940,42 +1792,10 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO ACH_BATCH_HEADER (
-                        BATCH_HEADER_ID, FILE_ID, BATCH_NUMBER, RECORD_TYPE_CODE,
-                        SERVICE_CLASS_CODE, COMPANY_NAME, COMPANY_DISCRETIONARY_DATA,
-                        COMPANY_IDENTIFICATION, STANDARD_ENTRY_CLASS_CODE,
-                        COMPANY_ENTRY_DESCRIPTION, COMPANY_DESCRIPTIVE_DATE,
-                        EFFECTIVE_ENTRY_DATE, SETTLEMENT_DATE, ORIGINATOR_STATUS_CODE,
-                        ORIGINATING_DFI_ID, RAW_RECORD
-                    ) VALUES (
-                        SEQ_BATCH_HEADER.NEXTVAL, :file_id, :batch_number, :record_type_code,
-                        :service_class_code, :company_name, :company_discretionary_data,
-                        :company_identification, :standard_entry_class_code,
-                        :company_entry_description, :company_descriptive_date,
-                        :effective_entry_date, :settlement_date, :originator_status_code,
-                        :originating_dfi_id, :raw_record
-                    )
-                """, {
-                    'file_id': file_id,
-                    'batch_number': record.batch_number,
-                    'record_type_code': record.record_type_code,
-                    'service_class_code': record.service_class_code,
-                    'company_name': record.company_name,
-                    'company_discretionary_data': record.company_discretionary_data,
-                    'company_identification': record.company_identification,
-                    'standard_entry_class_code': record.standard_entry_class_code,
-                    'company_entry_description': record.company_entry_description,
-                    'company_descriptive_date': record.company_descriptive_date,
-                    'effective_entry_date': record.effective_entry_date,
-                    'settlement_date': record.settlement_date,
-                    'originator_status_code': record.originator_status_code,
-                    'originating_dfi_id': record.originating_dfi_id,
-                    'raw_record': record.raw_record
-                })
+                header_id_var = cursor.var(int)
+                cursor.execute(_INSERT_ACH_BATCH_HEADER_SQL, _ach_batch_header_params(file_id, record) + (header_id_var,))
                 conn.commit()
-                cursor.execute("SELECT SEQ_BATCH_HEADER.CURRVAL FROM DUAL")
-                header_id = cursor.fetchone()[0]
+                header_id = header_id_var.getvalue()[0]
                 logger.info(f"Inserted ACH_BATCH_HEADER record {header_id} for file_id {file_id}, batch {record.batch_number}")
                 return header_id
         except Exception as e:
@@ -987,43 +1807,10 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO ACH_ENTRY_DETAIL (
-                        ENTRY_DETAIL_ID, FILE_ID, BATCH_NUMBER, RECORD_TYPE_CODE,
-                        TRANSACTION_CODE, RECEIVING_DFI_ID, CHECK_DIGIT,
-                        DFI_ACCOUNT_NUMBER, AMOUNT, AMOUNT_DECIMAL,
-                        INDIVIDUAL_ID_NUMBER, INDIVIDUAL_NAME, DISCRETIONARY_DATA,
-                        ADDENDA_RECORD_INDICATOR, TRACE_NUMBER, TRACE_SEQUENCE_NUMBER,
-                        RAW_RECORD
-                    ) VALUES (
-                        SEQ_ENTRY_DETAIL.NEXTVAL, :file_id, :batch_number, :record_type_code,
-                        :transaction_code, :receiving_dfi_id, :check_digit,
-                        :dfi_account_number, :amount, :amount_decimal,
-                        :individual_id_number, :individual_name, :discretionary_data,
-                        :addenda_record_indicator, :trace_number, :trace_sequence_number,
-                        :raw_record
-                    )
-                """, {
-                    'file_id': file_id,
-                    'batch_number': record.batch_number,
-                    'record_type_code': record.record_type_code,
-                    'transaction_code': record.transaction_code,
-                    'receiving_dfi_id': record.receiving_dfi_id,
-                    'check_digit': record.check_digit,
-                    'dfi_account_number': record.dfi_account_number,
-                    'amount': record.amount,
-                    'amount_decimal': record.amount_decimal,
-                    'individual_id_number': record.individual_id_number,
-                    'individual_name': record.individual_name,
-                    'discretionary_data': record.discretionary_data,
-                    'addenda_record_indicator': record.addenda_record_indicator,
-                    'trace_number': record.trace_number,
-                    'trace_sequence_number': record.trace_sequence_number,
-                    'raw_record': record.raw_record
-                })
+                entry_id_var = cursor.var(int)
+                cursor.execute(_INSERT_ACH_ENTRY_DETAIL_SQL, _ach_entry_detail_params(file_id, record) + (entry_id_var,))
                 conn.commit()
-                cursor.execute("SELECT SEQ_ENTRY_DETAIL.CURRVAL FROM DUAL")
-                entry_id = cursor.fetchone()[0]
+                entry_id = entry_id_var.getvalue()[0]
                 logger.info(f"Inserted ACH_ENTRY_DETAIL record {entry_id} for file_id {file_id}, batch {record.batch_number}")
                 return entry_id
         except Exception as e:
@@ -1035,30 +1822,10 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO ACH_ADDENDA (
-                        ADDENDA_ID, FILE_ID, ENTRY_DETAIL_ID, BATCH_NUMBER,
-                        RECORD_TYPE_CODE, ADDENDA_TYPE_CODE, PAYMENT_RELATED_INFO,
-                        ADDENDA_SEQUENCE_NUMBER, ENTRY_DETAIL_SEQUENCE_NUM, RAW_RECORD
-                    ) VALUES (
-                        SEQ_ADDENDA.NEXTVAL, :file_id, :entry_detail_id, :batch_number,
-                        :record_type_code, :addenda_type_code, :payment_related_info,
-                        :addenda_sequence_number, :entry_detail_sequence_num, :raw_record
-                    )
-                """, {
-                    'file_id': file_id,
-                    'entry_detail_id': entry_detail_id,
-                    'batch_number': record.batch_number,
-                    'record_type_code': record.record_type_code,
-                    'addenda_type_code': record.addenda_type_code,
-                    'payment_related_info': record.payment_related_info,
-                    'addenda_sequence_number': record.addenda_sequence_number,
-                    'entry_detail_sequence_num': record.entry_detail_sequence_num,
-                    'raw_record': record.raw_record
-                })
+                addenda_id_var = cursor.var(int)
+                cursor.execute(_INSERT_ACH_ADDENDA_SQL, _ach_addenda_params(file_id, record, entry_detail_id) + (addenda_id_var,))
                 conn.commit()
-                cursor.execute("SELECT SEQ_ADDENDA.CURRVAL FROM DUAL")
-                addenda_id = cursor.fetchone()[0]
+                addenda_id = addenda_id_var.getvalue()[0]
                 logger.info(f"Inserted ACH_ADDENDA record {addenda_id} for file_id {file_id}, batch {record.batch_number}")
                 return addenda_id
         except Exception as e:
@@ -1070,42 +1837,10 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO ACH_BATCH_CONTROL (
-                        BATCH_CONTROL_ID, FILE_ID, BATCH_NUMBER, RECORD_TYPE_CODE,
-                        SERVICE_CLASS_CODE, ENTRY_ADDENDA_COUNT, ENTRY_HASH,
-                        TOTAL_DEBIT_AMOUNT, TOTAL_DEBIT_AMOUNT_DECIMAL,
-                        TOTAL_CREDIT_AMOUNT, TOTAL_CREDIT_AMOUNT_DECIMAL,
-                        COMPANY_IDENTIFICATION, MESSAGE_AUTH_CODE, RESERVED,
-                        ORIGINATING_DFI_ID, RAW_RECORD
-                    ) VALUES (
-                        SEQ_BATCH_CONTROL.NEXTVAL, :file_id, :batch_number, :record_type_code,
-                        :service_class_code, :entry_addenda_count, :entry_hash,
-                        :total_debit_amount, :total_debit_amount_decimal,
-                        :total_credit_amount, :total_credit_amount_decimal,
-                        :company_identification, :message_auth_code, :reserved,
-                        :originating_dfi_id, :raw_record
-                    )
-                """, {
-                    'file_id': file_id,
-                    'batch_number': record.batch_number,
-                    'record_type_code': record.record_type_code,
-                    'service_class_code': record.service_class_code,
-                    'entry_addenda_count': record.entry_addenda_count,
-                    'entry_hash': record.entry_hash,
-                    'total_debit_amount': record.total_debit_amount,
-                    'total_debit_amount_decimal': record.total_debit_amount_decimal,
-                    'total_credit_amount': record.total_credit_amount,
-                    'total_credit_amount_decimal': record.total_credit_amount_decimal,
-                    'company_identification': record.company_identification,
-                    'message_auth_code': record.message_auth_code,
-                    'reserved': record.reserved,
-                    'originating_dfi_id': record.originating_dfi_id,
-                    'raw_record': record.raw_record
-                })
+                control_id_var = cursor.var(int)
+                cursor.execute(_INSERT_ACH_BATCH_CONTROL_SQL, _ach_batch_control_params(file_id, record) + (control_id_var,))
                 conn.commit()
-                cursor.execute("SELECT SEQ_BATCH_CONTROL.CURRVAL FROM DUAL")
-                control_id = cursor.fetchone()[0]
+                control_id = control_id_var.getvalue()[0]
                 logger.info(f"Inserted ACH_BATCH_CONTROL record {control_id} for file_id {file_id}, batch {record.batch_number}")
                 return control_id
         except Exception as e:
@@ -1117,37 +1852,10 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO ACH_FILE_CONTROL (
-                        FILE_CONTROL_ID, FILE_ID, RECORD_TYPE_CODE, BATCH_COUNT,
-                        BLOCK_COUNT, ENTRY_ADDENDA_COUNT, ENTRY_HASH,
-                        TOTAL_DEBIT_AMOUNT, TOTAL_DEBIT_AMOUNT_DECIMAL,
-                        TOTAL_CREDIT_AMOUNT, TOTAL_CREDIT_AMOUNT_DECIMAL,
-                        RESERVED, RAW_RECORD
-                    ) VALUES (
-                        SEQ_FILE_CONTROL.NEXTVAL, :file_id, :record_type_code, :batch_count,
-                        :block_count, :entry_addenda_count, :entry_hash,
-                        :total_debit_amount, :total_debit_amount_decimal,
-                        :total_credit_amount, :total_credit_amount_decimal,
-                        :reserved, :raw_record
-                    )
-                """, {
-                    'file_id': file_id,
-                    'record_type_code': record.record_type_code,
-                    'batch_count': record.batch_count,
-                    'block_count': record.block_count,
-                    'entry_addenda_count': record.entry_addenda_count,
-                    'entry_hash': record.entry_hash,
-                    'total_debit_amount': record.total_debit_amount,
-                    'total_debit_amount_decimal': record.total_debit_amount_decimal,
-                    'total_credit_amount': record.total_credit_amount,
-                    'total_credit_amount_decimal': record.total_credit_amount_decimal,
-                    'reserved': record.reserved,
-                    'raw_record': record.raw_record
-                })
+                control_id_var = cursor.var(int)
+                cursor.execute(_INSERT_ACH_FILE_CONTROL_SQL, _ach_file_control_params(file_id, record) + (control_id_var,))
                 conn.commit()
-                cursor.execute("SELECT SEQ_FILE_CONTROL.CURRVAL FROM DUAL")
-                control_id = cursor.fetchone()[0]
+                control_id = control_id_var.getvalue()[0]
                 logger.info(f"Inserted ACH_FILE_CONTROL record {control_id} for file_id {file_id}")
                 return control_id
         except Exception as e:
@@ -1157,6 +1865,11 @@ class OracleService:
     def parse_and_insert_ach_records(self, file_id: int, file_contents: str) -> Dict[str, int]:
         """Parse ACH file contents and insert records into appropriate tables.
         
+        Each record type is inserted with one executemany on a single
+        connection and everything is committed once, so a file costs a
+        handful of round-trips instead of several per record. Addendas are
+        linked to the ENTRY_DETAIL_IDs returned by the entry detail insert.
+        
         Returns a dictionary with counts of inserted records:
         {
             'file_headers': count,
@@ -1173,66 +1886,67 @@ class OracleService:
             # Parse file content
             parsed_records = ACHRecordParser.parse_file_content(file_contents)
             
+            with self.get_connection() as conn:
+                try:
+                    with conn.cursor() as cursor:
+                        # Insert file headers
+                        if parsed_records['file_headers']:
+                            _insert_ach_records(cursor, _INSERT_ACH_FILE_HEADER_SQL, [
+                                _ach_file_header_params(file_id, record) for record in parsed_records['file_headers']
+                            ], _ACH_FILE_HEADER_INPUT_SIZES)
+                        
+                        # Insert batch headers
+                        if parsed_records['batch_headers']:
+                            _insert_ach_records(cursor, _INSERT_ACH_BATCH_HEADER_SQL, [
+                                _ach_batch_header_params(file_id, record) for record in parsed_records['batch_headers']
+                            ], _ACH_BATCH_HEADER_INPUT_SIZES)
+                        
+                        # Insert entry details, collecting the generated ids for linking addendas
+                        entry_detail_map = {}  # Maps (batch_number, trace_sequence) -> entry_detail_id
+                        entry_details = parsed_records['entry_details']
+                        if entry_details:
+                            entry_detail_ids = _insert_ach_records(cursor, _INSERT_ACH_ENTRY_DETAIL_SQL, [
+                                _ach_entry_detail_params(file_id, record) for record in entry_details
+                            ], _ACH_ENTRY_DETAIL_INPUT_SIZES)
+                            for record, entry_detail_id in zip(entry_details, entry_detail_ids):
+                                if record.trace_sequence_number:
+                                    key = (record.batch_number, record.trace_sequence_number)
+                                    entry_detail_map[key] = entry_detail_id
+                        
+                        # Insert addendas (try to link to entry details)
+                        addenda_rows = []
+                        for record in parsed_records['addendas']:
+                            entry_detail_id = None
+                            if record.entry_detail_sequence_num:
+                                key = (record.batch_number, record.entry_detail_sequence_num)
+                                entry_detail_id = entry_detail_map.get(key)
+                            addenda_rows.append(_ach_addenda_params(file_id, record, entry_detail_id))
+                        if addenda_rows:
+                            _insert_ach_records(cursor, _INSERT_ACH_ADDENDA_SQL, addenda_rows, _ACH_ADDENDA_INPUT_SIZES)
+                        
+                        # Insert batch controls
+                        if parsed_records['batch_controls']:
+                            _insert_ach_records(cursor, _INSERT_ACH_BATCH_CONTROL_SQL, [
+                                _ach_batch_control_params(file_id, record) for record in parsed_records['batch_controls']
+                            ], _ACH_BATCH_CONTROL_INPUT_SIZES)
+                        
+                        # Insert file controls
+                        if parsed_records['file_controls']:
+                            _insert_ach_records(cursor, _INSERT_ACH_FILE_CONTROL_SQL, [
+                                _ach_file_control_params(file_id, record) for record in parsed_records['file_controls']
+                            ], _ACH_FILE_CONTROL_INPUT_SIZES)
+                        
+                        conn.commit()
+                        self._clear_core_post_cache()
+                except Exception:
+                    # Nothing from a partially inserted file is kept
+                    conn.rollback()
+                    raise
+            
             counts = {
-                'file_headers': 0,
-                'batch_headers': 0,
-                'entry_details': 0,
-                'addendas': 0,
-                'batch_controls': 0,
-                'file_controls': 0
+                key: len(parsed_records[key])
+                for key in ('file_headers', 'batch_headers', 'entry_details', 'addendas', 'batch_controls', 'file_controls')
             }
-            
-            # Track entry details for linking addendas
-            entry_detail_map = {}  # Maps (batch_number, trace_sequence) -> entry_detail_id
-            
-            # Insert file headers
-            for record in parsed_records['file_headers']:
-                record.file_id = file_id
-                self.insert_ach_file_header(file_id, record)
-                counts['file_headers'] += 1
-            
-            # Insert batch headers
-            for record in parsed_records['batch_headers']:
-                record.file_id = file_id
-                self.insert_ach_batch_header(file_id, record)
-                counts['batch_headers'] += 1
-            
-            # Insert entry details
-            for record in parsed_records['entry_details']:
-                record.file_id = file_id
-                entry_id = self.insert_ach_entry_detail(file_id, record)
-                counts['entry_details'] += 1
-                
-                # Store entry detail ID for linking addendas
-                if record.trace_sequence_number:
-                    key = (record.batch_number, record.trace_sequence_number)
-                    entry_detail_map[key] = entry_id
-            
-            # Insert addendas (try to link to entry details)
-            for record in parsed_records['addendas']:
-                record.file_id = file_id
-                entry_detail_id = None
-                
-                # Try to find matching entry detail
-                if record.entry_detail_sequence_num:
-                    key = (record.batch_number, record.entry_detail_sequence_num)
-                    entry_detail_id = entry_detail_map.get(key)
-                
-                self.insert_ach_addenda(file_id, record, entry_detail_id)
-                counts['addendas'] += 1
-            
-            # Insert batch controls
-            for record in parsed_records['batch_controls']:
-                record.file_id = file_id
-                self.insert_ach_batch_control(file_id, record)
-                counts['batch_controls'] += 1
-            
-            # Insert file controls
-            for record in parsed_records['file_controls']:
-                record.file_id = file_id
-                self.insert_ach_file_control(file_id, record)
-                counts['file_controls'] += 1
-            
             logger.info(f"Parsed and inserted ACH records for file_id {file_id}: {counts}")
             return counts
             
@@ -1246,7 +1960,7 @@ class OracleService:
         client_id: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[AchCorePostRow]:
         """Get ACH data for Core Post Stored Procedure (approved files only).
         
         Returns entry detail records with all related data needed for the stored procedure.
@@ -1258,142 +1972,102 @@ class OracleService:
             offset: Optional offset for pagination
             
         Returns:
-            List of dictionaries containing ACH data for each entry detail record
+            List of AchCorePostRow named tuples, one per entry detail record
+            (use row._asdict() where a dict is needed)
+        
+        Results are cached in-process per (file_id, client_id, limit, offset)
+        for config.core_post_cache_ttl seconds and cleared by this service's
+        ACH_FILES changes and ACH record inserts.
         """
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Build WHERE clause dynamically
-                where_conditions = [
-                    "ed.RECORD_TYPE_CODE = '6'",
-                    "af.PROCESSING_STATUS = 'APPROVED'"
-                ]
-                params = {}
-                
-                if file_id is not None:
-                    where_conditions.append("ed.FILE_ID = :file_id")
-                    params['file_id'] = file_id
-                
-                if client_id is not None:
-                    where_conditions.append("af.CLIENT_ID = :client_id")
-                    params['client_id'] = client_id
-                
-                where_clause = " AND ".join(where_conditions)
-                
-                # Build query with optional pagination
-                query = f"""
-                    SELECT
-                        -- Trace Sequence Number (GN_SECUENCIACONVENIO)
-                        ed.TRACE_SEQUENCE_NUMBER AS trace_sequence_number,
-                        
-                        -- Client ID (GN_CODIGOCLIENTE)
-                        af.CLIENT_ID AS client_id,
-                        
-                        -- Origin Agency (GN_AGENCIACTAORIGEN)
-                        SUBSTR(bh.ORIGINATING_DFI_ID, 1, 3) AS origin_agency,
-                        
-                        -- Origin Sub-account (GN_SUBCTAORIGEN)
-                        0 AS origin_sub_account,
-                        
-                        -- ACH Class (GV_APLCTAORIGEN)
-                        bh.STANDARD_ENTRY_CLASS_CODE AS ach_class,
-                        
-                        -- Origin Account (GN_CTAORIGEN)
-                        ed.DFI_ACCOUNT_NUMBER AS origin_account,
-                        
-                        -- Company ID (GN_EMPCTAORIGEN)
-                        bh.COMPANY_IDENTIFICATION AS company_id,
-                        
-                        -- Company Entry Description
-                        bh.COMPANY_ENTRY_DESCRIPTION AS company_entry_description,
-                        
-                        -- Receiver Routing/ABA (GN_ABABCORECIBIDOR)
-                        ed.RECEIVING_DFI_ID || ed.CHECK_DIGIT AS receiver_routing_aba,
-                        
-                        -- Receiver Account (GV_CTABCORECIBIDOR)
-                        ed.DFI_ACCOUNT_NUMBER AS receiver_account,
-                        
-                        -- Transaction Code (GN_PRODBCORECIBIDOR)
-                        ed.TRANSACTION_CODE AS transaction_code,
-                        
-                        -- Company Name (GV_CUENTAINSTITUCION)
-                        bh.COMPANY_NAME AS company_name,
-                        
-                        -- Receiver ID (GV_IDRECIBIDOR)
-                        ed.INDIVIDUAL_ID_NUMBER AS receiver_id,
-                        
-                        -- Receiver Name (GV_NOMBRERECIBIDOR)
-                        ed.INDIVIDUAL_NAME AS receiver_name,
-                        
-                        -- Reference (GV_REFERENCIA)
-                        fh.REFERENCE_CODE AS reference_code,
-                        
-                        -- Payment Description (GV_DESCPAGO)
-                        bh.COMPANY_ENTRY_DESCRIPTION AS payment_description,
-                        
-                        -- Amount (GN_MONTOOPERACION)
-                        ed.AMOUNT_DECIMAL AS amount,
-                        
-                        -- Additional fields for filtering/identification
-                        ed.ENTRY_DETAIL_ID,
-                        ed.FILE_ID,
-                        ed.BATCH_NUMBER,
-                        af.ORIGINAL_FILENAME
-                    FROM
-                        ACH_ENTRY_DETAIL ed
-                        INNER JOIN ACH_FILES af ON ed.FILE_ID = af.FILE_ID
-                        INNER JOIN ACH_BATCH_HEADER bh 
-                            ON ed.FILE_ID = bh.FILE_ID 
-                            AND ed.BATCH_NUMBER = bh.BATCH_NUMBER
-                        INNER JOIN ACH_FILE_HEADER fh ON ed.FILE_ID = fh.FILE_ID
-                    WHERE
-                        {where_clause}
-                    ORDER BY
-                        ed.FILE_ID, ed.BATCH_NUMBER, ed.ENTRY_DETAIL_ID
-                """
+        cache_key = (file_id, client_id, limit, offset)
+        if self.config.core_post_cache_ttl > 0:
+            with self._core_post_cache_lock:
+                cached = self._core_post_cache.get(cache_key)
+                if cached is not None and time.monotonic() < cached[0]:
+                    self._core_post_cache.move_to_end(cache_key)
+                    return list(cached[1])
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                query, params = _core_post_sp_approved_query(file_id, client_id)
                 
-                # Add pagination if specified
+                # Add pagination if specified; the ORDER BY and row limit are
+                # handled in one pipelined plan, with no wrapper subquery
                 if limit is not None:
-                    if offset is not None:
-                        query = f"""
-                            SELECT * FROM (
-                                SELECT a.*, ROWNUM rnum FROM (
-                                    {query}
-                                ) a WHERE ROWNUM <= :limit_offset
-                            ) WHERE rnum > :offset
-                        """
-                        params['limit_offset'] = offset + limit
-                        params['offset'] = offset
-                    else:
-                        query = f"""
-                            SELECT * FROM (
-                                {query}
-                            ) WHERE ROWNUM <= :limit
-                        """
-                        params['limit'] = limit
+                    query += """
+                    OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY
+                    """
+                    params['offset'] = offset or 0
+                    params['limit'] = limit
                 
+                size_fetch_for_page(cursor, limit if limit is not None else self.config.fetch_array_size)
                 cursor.execute(query, params)
                 
-                # Fetch all results
-                columns = [desc[0].lower() for desc in cursor.description]
-                results = []
+                # Named tuples instead of a dict per row; the SELECT list is fixed
+                cursor.rowfactory = AchCorePostRow._make
+                results = cursor.fetchall()
                 
-                for row in cursor.fetchall():
-                    record = dict(zip(columns, row))
-                    results.append(record)
+                if self.config.core_post_cache_ttl > 0:
+                    with self._core_post_cache_lock:
+                        self._core_post_cache[cache_key] = (time.monotonic() + self.config.core_post_cache_ttl, results)
+                        self._core_post_cache.move_to_end(cache_key)
+                        while len(self._core_post_cache) > _CORE_POST_CACHE_SIZE:
+                            self._core_post_cache.popitem(last=False)
                 
                 logger.info(f"Retrieved {len(results)} ACH records for Core Post SP (approved files)")
-                return results
+                return list(results)
                 
         except Exception as e:
             logger.error(f"Failed to get ACH data for Core Post SP: {e}")
             raise
     
+    def iter_ach_data_for_core_post_sp_approved(
+        self,
+        file_id: Optional[int] = None,
+        client_id: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Iterator[AchCorePostRow]:
+        """Yield get_ach_data_for_core_post_sp_approved records, in the same order, without paging.
+        
+        Rows are fetched batch_size at a time from one open cursor, so an
+        "all approved" run can be processed as it arrives instead of being
+        built into one list first. Not cached. The pooled connection is held
+        until the generator is exhausted or closed.
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    query, params = _core_post_sp_approved_query(file_id, client_id)
+                    
+                    cursor.arraysize = batch_size
+                    cursor.prefetchrows = batch_size
+                    cursor.execute(query, params)
+                    cursor.rowfactory = AchCorePostRow._make
+                    
+                    yield from cursor
+                
+        except Exception as e:
+            logger.error(f"Failed to iterate ACH data for Core Post SP: {e}")
+            raise
+    
     # ==================== FI_HOLIDAYS CRUD Operations ====================
     
     def create_fi_holiday(self, holiday: FiHolidayCreate) -> int:
         """Create a new FI_HOLIDAYS record."""
+        return self.create_fi_holidays([holiday])[0]
+    
+    def create_fi_holidays(self, holidays: List[FiHolidayCreate], batch_size: int = 1000) -> List[int]:
+        """Create many FI_HOLIDAYS records with array DML.
+        
+        Rows are sent batch_size at a time with executemany and committed once,
+        so seeding a year of holidays costs one round trip instead of one per
+        holiday. The returned HOLIDAY_IDs follow the order of holidays.
+        """
+        if not holidays:
+            return []
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -1412,22 +2086,30 @@ class OracleService:
                 ) RETURNING HOLIDAY_ID INTO :holiday_id
                 """
                 
-                holiday_id = cursor.var(int)
-                cursor.execute(insert_sql, {
-                    'holiday_date': holiday.holiday_date,
-                    'holiday_name': holiday.holiday_name,
-                    'created_by_user': holiday.created_by_user,
-                    'holiday_id': holiday_id
-                })
+                holiday_ids: List[int] = []
+                for start in range(0, len(holidays), batch_size):
+                    batch = holidays[start:start + batch_size]
+                    
+                    # One RETURNING slot per row
+                    holiday_id = cursor.var(int, arraysize=len(batch))
+                    cursor.setinputsizes(holiday_id=holiday_id)
+                    cursor.executemany(insert_sql, [
+                        {
+                            'holiday_date': holiday.holiday_date,
+                            'holiday_name': holiday.holiday_name,
+                            'created_by_user': holiday.created_by_user
+                        }
+                        for holiday in batch
+                    ])
+                    holiday_ids.extend(holiday_id.getvalue(i)[0] for i in range(len(batch)))
                 
                 conn.commit()
-                generated_id = holiday_id.getvalue()[0]
                 
-                logger.info(f"Created FI_HOLIDAYS record with ID: {generated_id}")
-                return generated_id
+                logger.info(f"Created {len(holiday_ids)} FI_HOLIDAYS records")
+                return holiday_ids
                 
         except Exception as e:
-            logger.error(f"Failed to create FI_HOLIDAYS record: {e}")
+            logger.error(f"Failed to create FI_HOLIDAYS records: {e}")
             raise
     
     def get_fi_holiday(self, holiday_id: int) -> Optional[FiHolidayResponse]:
@@ -1481,59 +2163,67 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                size_fetch_for_page(cursor, limit)
                 
-                # Build WHERE clause dynamically
-                where_conditions = []
-                params = {}
+                # Note: IS_ACTIVE column doesn't exist in FI_HOLIDAYS table, so that filter is skipped
+                params = _fi_holiday_filter_params(year)
+                select_sql = self._fi_holiday_select_sql[frozenset(params)]
+                params['offset'] = offset
+                params['limit'] = limit
                 
-                # Note: IS_ACTIVE column doesn't exist in FI_HOLIDAYS table, so we skip that filter
-                # if is_active is not None:
-                #     where_conditions.append("IS_ACTIVE = :is_active")
-                #     params['is_active'] = is_active
+                cursor.setinputsizes(**{name: _FI_HOLIDAY_BIND_TYPES[name] for name in params})
+                cursor.execute(select_sql, params)
                 
-                if year is not None:
-                    where_conditions.append("EXTRACT(YEAR FROM HOLIDAY_DATE) = :year")
-                    params['year'] = year
+                # Rows are built into models by the cursor as they are fetched
+                cursor.rowfactory = _fi_holiday_from_row
+                holidays = cursor.fetchall()
                 
-                where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+                logger.info(f"Retrieved {len(holidays)} FI_HOLIDAYS records")
+                return holidays
                 
-                select_sql = f"""
-                SELECT 
-                    HOLIDAY_ID,
-                    HOLIDAY_DATE,
-                    HOLIDAY_NAME,
-                    CREATED_BY_USER,
-                    CREATED_DATE,
-                    UPDATED_BY_USER,
-                    UPDATED_DATE
-                FROM {self.config.db_schema}.FI_HOLIDAYS 
-                WHERE {where_clause}
-                ORDER BY HOLIDAY_DATE
-                OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY
-                """
+        except Exception as e:
+            logger.error(f"Failed to get FI_HOLIDAYS records: {e}")
+            raise
+    
+    def get_fi_holidays_with_total(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        is_active: Optional[int] = None,
+        year: Optional[int] = None
+    ) -> Tuple[List[FiHolidayResponse], int]:
+        """Get a page of FI_HOLIDAYS records and the filtered total in one query.
+        
+        Same filtering and ordering as get_fi_holidays. The total comes from
+        COUNT(*) OVER () on the page rows; only an empty page past the first
+        falls back to get_fi_holidays_count.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                size_fetch_for_page(cursor, limit)
                 
+                # Note: IS_ACTIVE column doesn't exist in FI_HOLIDAYS table, so that filter is skipped
+                params = _fi_holiday_filter_params(year)
+                select_sql = self._fi_holiday_select_with_total_sql[frozenset(params)]
                 params['offset'] = offset
                 params['limit'] = limit
                 
+                cursor.setinputsizes(**{name: _FI_HOLIDAY_BIND_TYPES[name] for name in params})
                 cursor.execute(select_sql, params)
                 rows = cursor.fetchall()
-                
-                holidays = []
-                for row in rows:
-                    holidays.append(FiHolidayResponse(
-                        holiday_id=row[0],
-                        holiday_date=row[1],
-                        holiday_name=row[2],
-                        is_active=None,  # Column doesn't exist in table
-                        created_by_user=row[3],
-                        created_date=row[4],
-                        updated_by_user=row[5],
-                        updated_date=row[6]
-                    ))
-                
-                logger.info(f"Retrieved {len(holidays)} FI_HOLIDAYS records")
-                return holidays
-                
+            
+            holidays = [_fi_holiday_from_row(row) for row in rows]
+            if rows:
+                total_count = rows[0][-1]
+            elif offset > 0:
+                total_count = self.get_fi_holidays_count(is_active=is_active, year=year)
+            else:
+                total_count = 0
+            
+            logger.info(f"Retrieved {len(holidays)} of {total_count} FI_HOLIDAYS records")
+            return holidays, total_count
+            
         except Exception as e:
             logger.error(f"Failed to get FI_HOLIDAYS records: {e}")
             raise
@@ -1548,28 +2238,11 @@ class OracleService:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Build WHERE clause dynamically
-                where_conditions = []
-                params = {}
-                
-                # Note: IS_ACTIVE column doesn't exist in FI_HOLIDAYS table, so we skip that filter
-                # if is_active is not None:
-                #     where_conditions.append("IS_ACTIVE = :is_active")
-                #     params['is_active'] = is_active
-                
-                if year is not None:
-                    where_conditions.append("EXTRACT(YEAR FROM HOLIDAY_DATE) = :year")
-                    params['year'] = year
-                
-                where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-                
-                count_sql = f"""
-                SELECT COUNT(*) 
-                FROM {self.config.db_schema}.FI_HOLIDAYS 
-                WHERE {where_clause}
-                """
+                # Note: IS_ACTIVE column doesn't exist in FI_HOLIDAYS table, so that filter is skipped
+                params = _fi_holiday_filter_params(year)
+                cursor.setinputsizes(**{name: _FI_HOLIDAY_BIND_TYPES[name] for name in params})
                 
-                cursor.execute(count_sql, params)
+                cursor.execute(self._fi_holiday_count_sql[frozenset(params)], params)
                 count = cursor.fetchone()[0]
                 
                 return count
@@ -1584,38 +2257,31 @@ class OracleService:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Build update fields dynamically
-                update_fields = []
-                params = {'holiday_id': holiday_id}
-                
-                if holiday.holiday_date is not None:
-                    update_fields.append("HOLIDAY_DATE = :holiday_date")
-                    params['holiday_date'] = holiday.holiday_date
-                
-                if holiday.holiday_name is not None:
-                    update_fields.append("HOLIDAY_NAME = :holiday_name")
-                    params['holiday_name'] = holiday.holiday_name
+                # One fixed statement for every update shape; columns bound as None
+                # keep their stored value via COALESCE
+                params = {
+                    'holiday_id': holiday_id,
+                    'holiday_date': holiday.holiday_date,
+                    'holiday_name': holiday.holiday_name,
+                    'updated_by_user': holiday.updated_by_user
+                }
                 
                 # Note: IS_ACTIVE column doesn't exist in FI_HOLIDAYS table
-                # if holiday.is_active is not None:
-                #     update_fields.append("IS_ACTIVE = :is_active")
-                #     params['is_active'] = holiday.is_active
                 
-                if holiday.updated_by_user is not None:
-                    update_fields.append("UPDATED_BY_USER = :updated_by_user")
-                    params['updated_by_user'] = holiday.updated_by_user
-                
-                if not update_fields:
+                if all(value is None for key, value in params.items() if key != 'holiday_id'):
                     return False  # No fields to update
                 
-                update_fields.append("UPDATED_DATE = CURRENT_TIMESTAMP")
-                
                 update_sql = f"""
                 UPDATE {self.config.db_schema}.FI_HOLIDAYS 
-                SET {', '.join(update_fields)}
+                SET HOLIDAY_DATE = COALESCE(:holiday_date, HOLIDAY_DATE),
+                    HOLIDAY_NAME = COALESCE(:holiday_name, HOLIDAY_NAME),
+                    UPDATED_BY_USER = COALESCE(:updated_by_user, UPDATED_BY_USER),
+                    UPDATED_DATE = CURRENT_TIMESTAMP
                 WHERE HOLIDAY_ID = :holiday_id
                 """
                 
+                # Bind HOLIDAY_DATE as a DATE so COALESCE compares like types when it is None
+                cursor.setinputsizes(holiday_date=oracledb.DB_TYPE_DATE)
                 cursor.execute(update_sql, params)
                 conn.commit()
                 
@@ -1649,6 +2315,18 @@ class OracleService:
     
     def create_ach_account_swap(self, swap: AchAccountSwapCreate) -> int:
         """Create a new ACH_ACCOUNT_NUMBER_SWAPS record."""
+        return self.create_ach_account_swaps([swap])[0]
+    
+    def create_ach_account_swaps(self, swaps: List[AchAccountSwapCreate], batch_size: int = 1000) -> List[int]:
+        """Create many ACH_ACCOUNT_NUMBER_SWAPS records with array DML.
+        
+        Rows are sent batch_size at a time with executemany and committed once,
+        so importing a swap table costs one round trip per batch instead of one
+        per swap. The returned SWAP_IDs follow the order of swaps.
+        """
+        if not swaps:
+            return []
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -1669,23 +2347,32 @@ class OracleService:
                 ) RETURNING SWAP_ID INTO :swap_id
                 """
                 
-                swap_id = cursor.var(int)
-                cursor.execute(insert_sql, {
-                    'original_dfi_account_number': swap.original_dfi_account_number,
-                    'swap_account_number': swap.swap_account_number,
-                    'swap_memo': swap.swap_memo,
-                    'created_by_user': swap.created_by_user,
-                    'swap_id': swap_id
-                })
+                swap_ids: List[int] = []
+                for start in range(0, len(swaps), batch_size):
+                    batch = swaps[start:start + batch_size]
+                    
+                    # One RETURNING slot per row
+                    swap_id = cursor.var(int, arraysize=len(batch))
+                    cursor.setinputsizes(swap_id=swap_id)
+                    cursor.executemany(insert_sql, [
+                        {
+                            'original_dfi_account_number': swap.original_dfi_account_number,
+                            'swap_account_number': swap.swap_account_number,
+                            'swap_memo': swap.swap_memo,
+                            'created_by_user': swap.created_by_user
+                        }
+                        for swap in batch
+                    ])
+                    swap_ids.extend(swap_id.getvalue(i)[0] for i in range(len(batch)))
                 
                 conn.commit()
-                generated_id = swap_id.getvalue()[0]
+                self._clear_swap_cache()
                 
-                logger.info(f"Created ACH_ACCOUNT_NUMBER_SWAPS record with ID: {generated_id}")
-                return generated_id
+                logger.info(f"Created {len(swap_ids)} ACH_ACCOUNT_NUMBER_SWAPS records")
+                return swap_ids
                 
         except Exception as e:
-            logger.error(f"Failed to create ACH_ACCOUNT_NUMBER_SWAPS record: {e}")
+            logger.error(f"Failed to create ACH_ACCOUNT_NUMBER_SWAPS records: {e}")
             raise
     
     def get_ach_account_swap(self, swap_id: int) -> Optional[AchAccountSwapResponse]:
@@ -1741,63 +2428,72 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                size_fetch_for_page(cursor, limit)
                 
-                # Build WHERE clause dynamically
-                where_conditions = []
-                params = {}
-                
-                if original_dfi_account_number is not None:
-                    where_conditions.append("ORIGINAL_DFI_ACCOUNT_NUMBER = :original_dfi_account_number")
-                    params['original_dfi_account_number'] = original_dfi_account_number
+                params = _ach_account_swap_filter_params(
+                    original_dfi_account_number, swap_account_number, swap_memo
+                )
+                select_sql = self._ach_account_swap_select_sql[frozenset(params)]
+                params['offset'] = offset
+                params['limit'] = limit
                 
-                if swap_account_number is not None:
-                    where_conditions.append("SWAP_ACCOUNT_NUMBER = :swap_account_number")
-                    params['swap_account_number'] = swap_account_number
+                cursor.execute(select_sql, params)
                 
-                if swap_memo is not None:
-                    where_conditions.append("UPPER(SWAP_MEMO) LIKE UPPER(:swap_memo)")
-                    params['swap_memo'] = f'%{swap_memo}%'
+                # Rows are built into models by the cursor as they are fetched
+                cursor.rowfactory = _ach_account_swap_from_row
+                swaps = cursor.fetchall()
                 
-                where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+                logger.info(f"Retrieved {len(swaps)} ACH_ACCOUNT_NUMBER_SWAPS records")
+                return swaps
                 
-                select_sql = f"""
-                SELECT 
-                    SWAP_ID,
-                    ORIGINAL_DFI_ACCOUNT_NUMBER,
-                    SWAP_ACCOUNT_NUMBER,
-                    SWAP_MEMO,
-                    CREATED_BY_USER,
-                    CREATED_DATE,
-                    UPDATED_BY_USER,
-                    UPDATED_DATE
-                FROM {self.config.db_schema}.ACH_ACCOUNT_NUMBER_SWAPS 
-                WHERE {where_clause}
-                ORDER BY CREATED_DATE DESC
-                OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY
-                """
+        except Exception as e:
+            logger.error(f"Failed to get ACH_ACCOUNT_NUMBER_SWAPS records: {e}")
+            raise
+    
+    def get_ach_account_swaps_with_total(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        original_dfi_account_number: Optional[str] = None,
+        swap_account_number: Optional[str] = None,
+        swap_memo: Optional[str] = None
+    ) -> Tuple[List[AchAccountSwapResponse], int]:
+        """Get a page of ACH_ACCOUNT_NUMBER_SWAPS records and the filtered total in one query.
+        
+        Same filtering and ordering as get_ach_account_swaps. The total comes
+        from COUNT(*) OVER () on the page rows; only an empty page past the
+        first falls back to get_ach_account_swaps_count.
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                size_fetch_for_page(cursor, limit)
                 
+                params = _ach_account_swap_filter_params(
+                    original_dfi_account_number, swap_account_number, swap_memo
+                )
+                select_sql = self._ach_account_swap_select_with_total_sql[frozenset(params)]
                 params['offset'] = offset
                 params['limit'] = limit
                 
                 cursor.execute(select_sql, params)
                 rows = cursor.fetchall()
-                
-                swaps = []
-                for row in rows:
-                    swaps.append(AchAccountSwapResponse(
-                        swap_id=row[0],
-                        original_dfi_account_number=row[1],
-                        swap_account_number=row[2],
-                        swap_memo=row[3],
-                        created_by_user=row[4],
-                        created_date=row[5],
-                        updated_by_user=row[6],
-                        updated_date=row[7]
-                    ))
-                
-                logger.info(f"Retrieved {len(swaps)} ACH_ACCOUNT_NUMBER_SWAPS records")
-                return swaps
-                
+            
+            swaps = [_ach_account_swap_from_row(row) for row in rows]
+            if rows:
+                total_count = rows[0][-1]
+            elif offset > 0:
+                total_count = self.get_ach_account_swaps_count(
+                    original_dfi_account_number=original_dfi_account_number,
+                    swap_account_number=swap_account_number,
+                    swap_memo=swap_memo
+                )
+            else:
+                total_count = 0
+            
+            logger.info(f"Retrieved {len(swaps)} of {total_count} ACH_ACCOUNT_NUMBER_SWAPS records")
+            return swaps, total_count
+            
         except Exception as e:
             logger.error(f"Failed to get ACH_ACCOUNT_NUMBER_SWAPS records: {e}")
             raise
@@ -1813,31 +2509,11 @@ class OracleService:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Build WHERE clause dynamically
-                where_conditions = []
-                params = {}
-                
-                if original_dfi_account_number is not None:
-                    where_conditions.append("ORIGINAL_DFI_ACCOUNT_NUMBER = :original_dfi_account_number")
-                    params['original_dfi_account_number'] = original_dfi_account_number
-                
-                if swap_account_number is not None:
-                    where_conditions.append("SWAP_ACCOUNT_NUMBER = :swap_account_number")
-                    params['swap_account_number'] = swap_account_number
-                
-                if swap_memo is not None:
-                    where_conditions.append("UPPER(SWAP_MEMO) LIKE UPPER(:swap_memo)")
-                    params['swap_memo'] = f'%{swap_memo}%'
-                
-                where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-                
-                count_sql = f"""
-                SELECT COUNT(*) 
-                FROM {self.config.db_schema}.ACH_ACCOUNT_NUMBER_SWAPS 
-                WHERE {where_clause}
-                """
+                params = _ach_account_swap_filter_params(
+                    original_dfi_account_number, swap_account_number, swap_memo
+                )
                 
-                cursor.execute(count_sql, params)
+                cursor.execute(self._ach_account_swap_count_sql[frozenset(params)], params)
                 count = cursor.fetchone()[0]
                 
                 return count
@@ -1846,12 +2522,37 @@ class OracleService:
             logger.error(f"Failed to get ACH_ACCOUNT_NUMBER_SWAPS count: {e}")
             raise
     
-    def get_swap_by_original_account(self, original_dfi_account_number: str) -> Optional[SwapLookupResponse]:
-        """Get swap information by ORIGINAL_DFI_ACCOUNT_NUMBER (returns first match)."""
+    def _clear_swap_cache(self) -> None:
+        """Drop cached get_swap_by_original_account results after ACH_ACCOUNT_NUMBER_SWAPS changes."""
+        with self._swap_cache_lock:
+            self._swap_cache.clear()
+    
+    def get_swap_by_original_account(
+        self,
+        original_dfi_account_number: str,
+        use_cache: bool = True
+    ) -> Optional[SwapLookupResponse]:
+        """Get swap information by ORIGINAL_DFI_ACCOUNT_NUMBER (returns first match).
+        
+        Results, including "no swap", are cached in-process for
+        config.swap_cache_ttl seconds (up to config.swap_cache_size accounts)
+        and cleared by this service's swap inserts, updates and deletes. Pass
+        use_cache=False to always read the table, e.g. before writing the swap
+        account anywhere.
+        """
+        if use_cache and self.config.swap_cache_ttl > 0:
+            with self._swap_cache_lock:
+                cached = self._swap_cache.get(original_dfi_account_number)
+                if cached is not None and time.monotonic() < cached[0]:
+                    self._swap_cache.move_to_end(original_dfi_account_number)
+                    return cached[1].model_copy() if cached[1] is not None else None
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
+                # Newest row first via a STOPKEY range scan of IDX_ACH_SWAPS_ORIG_CREATED
+                # (database/create_ach_account_swaps_original_account_index.sql)
                 select_sql = f"""
                 SELECT 
                     SWAP_ID,
@@ -1867,59 +2568,136 @@ class OracleService:
                 cursor.execute(select_sql, {'original_dfi_account_number': original_dfi_account_number})
                 row = cursor.fetchone()
                 
-                if not row:
-                    return None
+                swap = None
+                if row:
+                    swap = SwapLookupResponse(
+                        swap_id=row[0],
+                        original_dfi_account_number=row[1],
+                        swap_account_number=row[2],
+                        swap_memo=row[3]
+                    )
                 
-                return SwapLookupResponse(
-                    swap_id=row[0],
-                    original_dfi_account_number=row[1],
-                    swap_account_number=row[2],
-                    swap_memo=row[3]
-                )
+                if self.config.swap_cache_ttl > 0 and self.config.swap_cache_size > 0:
+                    with self._swap_cache_lock:
+                        self._swap_cache[original_dfi_account_number] = (
+                            time.monotonic() + self.config.swap_cache_ttl,
+                            swap.model_copy() if swap is not None else None
+                        )
+                        self._swap_cache.move_to_end(original_dfi_account_number)
+                        while len(self._swap_cache) > self.config.swap_cache_size:
+                            self._swap_cache.popitem(last=False)
+                
+                return swap
                 
         except Exception as e:
             logger.error(f"Failed to get swap by ORIGINAL_DFI_ACCOUNT_NUMBER {original_dfi_account_number}: {e}")
             raise
     
+    def get_swaps_by_original_accounts(self, original_dfi_account_numbers: List[str]) -> Dict[str, SwapLookupResponse]:
+        """Get swap information for many ORIGINAL_DFI_ACCOUNT_NUMBERs at once.
+        
+        Returns the same record get_swap_by_original_account would for each
+        account that has a swap, keyed by account; accounts without a swap are
+        left out. Cached accounts are served from the lookup cache and the rest
+        are queried with one IN list per 1000 accounts.
+        """
+        swaps: Dict[str, SwapLookupResponse] = {}
+        missing = []
+        now = time.monotonic()
+        with self._swap_cache_lock:
+            for account in dict.fromkeys(original_dfi_account_numbers):
+                cached = self._swap_cache.get(account) if self.config.swap_cache_ttl > 0 else None
+                if cached is not None and now < cached[0]:
+                    self._swap_cache.move_to_end(account)
+                    if cached[1] is not None:
+                        swaps[account] = cached[1].model_copy()
+                else:
+                    missing.append(account)
+        
+        if not missing:
+            return swaps
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    fetched: Dict[str, Optional[SwapLookupResponse]] = dict.fromkeys(missing)
+                    for start in range(0, len(missing), _SWAP_LOOKUP_BATCH_SIZE):
+                        batch = missing[start:start + _SWAP_LOOKUP_BATCH_SIZE]
+                        binds = {f'a{position}': account for position, account in enumerate(batch)}
+                        
+                        select_sql = f"""
+                        SELECT 
+                            SWAP_ID,
+                            ORIGINAL_DFI_ACCOUNT_NUMBER,
+                            SWAP_ACCOUNT_NUMBER,
+                            SWAP_MEMO
+                        FROM {self.config.db_schema}.ACH_ACCOUNT_NUMBER_SWAPS 
+                        WHERE ORIGINAL_DFI_ACCOUNT_NUMBER IN ({', '.join(':' + name for name in binds)})
+                        ORDER BY ORIGINAL_DFI_ACCOUNT_NUMBER, CREATED_DATE DESC
+                        """
+                        
+                        size_fetch_for_page(cursor, len(batch))
+                        cursor.execute(select_sql, binds)
+                        
+                        # Newest swap per account comes first; later rows for it are skipped
+                        for row in cursor:
+                            if fetched.get(row[1]) is None:
+                                fetched[row[1]] = SwapLookupResponse(
+                                    swap_id=row[0],
+                                    original_dfi_account_number=row[1],
+                                    swap_account_number=row[2],
+                                    swap_memo=row[3]
+                                )
+            
+            if self.config.swap_cache_ttl > 0 and self.config.swap_cache_size > 0:
+                expires = time.monotonic() + self.config.swap_cache_ttl
+                with self._swap_cache_lock:
+                    for account, swap in fetched.items():
+                        self._swap_cache[account] = (expires, swap.model_copy() if swap is not None else None)
+                        self._swap_cache.move_to_end(account)
+                    while len(self._swap_cache) > self.config.swap_cache_size:
+                        self._swap_cache.popitem(last=False)
+            
+            swaps.update((account, swap) for account, swap in fetched.items() if swap is not None)
+            logger.info(f"Looked up swaps for {len(missing)} ORIGINAL_DFI_ACCOUNT_NUMBERs, {len(swaps)} found in total")
+            return swaps
+                
+        except Exception as e:
+            logger.error(f"Failed to get swaps for {len(missing)} ORIGINAL_DFI_ACCOUNT_NUMBERs: {e}")
+            raise
+    
     def update_ach_account_swap(self, swap_id: int, swap: AchAccountSwapUpdate) -> bool:
         """Update a ACH_ACCOUNT_NUMBER_SWAPS record by SWAP_ID."""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Build update fields dynamically
-                update_fields = []
-                params = {'swap_id': swap_id}
-                
-                if swap.original_dfi_account_number is not None:
-                    update_fields.append("ORIGINAL_DFI_ACCOUNT_NUMBER = :original_dfi_account_number")
-                    params['original_dfi_account_number'] = swap.original_dfi_account_number
-                
-                if swap.swap_account_number is not None:
-                    update_fields.append("SWAP_ACCOUNT_NUMBER = :swap_account_number")
-                    params['swap_account_number'] = swap.swap_account_number
-                
-                if swap.swap_memo is not None:
-                    update_fields.append("SWAP_MEMO = :swap_memo")
-                    params['swap_memo'] = swap.swap_memo
-                
-                if swap.updated_by_user is not None:
-                    update_fields.append("UPDATED_BY_USER = :updated_by_user")
-                    params['updated_by_user'] = swap.updated_by_user
+                # One fixed statement for every update shape; columns bound as None
+                # keep their stored value via COALESCE
+                params = {
+                    'swap_id': swap_id,
+                    'original_dfi_account_number': swap.original_dfi_account_number,
+                    'swap_account_number': swap.swap_account_number,
+                    'swap_memo': swap.swap_memo,
+                    'updated_by_user': swap.updated_by_user
+                }
                 
-                if not update_fields:
+                if all(value is None for key, value in params.items() if key != 'swap_id'):
                     return False  # No fields to update
                 
-                update_fields.append("UPDATED_DATE = CURRENT_TIMESTAMP")
-                
                 update_sql = f"""
                 UPDATE {self.config.db_schema}.ACH_ACCOUNT_NUMBER_SWAPS 
-                SET {', '.join(update_fields)}
+                SET ORIGINAL_DFI_ACCOUNT_NUMBER = COALESCE(:original_dfi_account_number, ORIGINAL_DFI_ACCOUNT_NUMBER),
+                    SWAP_ACCOUNT_NUMBER = COALESCE(:swap_account_number, SWAP_ACCOUNT_NUMBER),
+                    SWAP_MEMO = COALESCE(:swap_memo, SWAP_MEMO),
+                    UPDATED_BY_USER = COALESCE(:updated_by_user, UPDATED_BY_USER),
+                    UPDATED_DATE = CURRENT_TIMESTAMP
                 WHERE SWAP_ID = :swap_id
                 """
                 
                 cursor.execute(update_sql, params)
                 conn.commit()
+                self._clear_swap_cache()
                 
                 rows_affected = cursor.rowcount
                 logger.info(f"Updated ACH_ACCOUNT_NUMBER_SWAPS record {swap_id}, rows affected: {rows_affected}")
@@ -1941,30 +2719,27 @@ class OracleService:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                update_fields = []
-                params = {'original_dfi_account_number': original_dfi_account_number}
-                
-                if swap_account_number is not None:
-                    update_fields.append("SWAP_ACCOUNT_NUMBER = :swap_account_number")
-                    params['swap_account_number'] = swap_account_number
-                
-                update_fields.append("SWAP_MEMO = :swap_memo")
-                params['swap_memo'] = swap_memo
-                
-                if updated_by_user is not None:
-                    update_fields.append("UPDATED_BY_USER = :updated_by_user")
-                    params['updated_by_user'] = updated_by_user
-                
-                update_fields.append("UPDATED_DATE = CURRENT_TIMESTAMP")
+                # One fixed statement; SWAP_ACCOUNT_NUMBER and UPDATED_BY_USER bound as
+                # None keep their stored value via COALESCE
+                params = {
+                    'original_dfi_account_number': original_dfi_account_number,
+                    'swap_account_number': swap_account_number,
+                    'swap_memo': swap_memo,
+                    'updated_by_user': updated_by_user
+                }
                 
                 update_sql = f"""
                 UPDATE {self.config.db_schema}.ACH_ACCOUNT_NUMBER_SWAPS 
-                SET {', '.join(update_fields)}
+                SET SWAP_ACCOUNT_NUMBER = COALESCE(:swap_account_number, SWAP_ACCOUNT_NUMBER),
+                    SWAP_MEMO = :swap_memo,
+                    UPDATED_BY_USER = COALESCE(:updated_by_user, UPDATED_BY_USER),
+                    UPDATED_DATE = CURRENT_TIMESTAMP
                 WHERE ORIGINAL_DFI_ACCOUNT_NUMBER = :original_dfi_account_number
                 """
                 
                 cursor.execute(update_sql, params)
                 conn.commit()
+                self._clear_swap_cache()
                 
                 rows_affected = cursor.rowcount
                 logger.info(f"Updated swap by ORIGINAL_DFI_ACCOUNT_NUMBER {original_dfi_account_number}, rows affected: {rows_affected}")
@@ -1983,6 +2758,7 @@ class OracleService:
                 delete_sql = f"DELETE FROM {self.config.db_schema}.ACH_ACCOUNT_NUMBER_SWAPS WHERE SWAP_ID = :swap_id"
                 cursor.execute(delete_sql, {'swap_id': swap_id})
                 conn.commit()
+                self._clear_swap_cache()
                 
                 rows_affected = cursor.rowcount
                 logger.info(f"Deleted ACH_ACCOUNT_NUMBER_SWAPS record {swap_id}, rows affected: {rows_affected}")
@@ -2001,6 +2777,7 @@ class OracleService:
                 delete_sql = f"DELETE FROM {self.config.db_schema}.ACH_ACCOUNT_NUMBER_SWAPS WHERE ORIGINAL_DFI_ACCOUNT_NUMBER = :original_dfi_account_number"
                 cursor.execute(delete_sql, {'original_dfi_account_number': original_dfi_account_number})
                 conn.commit()
+                self._clear_swap_cache()
                 
                 rows_affected = cursor.rowcount
                 logger.info(f"Deleted swap(s) by ORIGINAL_DFI_ACCOUNT_NUMBER {original_dfi_account_number}, rows affected: {rows_affected}")
@@ -2021,8 +2798,9 @@ class OracleService:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # First, get the swap information
-                swap = self.get_swap_by_original_account(original_dfi_account_number)
+                # First, get the swap information; read from the table, since another
+                # worker may have changed the swap since it was cached here
+                swap = self.get_swap_by_original_account(original_dfi_account_number, use_cache=False)
                 if not swap or not swap.swap_account_number:
                     logger.warning(f"No swap found for ORIGINAL_DFI_ACCOUNT_NUMBER {original_dfi_account_number}")
                     return False
@@ -2175,6 +2953,7 @@ class OracleService:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                size_fetch_for_page(cursor, limit)
                 
                 # Build WHERE clause dynamically
                 where_conditions = []
@@ -2303,52 +3082,43 @@ class OracleService:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Build UPDATE fields dynamically
-                update_fields = []
-                params = {'user_id': user_id}
-                
-                if user.username is not None:
-                    update_fields.append("USERNAME = :username")
-                    params['username'] = user.username
-                
-                if user.email is not None:
-                    update_fields.append("EMAIL = :email")
-                    params['email'] = user.email
-                
-                if user.full_name is not None:
-                    update_fields.append("FULL_NAME = :full_name")
-                    params['full_name'] = user.full_name
-                
+                password_hash = None
                 if user.password is not None:
                     # Hash password using bcrypt (same logic as create_api_user)
                     password_bytes = user.password.encode('utf-8')
                     password_hash = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=12)).decode('utf-8')
-                    update_fields.append("PASSWORD_HASH = :password_hash")
-                    params['password_hash'] = password_hash
-                
-                if user.is_active is not None:
-                    update_fields.append("IS_ACTIVE = :is_active")
-                    params['is_active'] = user.is_active
-                
-                if user.is_admin is not None:
-                    update_fields.append("IS_ADMIN = :is_admin")
-                    params['is_admin'] = user.is_admin
                 
-                # Always update UPDATED_DATE and UPDATED_BY_USER on any update
-                update_fields.append("UPDATED_DATE = CURRENT_TIMESTAMP")
-                if user.updated_by_user:
-                    update_fields.append("UPDATED_BY_USER = :updated_by_user")
-                    params['updated_by_user'] = user.updated_by_user
+                # One fixed statement for every update shape; columns bound as None
+                # keep their stored value via COALESCE. UPDATED_DATE is always set.
+                params = {
+                    'user_id': user_id,
+                    'username': user.username,
+                    'email': user.email,
+                    'full_name': user.full_name,
+                    'password_hash': password_hash,
+                    'is_active': user.is_active,
+                    'is_admin': user.is_admin,
+                    'updated_by_user': user.updated_by_user or None
+                }
                 
-                # Note: update_fields will always have at least UPDATED_DATE, so no need to check if empty
                 update_sql = f"""
                 UPDATE {self.config.db_schema}.API_USERS
-                SET {', '.join(update_fields)}
+                SET USERNAME = COALESCE(:username, USERNAME),
+                    EMAIL = COALESCE(:email, EMAIL),
+                    FULL_NAME = COALESCE(:full_name, FULL_NAME),
+                    PASSWORD_HASH = COALESCE(:password_hash, PASSWORD_HASH),
+                    IS_ACTIVE = COALESCE(:is_active, IS_ACTIVE),
+                    IS_ADMIN = COALESCE(:is_admin, IS_ADMIN),
+                    UPDATED_DATE = CURRENT_TIMESTAMP,
+                    UPDATED_BY_USER = COALESCE(:updated_by_user, UPDATED_BY_USER)
                 WHERE USER_ID = :user_id
                 """
                 
+                # Bind the flags as numbers so COALESCE compares like types when they are None
+                cursor.setinputsizes(is_active=oracledb.DB_TYPE_NUMBER, is_admin=oracledb.DB_TYPE_NUMBER)
                 cursor.execute(update_sql, params)
                 conn.commit()
+                self._clear_auth_cache()
                 
                 rows_affected = cursor.rowcount
                 logger.info(f"Updated API_USERS {user_id}, rows affected: {rows_affected}")
@@ -2371,6 +3141,7 @@ class OracleService:
                 
                 cursor.execute(delete_sql, {'user_id': user_id})
                 conn.commit()
+                self._clear_auth_cache()
                 
                 rows_affected = cursor.rowcount
                 logger.info(f"Deleted API_USERS {user_id}, rows affected: {rows_affected}")
@@ -2379,3 +3150,22 @@ class OracleService:
         except Exception as e:
             logger.error(f"Failed to delete API_USERS record {user_id}: {e}")
             raise
+
+
+_shared_service: Optional[OracleService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_service(config: OracleConfig) -> OracleService:
+    """Get the process-wide OracleService.
+    
+    The service is created on first use and its connection pool is opened
+    once, on the first ``with`` block, and reused until disconnect() is called
+    (normally at application shutdown).
+    """
+    global _shared_service
+    if _shared_service is None:
+        with _shared_service_lock:
+            if _shared_service is None:
+                _shared_service = OracleService(config, shared=True)
+    return _shared_service
@@ -0,0 +1,120 @@
+"""Tests for the asyncio Oracle service."""
+
+import asyncio
+
+import pytest
+from src.obs_sftp_file_processor.async_oracle_service import AsyncOracleService
+from src.obs_sftp_file_processor.oracle_common import (
+    APPEND_STAGED_FILE_CONTENTS_PLSQL,
+    INSERT_ACH_FILE_EMPTY_CLOB_SQL,
+    INSERT_ACH_FILE_SQL,
+    INSERT_ACH_FILE_STAGING_SQL,
+)
+from src.obs_sftp_file_processor.oracle_config import OracleConfig
+from src.obs_sftp_file_processor.oracle_models import AchFileCreate
+
+
+class StubVar:
+    """Out bind holding one generated id."""
+
+    def __init__(self, file_id):
+        self.file_id = file_id
+
+    def getvalue(self, position=0):
+        return [self.file_id]
+
+
+class StubAsyncCursor:
+    """Async cursor that records executed statements."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def var(self, typ, arraysize=1):
+        return StubVar(42)
+
+    def setinputsizes(self, *args, **kwargs):
+        pass
+
+    async def execute(self, sql, params=None):
+        self.connection.executed.append((sql, params))
+
+    async def executemany(self, sql, params):
+        self.connection.executed.append((sql, params))
+
+
+class StubAsyncConnection:
+    """Async connection whose cursors record executed statements."""
+
+    def __init__(self):
+        self.executed = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def cursor(self):
+        return StubAsyncCursor(self)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class StubAsyncPool:
+    """Async pool that hands out a single StubAsyncConnection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def acquire(self):
+        return self.connection
+
+
+@pytest.fixture
+def connection():
+    """Create a stub async connection."""
+    return StubAsyncConnection()
+
+
+@pytest.fixture
+def service(connection):
+    """Create an AsyncOracleService backed by the stub connection."""
+    service = AsyncOracleService(OracleConfig())
+    service.pool = StubAsyncPool(connection)
+    return service
+
+
+def test_create_ach_file_inline(service, connection):
+    """Test that small contents are inserted in one statement."""
+    file_id = asyncio.run(service.create_ach_file(AchFileCreate(original_filename="a.ach", file_contents="short")))
+
+    assert file_id == 42
+    assert [sql for sql, _ in connection.executed] == [INSERT_ACH_FILE_SQL]
+    assert connection.executed[0][1]['file_contents'] == "short"
+    assert connection.commits == 1
+
+
+def test_create_ach_file_large_contents_staged(service, connection):
+    """Test that contents over the LOB threshold take the staged write."""
+    contents = "a" * (600 * 1024)
+
+    file_id = asyncio.run(service.create_ach_file(AchFileCreate(original_filename="a.ach", file_contents=contents)))
+
+    assert file_id == 42
+    assert [sql for sql, _ in connection.executed] == [
+        INSERT_ACH_FILE_EMPTY_CLOB_SQL,
+        INSERT_ACH_FILE_STAGING_SQL,
+        APPEND_STAGED_FILE_CONTENTS_PLSQL,
+    ]
+    assert 'file_contents' not in connection.executed[0][1]
+    assert "".join(row['frag'] for row in connection.executed[1][1]) == contents
+    assert connection.commits == 1
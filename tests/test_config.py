@@ -1,7 +1,9 @@
 """Tests for configuration management."""
 
 import pytest
+from pydantic import ValidationError
 from src.obs_sftp_file_processor.config import SFTPConfig, AppConfig
+from src.obs_sftp_file_processor.oracle_config import OracleConfig
 
 
 def test_sftp_config_defaults():
@@ -22,3 +24,10 @@ def test_app_config():
     assert config.debug is False
     assert config.log_level == "INFO"
     assert isinstance(config.sftp, SFTPConfig)
+
+
+def test_oracle_config_rejects_invalid_schema():
+    """Test that the Oracle schema must be a plain identifier."""
+    assert OracleConfig(schema="ACHOWNER").db_schema == "ACHOWNER"
+    with pytest.raises(ValidationError):
+        OracleConfig(schema="ACHOWNER.X; DROP TABLE ACH_FILES")
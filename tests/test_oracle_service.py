@@ -0,0 +1,815 @@
+"""Tests for the Oracle service's in-process caches and SQL helpers."""
+
+from datetime import datetime
+
+import re
+
+import bcrypt
+import oracledb
+import pytest
+from src.obs_sftp_file_processor import oracle_service as oracle_service_module
+from src.obs_sftp_file_processor.api_users_models import ApiUserUpdate
+from src.obs_sftp_file_processor.oracle_common import (
+    APPEND_STAGED_FILE_CONTENTS_PLSQL,
+    INSERT_ACH_FILE_EMPTY_CLOB_SQL,
+    INSERT_ACH_FILE_SQL,
+    INSERT_ACH_FILE_STAGING_SQL,
+    STAGING_BATCH_ROWS,
+    STAGING_FRAGMENT_CHARS,
+    STAGING_FRAGMENT_CHARS_MULTIBYTE,
+    needs_lob,
+    staging_batches,
+)
+from src.obs_sftp_file_processor.oracle_config import OracleConfig
+from src.obs_sftp_file_processor.oracle_models import AchFileCreate, AchFileUpdate
+from src.obs_sftp_file_processor.oracle_service import (
+    _ACH_ACCOUNT_SWAP_WHERE_CLAUSES,
+    _ACH_ADDENDA_INPUT_SIZES,
+    _ACH_BATCH_CONTROL_INPUT_SIZES,
+    _ACH_BATCH_HEADER_INPUT_SIZES,
+    _ACH_ENTRY_DETAIL_INPUT_SIZES,
+    _ACH_FILE_CONTROL_INPUT_SIZES,
+    _ACH_FILE_HEADER_INPUT_SIZES,
+    _FI_HOLIDAY_WHERE_CLAUSES,
+    _INSERT_ACH_ADDENDA_SQL,
+    _INSERT_ACH_BATCH_CONTROL_SQL,
+    _INSERT_ACH_BATCH_HEADER_SQL,
+    _INSERT_ACH_ENTRY_DETAIL_SQL,
+    _INSERT_ACH_FILE_CONTROL_SQL,
+    _INSERT_ACH_FILE_HEADER_SQL,
+    OracleService,
+    _ach_account_swap_filter_params,
+    _ach_addenda_params,
+    _ach_batch_control_params,
+    _ach_batch_header_params,
+    _ach_entry_detail_params,
+    _ach_file_control_params,
+    _ach_file_header_params,
+    _fi_holiday_filter_params,
+    _insert_ach_records,
+)
+
+
+class StubCursor:
+    """Cursor that records executed statements and returns queued rows."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 1
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.outputtypehandler = None
+        self.rowfactory = None
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql, params=None):
+        self.connection.executed.append((sql, params))
+        self._rows = list(self.connection.results.pop(0)) if self.connection.results else []
+
+    def executemany(self, sql, params):
+        self.connection.executed.append((sql, params))
+
+    def var(self, typ, arraysize=1):
+        return self.connection.new_var(arraysize)
+
+    def setinputsizes(self, *args, **kwargs):
+        self.connection.input_sizes.append((args, kwargs))
+
+    def _make(self, row):
+        return self.rowfactory(row) if self.rowfactory else row
+
+    def fetchone(self):
+        return self._make(self._rows.pop(0)) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return [self._make(row) for row in rows]
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+
+class StubConnection:
+    """Connection whose cursors return one queued result set per execute."""
+
+    def __init__(self):
+        self.executed = []
+        self.results = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.input_sizes = []
+        self.next_id = 100
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def cursor(self):
+        return StubCursor(self)
+
+    def gettype(self, name):
+        return StubCollectionType()
+
+    def new_var(self, arraysize):
+        var = StubVar(range(self.next_id, self.next_id + arraysize))
+        self.next_id += arraysize
+        return var
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class StubVar:
+    """Out bind whose row i returns the i-th generated id."""
+
+    def __init__(self, ids):
+        self.ids = list(ids)
+
+    def getvalue(self, position=0):
+        return [self.ids[position]]
+
+
+class StubCollectionType:
+    """Collection type whose objects are the plain element lists."""
+
+    def newobject(self, elements):
+        return list(elements)
+
+
+class StubClock:
+    """Replacement for the time module with a settable monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class StubPool:
+    """Pool that hands out a single StubConnection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.acquired = 0
+
+    def acquire(self):
+        self.acquired += 1
+        return self.connection
+
+
+class RecordStub:
+    """ACH record whose every field returns its own name."""
+
+    def __getattr__(self, name):
+        return name
+
+
+@pytest.fixture
+def connection():
+    """Create a stub connection."""
+    return StubConnection()
+
+
+@pytest.fixture
+def service(connection):
+    """Create an OracleService backed by the stub connection."""
+    service = OracleService(OracleConfig())
+    service.pool = StubPool(connection)
+    return service
+
+
+@pytest.fixture
+def file_cache_service(connection):
+    """Create an OracleService with the get_ach_file cache enabled."""
+    service = OracleService(OracleConfig(file_cache_ttl=30))
+    service.pool = StubPool(connection)
+    return service
+
+
+@pytest.fixture
+def swap_service(connection):
+    """Create an OracleService with the swap lookup cache enabled."""
+    service = OracleService(OracleConfig(swap_cache_ttl=60))
+    service.pool = StubPool(connection)
+    return service
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the service's cache expiry from a stub clock."""
+    clock = StubClock()
+    monkeypatch.setattr(oracle_service_module, "time", clock)
+    return clock
+
+
+def ach_file_row(file_id, file_contents="contents"):
+    """Build a SELECT_ACH_FILE_SQL row."""
+    return (
+        file_id, f"file{file_id}.ach", "Pending", file_contents, "user", datetime(2024, 1, 1),
+        None, None, None, None, None, None, None, len(file_contents)
+    )
+
+
+def summary_row(file_id):
+    """Build a SELECT_ACH_FILES_SQL row."""
+    return (
+        file_id, f"file{file_id}.ach", "Pending", "user", datetime(2024, 1, 1),
+        None, None, None, None, None, None, None
+    )
+
+
+def swap_row(swap_id, account, swap_account):
+    """Build a swap lookup row."""
+    return (swap_id, account, swap_account, "memo")
+
+
+@pytest.fixture
+def password_hash():
+    """Hash of the test password, with a low cost factor to keep the tests fast."""
+    return bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode('ascii')
+
+
+@pytest.fixture
+def checkpw_calls(monkeypatch):
+    """Count bcrypt.checkpw calls made by the service."""
+    calls = []
+    checkpw = bcrypt.checkpw
+
+    def counting_checkpw(password, hashed):
+        calls.append(password)
+        return checkpw(password, hashed)
+
+    monkeypatch.setattr(oracle_service_module.bcrypt, "checkpw", counting_checkpw)
+    return calls
+
+
+def test_authenticate_user_cache_skips_bcrypt(service, connection, password_hash, checkpw_calls):
+    """Test that a repeated login skips bcrypt but still reads the user."""
+    connection.results = [[(password_hash, 1, 1)], [(password_hash, 0, 1)]]
+
+    assert service.authenticate_user("user@example.com", "secret") == {'authenticated': True, 'is_admin': True}
+    assert service.authenticate_user("USER@example.com", "secret") == {'authenticated': True, 'is_admin': False}
+    assert len(checkpw_calls) == 1
+    assert len(connection.executed) == 2
+
+
+def test_authenticate_user_cache_rechecks_is_active(service, connection, password_hash):
+    """Test that a cached login is refused once the user is inactive."""
+    connection.results = [[(password_hash, 0, 1)], [(password_hash, 0, 0)]]
+
+    assert service.authenticate_user("user@example.com", "secret")['authenticated'] is True
+    assert service.authenticate_user("user@example.com", "secret")['authenticated'] is False
+
+
+def test_authenticate_user_cache_rechecks_changed_hash(service, connection, password_hash, checkpw_calls):
+    """Test that a cached login is verified again when the stored hash changes."""
+    other_hash = bcrypt.hashpw(b"changed", bcrypt.gensalt(rounds=4)).decode('ascii')
+    connection.results = [[(password_hash, 0, 1)], [(other_hash, 0, 1)]]
+
+    assert service.authenticate_user("user@example.com", "secret")['authenticated'] is True
+    assert service.authenticate_user("user@example.com", "secret")['authenticated'] is False
+    assert len(checkpw_calls) == 2
+
+
+def test_authenticate_user_cache_keeps_no_password_hash(service, connection, password_hash):
+    """Test that the login cache holds an HMAC of the stored hash, not the hash."""
+    connection.results = [[(password_hash, 0, 1)]]
+
+    service.authenticate_user("user@example.com", "secret")
+
+    (_, cached_digest), = service._auth_cache.values()
+    assert isinstance(cached_digest, bytes)
+    assert password_hash.encode('ascii') not in cached_digest
+
+
+def test_authenticate_user_wrong_password_not_cached(service, connection, password_hash):
+    """Test that failed logins are not cached."""
+    connection.results = [[(password_hash, 0, 1)]]
+
+    assert service.authenticate_user("user@example.com", "wrong")['authenticated'] is False
+    assert not service._auth_cache
+
+
+def test_update_api_user_clears_auth_cache(service, connection, password_hash):
+    """Test that update_api_user clears cached logins."""
+    connection.results = [[(password_hash, 0, 1)]]
+    service.authenticate_user("user@example.com", "secret")
+    assert service._auth_cache
+
+    assert service.update_api_user(1, ApiUserUpdate(is_active=0)) is True
+    assert not service._auth_cache
+
+
+def test_delete_api_user_clears_auth_cache(service, connection, password_hash):
+    """Test that delete_api_user clears cached logins."""
+    connection.results = [[(password_hash, 0, 1)]]
+    service.authenticate_user("user@example.com", "secret")
+    assert service._auth_cache
+
+    assert service.delete_api_user(1) is True
+    assert not service._auth_cache
+
+
+def test_get_ach_file_cache_returns_copies(file_cache_service, connection, clock):
+    """Test that cached records are served as copies without a query."""
+    connection.results = [[ach_file_row(1)]]
+
+    first = file_cache_service.get_ach_file(1)
+    first.processing_status = "Changed"
+    second = file_cache_service.get_ach_file(1)
+
+    assert second.processing_status == "Pending"
+    assert second is not first
+    assert len(connection.executed) == 1
+    assert file_cache_service.get_ach_file(1, include_contents=False).file_contents is None
+    assert len(connection.executed) == 1
+
+
+def test_get_ach_file_cache_expires(file_cache_service, connection, clock):
+    """Test that cached records are queried again after file_cache_ttl."""
+    connection.results = [[ach_file_row(1)], [ach_file_row(1, "newer")]]
+
+    file_cache_service.get_ach_file(1)
+    clock.now += file_cache_service.config.file_cache_ttl
+
+    assert file_cache_service.get_ach_file(1).file_contents == "newer"
+    assert len(connection.executed) == 2
+
+
+def test_get_ach_file_cache_evicts_least_recently_used(connection, clock):
+    """Test that the cache keeps at most file_cache_size records."""
+    service = OracleService(OracleConfig(file_cache_ttl=30, file_cache_size=2))
+    service.pool = StubPool(connection)
+    connection.results = [[ach_file_row(1)], [ach_file_row(2)], [ach_file_row(3)]]
+
+    service.get_ach_file(1)
+    service.get_ach_file(2)
+    service.get_ach_file(1)
+    service.get_ach_file(3)
+
+    assert list(service._ach_file_cache) == [1, 3]
+
+
+def test_get_ach_file_cache_off_by_default(service, connection, clock):
+    """Test that the get_ach_file cache is opt-in."""
+    connection.results = [[ach_file_row(1)], [ach_file_row(1)]]
+
+    service.get_ach_file(1)
+    service.get_ach_file(1)
+
+    assert len(connection.executed) == 2
+
+
+def test_get_ach_file_cache_skips_large_contents(file_cache_service, connection, clock, monkeypatch):
+    """Test that records with large contents are not cached."""
+    monkeypatch.setattr(oracle_service_module, "_MAX_CACHED_FILE_CONTENTS", 5)
+    connection.results = [[ach_file_row(1, "123456")], [ach_file_row(2, "12345")]]
+
+    file_cache_service.get_ach_file(1)
+    file_cache_service.get_ach_file(2)
+
+    assert list(file_cache_service._ach_file_cache) == [2]
+
+
+def test_update_ach_file_invalidates_cache(file_cache_service, connection, clock):
+    """Test that update_ach_file drops the cached record."""
+    connection.results = [[ach_file_row(1)]]
+    file_cache_service.get_ach_file(1)
+
+    assert file_cache_service.update_ach_file(1, AchFileUpdate(processing_status="Processed")) is True
+    assert 1 not in file_cache_service._ach_file_cache
+
+
+def test_delete_ach_files_invalidates_cache(file_cache_service, connection, clock):
+    """Test that delete_ach_files drops the cached records."""
+    connection.results = [[ach_file_row(1)]]
+    file_cache_service.get_ach_file(1)
+
+    file_cache_service.delete_ach_files([1])
+
+    assert 1 not in file_cache_service._ach_file_cache
+
+
+def test_get_ach_files_by_ids_bypasses_cache(file_cache_service, connection, clock):
+    """Test that bulk reads query every id and leave the cache alone."""
+    connection.results = [[ach_file_row(2)], [ach_file_row(3), ach_file_row(1, "newer"), ach_file_row(2)]]
+    file_cache_service.get_ach_file(2)
+
+    records = file_cache_service.get_ach_files_by_ids([1, 2, 3, 4, 1])
+
+    assert [record.file_id for record in records] == [1, 2, 3, 1]
+    assert records[0].file_contents == "newer"
+    assert connection.executed[-1][1]['file_ids'] == [1, 2, 3, 4]
+    assert list(file_cache_service._ach_file_cache) == [2]
+
+
+def test_get_ach_files_count_cached(service, connection, clock):
+    """Test that the count is cached for count_cache_ttl seconds."""
+    connection.results = [[(5,)], [(6,)]]
+
+    assert service.get_ach_files_count() == 5
+    assert service.get_ach_files_count() == 5
+    clock.now += service.config.count_cache_ttl
+    assert service.get_ach_files_count() == 6
+
+
+def test_get_ach_files_count_cache_disabled(connection, clock):
+    """Test that count_cache_ttl=0 disables the count cache."""
+    service = OracleService(OracleConfig(count_cache_ttl=0))
+    service.pool = StubPool(connection)
+    connection.results = [[(5,)], [(6,)]]
+
+    service.get_ach_files_count()
+
+    assert service.get_ach_files_count() == 6
+
+
+def test_delete_ach_files_resets_count(service, connection, clock):
+    """Test that delete_ach_files drops the cached count."""
+    connection.results = [[(5,)], [(4,)]]
+    service.get_ach_files_count()
+
+    service.delete_ach_files([1])
+
+    assert service.get_ach_files_count() == 4
+
+
+def test_needs_lob_counts_utf8_bytes():
+    """Test that needs_lob measures multibyte text in UTF-8 bytes."""
+    assert needs_lob(None) is False
+    assert needs_lob("a" * 10, threshold=10) is False
+    assert needs_lob("a" * 11, threshold=10) is True
+    assert needs_lob("\u00e9" * 5, threshold=10) is False
+    assert needs_lob("\u00e9" * 6, threshold=10) is True
+    assert needs_lob("\u20ac" * 4, threshold=10) is True
+
+
+def test_staging_batches_ascii():
+    """Test that ASCII text is split into STAGING_FRAGMENT_CHARS fragments."""
+    text = "a" * (STAGING_FRAGMENT_CHARS * 2 + 1)
+
+    batches = list(staging_batches(7, text))
+
+    assert len(batches) == 1
+    assert [len(row['frag']) for row in batches[0]] == [STAGING_FRAGMENT_CHARS, STAGING_FRAGMENT_CHARS, 1]
+    assert [row['seq'] for row in batches[0]] == [0, 1, 2]
+    assert all(row['file_id'] == 7 for row in batches[0])
+
+
+def test_staging_batches_multibyte_fits_varchar2():
+    """Test that multibyte fragments stay within a 4000-byte VARCHAR2."""
+    text = "\U0001F600" * (STAGING_FRAGMENT_CHARS_MULTIBYTE + 1)
+
+    rows = [row for batch in staging_batches(1, text) for row in batch]
+
+    assert [len(row['frag']) for row in rows] == [STAGING_FRAGMENT_CHARS_MULTIBYTE, 1]
+    assert all(len(row['frag'].encode('utf-8')) <= 4000 for row in rows)
+    assert "".join(row['frag'] for row in rows) == text
+
+
+def test_staging_batches_splits_rows():
+    """Test that fragments are yielded STAGING_BATCH_ROWS at a time."""
+    text = "a" * (STAGING_FRAGMENT_CHARS * (STAGING_BATCH_ROWS + 1))
+
+    batches = list(staging_batches(1, text))
+
+    assert [len(batch) for batch in batches] == [STAGING_BATCH_ROWS, 1]
+    assert batches[1][0]['seq'] == STAGING_BATCH_ROWS
+
+
+def test_list_ach_files_page_has_more(service, connection):
+    """Test that has_more comes from fetching limit + 1 rows."""
+    connection.results = [[summary_row(3), summary_row(2), summary_row(1)]]
+
+    files, has_more = service.list_ach_files_page(limit=2)
+
+    assert [f.file_id for f in files] == [3, 2]
+    assert has_more is True
+    assert connection.executed[0][1]['limit'] == 3
+
+
+def test_list_ach_files_page_last_page(service, connection):
+    """Test that has_more is False when no extra row comes back."""
+    connection.results = [[summary_row(2), summary_row(1)]]
+
+    files, has_more = service.list_ach_files_page(limit=2)
+
+    assert len(files) == 2
+    assert has_more is False
+
+
+def test_fi_holiday_filter_params():
+    """Test that the year filter binds a half-open date range."""
+    assert _fi_holiday_filter_params(None) == {}
+    assert _fi_holiday_filter_params(2024) == {
+        'year_start': datetime(2024, 1, 1),
+        'year_end': datetime(2025, 1, 1),
+    }
+    assert frozenset(_fi_holiday_filter_params(2024)) in _FI_HOLIDAY_WHERE_CLAUSES
+    assert frozenset(_fi_holiday_filter_params(None)) in _FI_HOLIDAY_WHERE_CLAUSES
+
+
+def test_get_fi_holidays_with_total_selects_statement(service, connection):
+    """Test that the year filter selects the date range statement."""
+    connection.results = [[]]
+
+    service.get_fi_holidays_with_total(year=2024)
+
+    sql, params = connection.executed[0]
+    assert sql == service._fi_holiday_select_with_total_sql[frozenset({'year_start', 'year_end'})]
+    assert "HOLIDAY_DATE >= :year_start AND HOLIDAY_DATE < :year_end" in sql
+
+
+def test_ach_account_swap_where_clauses_cover_every_filter_set():
+    """Test that every combination of swap filters has a WHERE clause."""
+    assert len(_ACH_ACCOUNT_SWAP_WHERE_CLAUSES) == 8
+    assert _ACH_ACCOUNT_SWAP_WHERE_CLAUSES[frozenset()] == "1=1"
+    assert _ACH_ACCOUNT_SWAP_WHERE_CLAUSES[frozenset({'swap_account_number', 'swap_memo'})] == (
+        "SWAP_ACCOUNT_NUMBER = :swap_account_number AND UPPER(SWAP_MEMO) LIKE :swap_memo"
+    )
+
+
+def test_ach_account_swap_filter_params():
+    """Test that only supplied swap filters are bound and the memo is upper-cased."""
+    assert _ach_account_swap_filter_params(None, None, None) == {}
+    assert _ach_account_swap_filter_params("111", None, "rent") == {
+        'original_dfi_account_number': "111",
+        'swap_memo': "%RENT%",
+    }
+    for params in (
+        _ach_account_swap_filter_params("111", "222", "x"),
+        _ach_account_swap_filter_params(None, "222", None),
+    ):
+        assert frozenset(params) in _ACH_ACCOUNT_SWAP_WHERE_CLAUSES
+
+
+def test_get_ach_account_swaps_with_total_selects_statement(service, connection):
+    """Test that the statement for the supplied filters is executed."""
+    connection.results = [[]]
+
+    service.get_ach_account_swaps_with_total(swap_memo="rent")
+
+    sql, params = connection.executed[0]
+    assert sql == service._ach_account_swap_select_with_total_sql[frozenset({'swap_memo'})]
+    assert params == {'swap_memo': "%RENT%", 'offset': 0, 'limit': 100}
+
+
+def test_get_swap_by_original_account_caches_misses(swap_service, connection, clock):
+    """Test that accounts without a swap are cached too."""
+    connection.results = [[]]
+
+    assert swap_service.get_swap_by_original_account("111") is None
+    assert swap_service.get_swap_by_original_account("111") is None
+    assert len(connection.executed) == 1
+
+
+def test_delete_ach_account_swap_clears_swap_cache(swap_service, connection, clock):
+    """Test that swap changes clear the lookup cache."""
+    connection.results = [[swap_row(1, "111", "999")]]
+    swap_service.get_swap_by_original_account("111")
+
+    swap_service.delete_ach_account_swap(1)
+
+    assert not swap_service._swap_cache
+
+
+def test_get_swap_by_original_account_cache_off_by_default(service, connection, clock):
+    """Test that the swap lookup cache is opt-in."""
+    connection.results = [[swap_row(1, "111", "999")], [swap_row(2, "111", "888")]]
+
+    service.get_swap_by_original_account("111")
+
+    assert service.get_swap_by_original_account("111").swap_account_number == "888"
+
+
+def test_update_ach_entry_detail_with_swap_reads_table(swap_service, connection, clock):
+    """Test that applying a swap ignores the lookup cache."""
+    connection.results = [[swap_row(1, "111", "999")], [swap_row(2, "111", "888")], []]
+    swap_service.get_swap_by_original_account("111")
+
+    assert swap_service.update_ach_entry_detail_with_swap(5, "111") is True
+    assert connection.executed[-1][1] == {'entry_detail_id': 5, 'swap_account_number': "888"}
+
+
+def test_get_swaps_by_original_accounts_first_row_wins(service, connection, clock):
+    """Test that the newest swap per account is kept and missing accounts are left out."""
+    connection.results = [[
+        swap_row(2, "111", "newest"),
+        swap_row(1, "111", "older"),
+        swap_row(3, "222", "only"),
+    ]]
+
+    swaps = service.get_swaps_by_original_accounts(["111", "222", "333", "111"])
+
+    assert {account: swap.swap_account_number for account, swap in swaps.items()} == {
+        "111": "newest",
+        "222": "only",
+    }
+    assert "ORDER BY ORIGINAL_DFI_ACCOUNT_NUMBER, CREATED_DATE DESC" in connection.executed[0][0]
+
+
+def test_get_swaps_by_original_accounts_uses_cache(swap_service, connection, clock):
+    """Test that cached accounts, including misses, are not queried again."""
+    connection.results = [[swap_row(1, "111", "999")], [swap_row(2, "333", "888")]]
+    swap_service.get_swaps_by_original_accounts(["111", "222"])
+
+    swaps = swap_service.get_swaps_by_original_accounts(["111", "222", "333"])
+
+    assert sorted(swaps) == ["111", "333"]
+    assert list(connection.executed[-1][1].values()) == ["333"]
+    assert swap_service.get_swap_by_original_account("222") is None
+    assert len(connection.executed) == 2
+
+
+def test_get_swaps_by_original_accounts_batches(service, connection, clock, monkeypatch):
+    """Test that accounts are queried in IN lists of _SWAP_LOOKUP_BATCH_SIZE."""
+    monkeypatch.setattr(oracle_service_module, "_SWAP_LOOKUP_BATCH_SIZE", 2)
+    connection.results = [[swap_row(1, "111", "999")], [swap_row(3, "333", "777")]]
+
+    swaps = service.get_swaps_by_original_accounts(["111", "222", "333"])
+
+    assert sorted(swaps) == ["111", "333"]
+    assert [list(params.values()) for _, params in connection.executed] == [["111", "222"], ["333"]]
+
+
+def test_batch_reuses_one_connection(service, connection):
+    """Test that calls inside batch() share one acquired connection."""
+    connection.results = [[(5,)], [summary_row(1)]]
+
+    with service.batch():
+        with service.batch():
+            service.get_ach_files_count()
+        service.list_ach_files(limit=1)
+        with service.get_connection() as conn:
+            assert conn is connection
+
+    assert service.pool.acquired == 1
+    assert service._batch_local.conn is None
+
+
+def test_batch_commits_each_call(service, connection):
+    """Test that calls commit on their own, so batch() is not a transaction."""
+    with pytest.raises(RuntimeError):
+        with service.batch():
+            service.delete_ach_files([1])
+            raise RuntimeError("later call failed")
+
+    assert connection.commits == 1
+    assert connection.rollbacks == 1
+    assert service._batch_local.conn is None
+
+
+@pytest.mark.parametrize("sql, input_sizes, returning", [
+    (_INSERT_ACH_FILE_HEADER_SQL, _ACH_FILE_HEADER_INPUT_SIZES, 'file_header_id'),
+    (_INSERT_ACH_BATCH_HEADER_SQL, _ACH_BATCH_HEADER_INPUT_SIZES, 'batch_header_id'),
+    (_INSERT_ACH_ENTRY_DETAIL_SQL, _ACH_ENTRY_DETAIL_INPUT_SIZES, 'entry_detail_id'),
+    (_INSERT_ACH_ADDENDA_SQL, _ACH_ADDENDA_INPUT_SIZES, 'addenda_id'),
+    (_INSERT_ACH_BATCH_CONTROL_SQL, _ACH_BATCH_CONTROL_INPUT_SIZES, 'batch_control_id'),
+    (_INSERT_ACH_FILE_CONTROL_SQL, _ACH_FILE_CONTROL_INPUT_SIZES, 'file_control_id'),
+])
+def test_ach_record_insert_placeholders_match_input_sizes(sql, input_sizes, returning):
+    """Test that positional binds line up with the input sizes and RETURNING bind."""
+    assert re.findall(r':(\w+)', sql) == list(input_sizes) + [returning]
+
+
+@pytest.mark.parametrize("params_builder, input_sizes", [
+    (_ach_file_header_params, _ACH_FILE_HEADER_INPUT_SIZES),
+    (_ach_batch_header_params, _ACH_BATCH_HEADER_INPUT_SIZES),
+    (_ach_entry_detail_params, _ACH_ENTRY_DETAIL_INPUT_SIZES),
+    (_ach_addenda_params, _ACH_ADDENDA_INPUT_SIZES),
+    (_ach_batch_control_params, _ACH_BATCH_CONTROL_INPUT_SIZES),
+    (_ach_file_control_params, _ACH_FILE_CONTROL_INPUT_SIZES),
+])
+def test_ach_record_params_follow_placeholder_order(params_builder, input_sizes):
+    """Test that each params tuple holds the record field for every placeholder, in order."""
+    record = RecordStub()
+
+    params = params_builder(7, record)
+
+    # The addenda's entry_detail_id is passed separately and defaults to None
+    assert params[0] == 7
+    assert [value for value in params[1:] if value is not None] == [
+        name for name in list(input_sizes)[1:] if name != 'entry_detail_id'
+    ]
+
+
+def test_insert_ach_records_returns_ids_in_row_order(connection):
+    """Test that the RETURNING ids come back per row, with the out bind sized last."""
+    cursor = connection.cursor()
+    rows = [(7, "a"), (7, "b"), (7, "c")]
+
+    ids = _insert_ach_records(cursor, _INSERT_ACH_ADDENDA_SQL, rows, _ACH_ADDENDA_INPUT_SIZES)
+
+    assert ids == [100, 101, 102]
+    assert connection.executed == [(_INSERT_ACH_ADDENDA_SQL, rows)]
+    (args, kwargs), = connection.input_sizes
+    assert list(args[:-1]) == list(_ACH_ADDENDA_INPUT_SIZES.values())
+    assert args[-1].ids == ids
+    assert kwargs == {}
+
+
+def ach_line(record_type, tail=""):
+    """Build a 94-character ACH record ending in tail."""
+    return record_type + " " * (93 - len(tail)) + tail
+
+
+def test_parse_and_insert_ach_records_one_executemany_per_type(service, connection):
+    """Test that each record type is inserted once and addendas link to their entries."""
+    contents = "\n".join([
+        ach_line("1"),
+        ach_line("5", "0000001"),
+        ach_line("6", "000000000000001"),
+        ach_line("6", "000000000000002"),
+        ach_line("7", "0000002"),
+        ach_line("8", "0000001"),
+        ach_line("9"),
+    ])
+
+    counts = service.parse_and_insert_ach_records(7, contents)
+
+    assert counts == {
+        'file_headers': 1,
+        'batch_headers': 1,
+        'entry_details': 2,
+        'addendas': 1,
+        'batch_controls': 1,
+        'file_controls': 1,
+    }
+    assert [sql for sql, _ in connection.executed] == [
+        _INSERT_ACH_FILE_HEADER_SQL,
+        _INSERT_ACH_BATCH_HEADER_SQL,
+        _INSERT_ACH_ENTRY_DETAIL_SQL,
+        _INSERT_ACH_ADDENDA_SQL,
+        _INSERT_ACH_BATCH_CONTROL_SQL,
+        _INSERT_ACH_FILE_CONTROL_SQL,
+    ]
+    # Ids 100 and 101 go to the headers, 102 and 103 to the entry details
+    (addenda_row,) = connection.executed[3][1]
+    assert addenda_row[:2] == (7, 103)
+    assert connection.commits == 1
+
+
+def test_parse_and_insert_ach_records_rolls_back_on_failure(service, connection, monkeypatch):
+    """Test that a failed insert rolls back the whole file."""
+    def failing_executemany(cursor, sql, rows):
+        if sql == _INSERT_ACH_ENTRY_DETAIL_SQL:
+            raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(StubCursor, "executemany", failing_executemany)
+
+    with pytest.raises(RuntimeError):
+        service.parse_and_insert_ach_records(7, "\n".join([ach_line("1"), ach_line("6", "000000000000001")]))
+
+    assert connection.commits == 0
+    assert connection.rollbacks == 1
+
+
+def test_create_ach_files_groups_by_contents_bind(service, connection):
+    """Test that rows are batched by FILE_CONTENTS bind type and ids follow the input order."""
+    ach_files = [
+        AchFileCreate(original_filename="large.ach", file_contents="a" * (600 * 1024)),
+        AchFileCreate(original_filename="short1.ach", file_contents="short"),
+        AchFileCreate(original_filename="clob.ach", file_contents="a" * 40000),
+        AchFileCreate(original_filename="short2.ach", file_contents=None),
+    ]
+
+    file_ids = service.create_ach_files(ach_files)
+
+    # Short rows get ids 100-101, the CLOB row 102 and the staged row 103
+    assert file_ids == [103, 100, 102, 101]
+    assert [sql for sql, _ in connection.executed] == [
+        INSERT_ACH_FILE_SQL,
+        INSERT_ACH_FILE_SQL,
+        INSERT_ACH_FILE_EMPTY_CLOB_SQL,
+        INSERT_ACH_FILE_STAGING_SQL,
+        APPEND_STAGED_FILE_CONTENTS_PLSQL,
+    ]
+    assert [row['original_filename'] for row in connection.executed[0][1]] == ["short1.ach", "short2.ach"]
+    assert [row['original_filename'] for row in connection.executed[1][1]] == ["clob.ach"]
+    assert [kwargs['file_contents'] for _, kwargs in connection.input_sizes[:2]] == [
+        oracledb.DB_TYPE_VARCHAR,
+        oracledb.DB_TYPE_CLOB,
+    ]
+    assert connection.commits == 1
+
+
+def test_create_ach_files_splits_batches(service, connection):
+    """Test that each executemany sends at most batch_size rows."""
+    ach_files = [AchFileCreate(original_filename=f"file{i}.ach", file_contents="x") for i in range(3)]
+
+    file_ids = service.create_ach_files(ach_files, batch_size=2)
+
+    assert file_ids == [100, 101, 102]
+    assert [len(rows) for _, rows in connection.executed] == [2, 1]